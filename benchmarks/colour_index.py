@@ -0,0 +1,132 @@
+"""Colour name resolution: the previous per-colour searches against
+:class:`utilities.colour_index.ColourIndex`.
+
+- RGB to name over ``extra/ryanzec_colours.json``: the rapidfuzz match of
+  the hex code the colour commands used, a nearest neighbour in Python,
+  and the index, for one colour and for a whole image.
+- The nearest easter palette colour: ``sorted()`` by RGB distance, as
+  ``PfpEffects.closest`` did, against the RGB index, which must agree.
+
+Run from the repository root::
+
+    python -m benchmarks.colour_index
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import rapidfuzz
+
+from utilities.colour_index import ColourIndex, rgb_to_lab
+
+NAMES = "extra/ryanzec_colours.json"
+QUERIES = 2000
+
+RGB = Tuple[int, int, int]
+
+# `easter_like_colours` of cogs/fun/_effects.py, importing the cog needs
+# the bot's environment
+EASTER = [
+    (255, 247, 0),
+    (255, 255, 224),
+    (0, 255, 127),
+    (189, 252, 201),
+    (255, 192, 203),
+    (255, 160, 122),
+    (181, 115, 220),
+    (221, 160, 221),
+    (200, 162, 200),
+    (238, 130, 238),
+    (135, 206, 235),
+    (0, 204, 204),
+    (64, 224, 208),
+]
+
+
+def fuzzy_name(mapping: Dict[str, str], rgb: RGB) -> Optional[str]:
+    # `Fun._rgb_to_name` before the index
+    query = "#" + "".join(hex(value)[2:].zfill(2) for value in rgb).upper()
+    try:
+        match, _, _ = rapidfuzz.process.extractOne(
+            query=query, choices=mapping.values(), score_cutoff=80
+        )
+        return [name for name, code in mapping.items() if code == match][0]
+    except TypeError:
+        return None
+
+
+def python_nearest(names: List[str], labs: List[Tuple[float, ...]], rgb: RGB) -> str:
+    lab = rgb_to_lab(rgb).tolist()
+    distances = [sum((a - b) ** 2 for a, b in zip(lab, point)) for point in labs]
+    return names[distances.index(min(distances))]
+
+
+def sorted_closest(rgb: RGB) -> RGB:
+    # `PfpEffects.closest` before the index, without the averaging
+    r, g, b = rgb
+    return sorted(
+        EASTER,
+        key=lambda c: (r - c[0]) ** 2 + (g - c[1]) ** 2 + (b - c[2]) ** 2,
+    )[0]
+
+
+def per_call(func: Callable, queries: List[RGB]) -> Tuple[list, float]:
+    ini = perf_counter()
+    results = [func(query) for query in queries]
+    return results, (perf_counter() - ini) / len(queries)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    queries = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(QUERIES)]
+
+    with open(NAMES, encoding="utf-8") as f:
+        mapping = json.load(f)
+    mapping.pop("_", None)
+
+    ini = perf_counter()
+    index = ColourIndex.from_json(NAMES)
+    print(
+        f"index of {len(index)} colours built in {(perf_counter() - ini) * 1e3:.1f} ms"
+    )
+
+    fuzzy, fuzzy_time = per_call(lambda q: fuzzy_name(mapping, q), queries)
+    labs = [tuple(point) for point in index._points.tolist()]
+    brute, brute_time = per_call(
+        lambda q: python_nearest(index.names, labs, q), queries
+    )
+    nearest, index_time = per_call(index.nearest, queries)
+    unmatched = sum(name is None for name in fuzzy)
+    agree = sum(a == b for a, b in zip(brute, nearest))
+    print("rgb -> name, per colour")
+    print(
+        f"  rapidfuzz hex match   {fuzzy_time * 1e6:>8.1f} us  ({unmatched} unmatched)"
+    )
+    print(f"  python nearest        {brute_time * 1e6:>8.1f} us")
+    print(f"  ColourIndex.nearest   {index_time * 1e6:>8.1f} us  ({agree} agree)")
+
+    image = np.random.default_rng(0).integers(0, 256, (256, 256, 3), dtype=np.uint8)
+    ini = perf_counter()
+    index.nearest_indices(image)
+    print(f"  256x256 image at once {(perf_counter() - ini) * 1e3:>8.1f} ms")
+
+    easter = ColourIndex(
+        {str(i): colour for i, colour in enumerate(EASTER)}, space="rgb"
+    )
+    old, old_time = per_call(sorted_closest, queries)
+    new, new_time = per_call(easter.nearest_rgb, queries)
+    mismatches = sum(a != b for a, b in zip(old, new))
+    print("nearest easter colour, per colour")
+    print(f"  sorted()              {old_time * 1e6:>8.1f} us")
+    print(
+        f"  ColourIndex (rgb)     {new_time * 1e6:>8.1f} us  ({mismatches} mismatches)"
+    )
+
+
+if __name__ == "__main__":
+    main()
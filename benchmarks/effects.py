@@ -0,0 +1,167 @@
+"""Avatar effects: the previous per-pixel easterify, split and join
+mosaic and full size quantize of 8-bitify, against the NumPy versions of
+``cogs/fun/_effects.py``.
+
+The avatars are 1024x1024 RGBA, as after ``render_effect``: noise, where
+nearly every pixel is a different colour, and a gradient. Each effect
+must give the same image as before, the mosaic with the same random
+seed. Run from the repository root::
+
+    python -m benchmarks.effects
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+import random
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+BUNNY = "extra/easter/chocolate_bunny.png"
+
+
+def load_effects():
+    # importing `cogs.fun` needs the bot's environment
+    spec = importlib.util.spec_from_file_location("_effects", "cogs/fun/_effects.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def old_closest(palette: List[Tuple[int, int, int]], x: Tuple[int, int, int]):
+    r1, g1, b1 = x
+
+    def distance(point):
+        r2, g2, b2 = point
+        return (r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2
+
+    r2, g2, b2 = sorted(palette, key=distance)[0]
+    return (r1 + r2) // 2, (g1 + g2) // 2, (b1 + b2) // 2
+
+
+def old_easterify(palette, image: Image.Image) -> Image.Image:
+    overlay_image = Image.open(BUNNY)
+    alpha = image.getchannel("A").getdata()
+    image = image.convert("RGB")
+    image = ImageOps.posterize(image, 6)
+
+    data = image.getdata()
+    easterified = {x: old_closest(palette, x) for x in set(data)}
+    new_pixel_data = [
+        (*easterified[x], alpha[i]) if x in easterified else x
+        for i, x in enumerate(data)
+    ]
+
+    im = Image.new("RGBA", image.size)
+    im.putdata(new_pixel_data)
+    im.alpha_composite(
+        overlay_image,
+        (im.width - overlay_image.width, (im.height - overlay_image.height) // 2),
+    )
+    return im
+
+
+def old_mosaic(image: Image.Image, squares: int) -> Image.Image:
+    # `split_image` and `join_images`
+    width, height = image.size
+    xy = math.sqrt(squares)
+    x_frac, y_frac = width // xy, height // xy
+    left, top, right, bottom = 0, 0, x_frac, y_frac
+    images = []
+    for index in range(squares):
+        images.append(image.crop((left, top, right, bottom)))
+        if (index + 1) % xy == 0:
+            top += y_frac
+            bottom += y_frac
+            left, right = 0, x_frac
+        else:
+            left += x_frac
+            right += x_frac
+
+    random.shuffle(images)
+    single_width, single_height = images[0].size
+    multiplier = int(math.sqrt(len(images)))
+    new_image = Image.new(
+        "RGBA", (multiplier * single_width, multiplier * single_height), (250, 250, 250)
+    )
+    width_multiplier = height = 0
+    for index, piece in enumerate(images):
+        new_image.paste(piece, (single_width * width_multiplier, height))
+        width_multiplier += 1
+        if (index + 1) % multiplier == 0:
+            width_multiplier = 0
+            height += single_height
+    return new_image
+
+
+def old_eight_bitify(image: Image.Image) -> Image.Image:
+    image = image.resize((32, 32), resample=Image.NEAREST)
+    image = image.resize((1024, 1024), resample=Image.NEAREST)
+    return image.quantize()
+
+
+def avatars() -> dict:
+    rng = np.random.default_rng(1)
+    y, x = np.mgrid[0:1024, 0:1024]
+    gradient = np.stack([x // 4, y // 4, (x + y) // 8, np.full_like(x, 255)], -1)
+    return {
+        "noise": Image.fromarray(
+            rng.integers(0, 256, (1024, 1024, 4), dtype=np.uint8), "RGBA"
+        ),
+        "gradient": Image.fromarray(gradient.astype(np.uint8), "RGBA"),
+    }
+
+
+def timed(func: Callable, image: Image.Image, *args, seed: int = 0) -> tuple:
+    random.seed(seed)
+    ini = perf_counter()
+    result = func(image.copy(), *args)
+    return result, perf_counter() - ini
+
+
+def same(a: Image.Image, b: Image.Image) -> bool:
+    return (
+        a.mode == b.mode
+        and np.array_equal(np.asarray(a), np.asarray(b))
+        and a.getpalette() == b.getpalette()
+    )
+
+
+def main() -> None:
+    effects = load_effects()
+    new = effects.PfpEffects
+    palette = effects.easter_like_colours
+
+    ini = perf_counter()
+    effects.easter_lut()
+    print(f"easter LUT built in {(perf_counter() - ini) * 1e3:.0f} ms, once")
+
+    for kind, image in avatars().items():
+        print(kind)
+        cases = [
+            (
+                "easterify",
+                lambda im: old_easterify(palette, im),
+                new.easterify_effect,
+                (),
+            ),
+            ("8-bitify", old_eight_bitify, new.eight_bitify_effect, ()),
+        ]
+        cases += [
+            (f"mosaic {n}", old_mosaic, new.mosaic_effect, (n,)) for n in (16, 10000)
+        ]
+        for label, old_func, new_func, args in cases:
+            old, old_time = timed(old_func, image, *args)
+            result, new_time = timed(new_func, image, *args)
+            print(
+                f"  {label:<13} {old_time * 1e3:>8.1f} ms -> {new_time * 1e3:>6.1f} ms"
+                f"  {'same' if same(old, result) else 'DIFFERENT'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
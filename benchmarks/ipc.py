@@ -0,0 +1,102 @@
+"""IPC throughput over loopback: a :class:`discord.ext.ipc.Server` and a
+:class:`discord.ext.ipc.Client` in one process.
+
+Each endpoint is requested sequentially (one request in flight),
+pipelined (every request in flight at once on the connection) and in
+batches of 50 calls per frame. ``fast`` returns at once, ``slow`` awaits
+5 ms like an endpoint waiting on the API or the database. Run from the
+repository root::
+
+    python -m benchmarks.ipc
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+from discord.ext import ipc
+
+PORT = 8799
+SECRET = "benchmark"
+BATCH = 50
+REQUESTS = {"fast": 2000, "slow": 400}
+
+
+class Bot:
+    """What the server uses of the bot"""
+
+    cogs = {}
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+    def dispatch(self, event: str, *args) -> None:
+        print(event, *args)
+
+
+def make_server(loop: asyncio.AbstractEventLoop) -> ipc.Server:
+    server = ipc.Server(Bot(loop), port=PORT, secret_key=SECRET, do_multicast=False)
+
+    @server.route()
+    async def fast(data):
+        return {"guild": data.guild_id, "members": list(range(50))}
+
+    @server.route()
+    async def slow(data):
+        await asyncio.sleep(0.005)
+        return {"guild": data.guild_id}
+
+    return server
+
+
+async def bench(client: ipc.Client, endpoint: str, n: int) -> str:
+    ini = perf_counter()
+    for i in range(n):
+        await client.request(endpoint, guild_id=i)
+    sequential = n / (perf_counter() - ini)
+
+    ini = perf_counter()
+    responses = await asyncio.gather(
+        *(client.request(endpoint, guild_id=i) for i in range(n))
+    )
+    pipelined = n / (perf_counter() - ini)
+    assert [r["guild"] for r in responses] == list(range(n))
+
+    ini = perf_counter()
+    for start in range(0, n, BATCH):
+        await client.batch(
+            *((endpoint, {"guild_id": i}) for i in range(start, start + BATCH))
+        )
+    batched = n / (perf_counter() - ini)
+
+    return (
+        f"{endpoint:<5} sequential {sequential:>9,.0f} req/s"
+        f"  pipelined {pipelined:>9,.0f} req/s"
+        f"  batches of {BATCH} {batched:>9,.0f} req/s"
+    )
+
+
+async def run() -> None:
+    client = ipc.Client(port=PORT, secret_key=SECRET)
+    try:
+        # connects, and warms up both sides
+        await client.request("fast", guild_id=0)
+        for endpoint, n in REQUESTS.items():
+            print(await bench(client, endpoint, n))
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        make_server(loop).start()
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Prefix resolution: compiling the guild prefix on every message, as
+``Parrot.get_prefix`` did, against the
+:class:`utilities.config_cache.PrefixMatcher` the config cache keeps.
+
+Both sides read the config from a warm
+:class:`utilities.config_cache.GuildConfigCache`, for one guild and for
+1000 guilds with different prefixes. A third of the messages are
+commands. Both must resolve the same prefixes. Run from the repository
+root::
+
+    python -m benchmarks.prefix
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Callable, List
+
+from utilities.config_cache import GuildConfigCache
+
+CALLS = 200_000
+PREFIXES = ["$", "!", "?", ".", "p!", ">>", "parrot "]
+BOT = SimpleNamespace(user=SimpleNamespace(id=800780974274248764))
+
+
+# `commands.when_mentioned` and `commands.when_mentioned_or` of the library
+def when_mentioned(bot, msg) -> List[str]:
+    return [f"<@{bot.user.id}> ", f"<@!{bot.user.id}> "]
+
+
+def when_mentioned_or(*prefixes: str) -> Callable:
+    def inner(bot, msg):
+        r = list(prefixes)
+        r = when_mentioned(bot, msg) + r
+        return r
+
+    return inner
+
+
+async def old_get_prefix(cache: GuildConfigCache, message) -> List[str]:
+    data = await cache.fetch(message.guild.id)
+    prefix = data["prefix"]
+    comp = re.compile(f"^({re.escape(prefix)}).*", flags=re.I)
+    match = comp.match(message.content)
+    if match is not None:
+        prefix = match.group(1)
+    return when_mentioned_or(prefix)(BOT, message)
+
+
+async def new_get_prefix(cache: GuildConfigCache, message) -> List[str]:
+    matcher = await cache.prefix_matcher(message.guild.id)
+    if prefix := matcher.match(message.content):
+        prefixes = [prefix]
+    else:
+        prefixes = list(matcher.prefixes)
+    return when_mentioned(BOT, message) + prefixes
+
+
+def traffic(guilds: int) -> tuple:
+    rng = random.Random(guilds)
+    cache = GuildConfigCache(None)
+    prefixes = {}
+    for guild_id in range(guilds):
+        prefixes[guild_id] = cache[guild_id] = {
+            "_id": guild_id,
+            "prefix": rng.choice(PREFIXES),
+        }
+    messages = []
+    for _ in range(CALLS):
+        guild_id = rng.randrange(guilds)
+        if rng.random() < 1 / 3:
+            content = f"{prefixes[guild_id]['prefix']}rank {rng.randrange(100)}"
+        else:
+            content = f"just chatting about {rng.randrange(10_000)} things"
+        messages.append(
+            SimpleNamespace(guild=SimpleNamespace(id=guild_id), content=content)
+        )
+    return cache, messages
+
+
+async def calls_per_second(get_prefix: Callable, cache, messages) -> tuple:
+    ini = perf_counter()
+    results = [await get_prefix(cache, message) for message in messages]
+    return results, len(messages) / (perf_counter() - ini)
+
+
+async def run() -> None:
+    for guilds in (1, 1000):
+        cache, messages = traffic(guilds)
+        old, old_rate = await calls_per_second(old_get_prefix, cache, messages)
+        new, new_rate = await calls_per_second(new_get_prefix, cache, messages)
+        assert old == new
+        print(
+            f"{guilds:>5} guilds  compiled per message {old_rate:>12,.0f} calls/s"
+            f"  PrefixMatcher {new_rate:>12,.0f} calls/s"
+        )
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""rtfd lookups: ``fuzzy.finder`` over the inventory, as the owner cog
+did, against :meth:`utilities.sphinx_index.SphinxIndex.search`.
+
+The inventory is synthetic, the public names of some stdlib modules and
+of their classes, since this needs no network. The queries have typos
+and missing dots like the ones people type. Run from
+the repository root::
+
+    python -m benchmarks.sphinx_search
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+from time import perf_counter, time
+from typing import Awaitable, Callable, Dict, List
+
+from utilities.sphinx_index import SphinxIndex, _Project
+
+URL = "https://docs.python.org/3"
+MODULES = (
+    "argparse asyncio ast bisect codecs collections concurrent.futures "
+    "contextlib csv dataclasses datetime decimal email enum fractions "
+    "functools gettext heapq http inspect io itertools json locale logging "
+    "math multiprocessing os pathlib pdb pickle random re shutil socket "
+    "sqlite3 statistics string struct subprocess tempfile threading timeit "
+    "trace tracemalloc typing unittest urllib xml.etree.ElementTree zlib"
+).split()
+QUERIES = [
+    "Event.wait",
+    "ospathjoin",
+    "asyncio.gather",
+    "defaultdict",
+    "Thread.start",
+    "ClientSessoin",
+    "wait_for",
+    "Path.exists",
+    "loads",
+    "sqlite connect",
+]
+ROUNDS = 10
+
+
+def load_fuzzy():
+    # importing `cogs.owner` needs the bot's environment
+    spec = importlib.util.spec_from_file_location("fuzzy", "cogs/owner/fuzzy.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def inventory() -> Dict[str, str]:
+    entries = {}
+    for name in MODULES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        for attr in dir(module):
+            if attr.startswith("_"):
+                continue
+            entries[f"{name}.{attr}"] = f"library/{name}.html#{name}.{attr}"
+            obj = getattr(module, attr)
+            if isinstance(obj, type):
+                for member in dir(obj):
+                    if not member.startswith("_"):
+                        key = f"{name}.{attr}.{member}"
+                        entries[key] = f"library/{name}.html#{key}"
+    return entries
+
+
+async def per_lookup(search: Callable[[str], Awaitable[List]]) -> tuple:
+    results = [await search(query) for query in QUERIES]
+    ini = perf_counter()
+    for _ in range(ROUNDS):
+        for query in QUERIES:
+            await search(query)
+    return results, (perf_counter() - ini) / (ROUNDS * len(QUERIES))
+
+
+async def run() -> None:
+    fuzzy = load_fuzzy()
+    entries = inventory()
+    print(f"{len(entries)} names, {len(QUERIES)} queries")
+
+    cache = list(entries.items())
+
+    async def finder(query: str) -> List:
+        return fuzzy.finder(query, cache, key=lambda t: t[0], lazy=False)[:8]
+
+    index = SphinxIndex(":memory:", {"python": URL}, http=None)
+    index._projects["python"] = _Project(URL, None, None, time(), entries.items())
+    index._loaded.set()
+
+    async def search(query: str) -> List:
+        return await index.search("python", query)
+
+    old, old_time = await per_lookup(finder)
+    new, new_time = await per_lookup(search)
+    for label, results, elapsed in (
+        ("fuzzy.finder", old, old_time),
+        ("SphinxIndex.search", new, new_time),
+    ):
+        print(
+            f"  {label:<20} {elapsed * 1e3:>6.2f} ms/lookup"
+            f"  {sum(map(bool, results))}/{len(QUERIES)} matched"
+        )
+
+    print("best match")
+    for query, a, b in zip(QUERIES, old, new):
+        first_old = a[0][0] if a else "-"
+        first_new = b[0][0] if b else "-"
+        print(f"  {query:<16} {first_old:<36} {first_new}")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Message waiters: the library's ``wait_for("message")`` dispatch against
+:class:`utilities.waiters.MessageWaiters`.
+
+N waiters wait concurrently, each for one author in its own channel,
+while messages arrive in random channels, mostly from other people. Run
+from the repository root::
+
+    python -m benchmarks.waiters
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from time import perf_counter
+from types import SimpleNamespace
+
+from utilities.waiters import MessageWaiters
+
+# fewer messages with more waiters, the library loop is O(waiters)
+CHECKS = 20_000_000
+AUTHOR_OFFSET = 1_000_000
+
+
+def message(channel_id: int, author_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id)
+    )
+
+
+def library_dispatch(listeners, message) -> None:
+    # the listener loop of `discord.Client.dispatch`
+    removed = []
+    for i, (future, condition) in enumerate(listeners):
+        if future.cancelled():
+            removed.append(i)
+            continue
+        try:
+            result = condition(message)
+        except Exception as exc:
+            future.set_exception(exc)
+            removed.append(i)
+        else:
+            if result:
+                future.set_result(message)
+                removed.append(i)
+    for idx in reversed(removed):
+        del listeners[idx]
+
+
+def traffic(n: int) -> list:
+    rng = random.Random(n)
+    count = min(20_000, CHECKS // n)
+    # a tenth of the messages are sent where someone waits, by someone else
+    return [
+        message(rng.randrange(10 * n), rng.randrange(AUTHOR_OFFSET))
+        for _ in range(count)
+    ]
+
+
+async def bench_library(n: int, messages: list) -> float:
+    loop = asyncio.get_running_loop()
+    listeners = []
+    for channel_id in range(n):
+        author_id = channel_id + AUTHOR_OFFSET
+
+        def check(m, c=channel_id, a=author_id):
+            return m.channel.id == c and m.author.id == a
+
+        listeners.append((loop.create_future(), check))
+
+    ini = perf_counter()
+    for msg in messages:
+        library_dispatch(listeners, msg)
+    elapsed = perf_counter() - ini
+
+    for channel_id in range(n):
+        library_dispatch(listeners, message(channel_id, channel_id + AUTHOR_OFFSET))
+    assert not listeners
+    return elapsed
+
+
+async def bench_indexed(n: int, messages: list) -> float:
+    waiters = MessageWaiters()
+    tasks = [
+        asyncio.create_task(waiters.wait(channel_id, author=channel_id + AUTHOR_OFFSET))
+        for channel_id in range(n)
+    ]
+    await asyncio.sleep(0)  # let every waiter register
+
+    ini = perf_counter()
+    for msg in messages:
+        waiters.dispatch(msg)
+    elapsed = perf_counter() - ini
+
+    for channel_id in range(n):
+        waiters.dispatch(message(channel_id, channel_id + AUTHOR_OFFSET))
+    await asyncio.gather(*tasks)
+    assert waiters.waiting == 0
+    return elapsed
+
+
+async def run() -> None:
+    print(f"{'waiters':>8}  {'library':>14}  {'indexed':>14}")
+    for n in (10, 100, 1000, 10_000):
+        messages = traffic(n)
+        library = await bench_library(n, messages)
+        indexed = await bench_indexed(n, messages)
+        count = len(messages)
+        print(
+            f"{n:>8}  {library / count * 1e6:>9.2f} us/msg"
+            f"  {indexed / count * 1e6:>9.2f} us/msg"
+        )
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
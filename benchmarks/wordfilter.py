@@ -0,0 +1,120 @@
+"""Profanity filtering: the previous per-word searches against one
+:class:`utilities.wordfilter.WordMatcher`.
+
+- automod: ``re.search(rf"\\b{word}\\b", message)`` for every word of the
+  guild list, as the profanity cog did, and the same patterns compiled
+- global chat: splitting the message once per word, as
+  ``refrain_message`` did
+
+for ``extra/profanity.json`` and for a large guild list of 2000 more
+generated words.
+
+Most messages are clean, so every word is tried, and a fifth end with a
+listed word. The baselines must agree with the matcher. Run from the
+repository root::
+
+    python -m benchmarks.wordfilter
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import string
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from utilities.wordfilter import WordMatcher
+
+MESSAGES = 200
+EXTRA_WORDS = (0, 2000)
+
+
+def random_words(rng: random.Random, count: int) -> List[str]:
+    return [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+        for _ in range(count)
+    ]
+
+
+def messages(words: List[str]) -> List[str]:
+    rng = random.Random(0)
+    vocabulary = random_words(rng, 2000)
+    out = []
+    for _ in range(MESSAGES):
+        text = " ".join(rng.choice(vocabulary) for _ in range(30))[:190]
+        if rng.random() < 0.2:
+            text += " " + rng.choice(words)
+        out.append(text)
+    return out
+
+
+def per_message_search(words: List[str]) -> Callable[[str], bool]:
+    def check(text: str) -> bool:
+        sentence = text.lower()
+        return any(re.search(rf"\b{word}\b", sentence) for word in words)
+
+    return check
+
+
+def per_word_compiled(words: List[str]) -> Callable[[str], bool]:
+    patterns = [re.compile(rf"\b{re.escape(word)}\b") for word in words]
+
+    def check(text: str) -> bool:
+        sentence = text.lower()
+        return any(pattern.search(sentence) for pattern in patterns)
+
+    return check
+
+
+def split_filter(words: List[str]) -> Callable[[str], bool]:
+    # `refrain_message` of the global chat
+    def check(text: str) -> bool:
+        for word in words:
+            if word.lower() in text.replace(",", "").split(" "):
+                return True
+        return False
+
+    return check
+
+
+def timed(check: Callable[[str], bool], texts: List[str]) -> Tuple[List[bool], float]:
+    ini = perf_counter()
+    results = [check(text) for text in texts]
+    return results, (perf_counter() - ini) / len(texts)
+
+
+def main() -> None:
+    with open("extra/profanity.json") as f:
+        profanity = [word.lower() for word in json.load(f)]
+
+    for extra in EXTRA_WORDS:
+        words = profanity + random_words(random.Random(extra), extra)
+        # the baselines get the words \b can delimit, to agree with the matcher
+        plain = [w for w in words if re.fullmatch(r"\w+", w)]
+        texts = messages(plain)
+
+        ini = perf_counter()
+        matcher = WordMatcher(words)
+        build = perf_counter() - ini
+        found, matcher_time = timed(lambda text: text in matcher, texts)
+
+        print(f"{len(words)} words, {MESSAGES} messages of ~190 characters")
+        print(f"  WordMatcher build         {build * 1e3:>9.1f} ms, once per list")
+        print(f"  WordMatcher               {matcher_time * 1e6:>9.1f} us/message")
+        for label, factory in (
+            ("re.search per word", per_message_search),
+            ("compiled pattern per word", per_word_compiled),
+            ("split per word", split_filter),
+        ):
+            results, elapsed = timed(factory(plain), texts)
+            agree = sum(a == b for a, b in zip(results, found))
+            print(
+                f"  {label:<25} {elapsed * 1e6:>9.1f} us/message"
+                f"  ({agree}/{MESSAGES} agree)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@ from __future__ import annotations
 from core import Parrot, Context, Cog
 import discord
 from discord.ext import commands
-import aiohttp
 from datetime import datetime
 
 
@@ -27,11 +26,9 @@ class Actions(Cog):
     @Context.with_type
     async def waifu(self, ctx: Context, *, member: discord.Member = None):
         """Waifu pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -45,11 +42,9 @@ class Actions(Cog):
     @Context.with_type
     async def shinobu(self, ctx: Context, *, member: discord.Member = None):
         """Shinobu pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -63,11 +58,9 @@ class Actions(Cog):
     @Context.with_type
     async def megumin(self, ctx: Context, *, member: discord.Member = None):
         """Megumin pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -81,11 +74,9 @@ class Actions(Cog):
     @Context.with_type
     async def bully(self, ctx: Context, *, member: discord.Member = None):
         """Bully pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -99,11 +90,9 @@ class Actions(Cog):
     @Context.with_type
     async def cuddle(self, ctx: Context, *, member: discord.Member = None):
         """Cuddle pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -117,11 +106,9 @@ class Actions(Cog):
     @Context.with_type
     async def weep(self, ctx: Context, *, member: discord.Member = None):
         """Cry pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -135,11 +122,9 @@ class Actions(Cog):
     @Context.with_type
     async def hug(self, ctx: Context, *, member: discord.Member = None):
         """Hug pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} hugged {member if member else ''}",
             color=ctx.author.color,
@@ -157,11 +142,9 @@ class Actions(Cog):
     @Context.with_type
     async def awoo(self, ctx: Context, *, member: discord.Member = None):
         """Awoo pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -175,11 +158,9 @@ class Actions(Cog):
     @Context.with_type
     async def kiss(self, ctx: Context, *, member: discord.Member = None):
         """Kiss pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} kisses {member if member else ''}",
             color=ctx.author.color,
@@ -197,11 +178,9 @@ class Actions(Cog):
     @Context.with_type
     async def lick(self, ctx: Context, *, member: discord.Member = None):
         """Lick pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} licks {member if member else ''}",
             color=ctx.author.color,
@@ -219,11 +198,9 @@ class Actions(Cog):
     @Context.with_type
     async def pat(self, ctx: Context, *, member: discord.Member = None):
         """Pat pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} pats {member if member else ''}",
             color=ctx.author.color,
@@ -241,11 +218,9 @@ class Actions(Cog):
     @Context.with_type
     async def smug(self, ctx: Context, *, member: discord.Member = None):
         """Smug pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -259,11 +234,9 @@ class Actions(Cog):
     @Context.with_type
     async def bonk(self, ctx: Context, *, member: discord.Member = None):
         """Bonk pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} bonked {member if member else ''}",
             color=ctx.author.color,
@@ -281,11 +254,9 @@ class Actions(Cog):
     @Context.with_type
     async def yeet(self, ctx: Context, *, member: discord.Member = None):
         """Yeet pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -302,11 +273,9 @@ class Actions(Cog):
         ctx: Context,
     ):
         """Blush pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} blushes",
             color=ctx.author.color,
@@ -327,11 +296,9 @@ class Actions(Cog):
         ctx: Context,
     ):
         """Smile pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} smiles",
             color=ctx.author.color,
@@ -349,11 +316,9 @@ class Actions(Cog):
     @Context.with_type
     async def wave(self, ctx: Context, *, member: discord.Member = None):
         """Wave pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} waves {member if member else ''}",
             color=ctx.author.color,
@@ -371,11 +336,9 @@ class Actions(Cog):
     @Context.with_type
     async def highfive(self, ctx: Context, *, member: discord.Member = None):
         """Highfive pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} highfive {member if member else ''}",
             color=ctx.author.color,
@@ -393,11 +356,9 @@ class Actions(Cog):
     @Context.with_type
     async def handhold(self, ctx: Context, *, member: discord.Member = None):
         """Handhold pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} holds hand {'of' + str(member) if member else ''}",
             color=ctx.author.color,
@@ -415,11 +376,9 @@ class Actions(Cog):
     @Context.with_type
     async def nom(self, ctx: Context, *, member: discord.Member = None):
         """Nom pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} nom nom nom >:c",
             color=ctx.author.color,
@@ -437,11 +396,9 @@ class Actions(Cog):
     @Context.with_type
     async def bite(self, ctx: Context, *, member: discord.Member = None):
         """Bite pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} bites {member if member else ''}",
             color=ctx.author.color,
@@ -459,11 +416,9 @@ class Actions(Cog):
     @Context.with_type
     async def glomp(self, ctx: Context, *, member: discord.Member = None):
         """Glomp pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -483,11 +438,9 @@ class Actions(Cog):
         reason: commands.clean_content = None,
     ):
         """Slap pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
@@ -504,11 +457,9 @@ class Actions(Cog):
     @Context.with_type
     async def kill(self, ctx: Context, *, member: discord.Member = None):
         """Kill pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} killed {member if member else ''}",
             color=ctx.author.color,
@@ -527,8 +478,7 @@ class Actions(Cog):
     @Context.with_type
     async def hit(self, ctx: Context, *, member: discord.Member = None):
         """Kick pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/kick")
+        data = await self.bot.http_session.get(f"{self.url}/kick")
 
         json = await data.json()
         url = json["url"]
@@ -549,11 +499,9 @@ class Actions(Cog):
     @Context.with_type
     async def happy(self, ctx: Context, *, member: discord.Member = None):
         """Happy pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} is happy",
             color=ctx.author.color,
@@ -571,11 +519,9 @@ class Actions(Cog):
     @Context.with_type
     async def wink(self, ctx: Context, *, member: discord.Member = None):
         """Wink pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} winked {member if member else ''}",
             color=ctx.author.color,
@@ -593,11 +539,9 @@ class Actions(Cog):
     @Context.with_type
     async def poke(self, ctx: Context, *, member: discord.Member = None):
         """Poke pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} poked {member if member else ''}",
             color=ctx.author.color,
@@ -615,11 +559,9 @@ class Actions(Cog):
     @Context.with_type
     async def dance(self, ctx: Context):
         """Dance pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(
             title=f"{ctx.author} danced",
             color=ctx.author.color,
@@ -637,11 +579,9 @@ class Actions(Cog):
     @Context.with_type
     async def cringe(self, ctx: Context, *, member: discord.Member = None):
         """Cringe pics?"""
-        async with aiohttp.ClientSession() as session:
-            data = await session.get(f"{self.url}/{ctx.command.name}")
-
-        json = await data.json()
-        url = json["url"]
+        url = await self.bot.media_prefetch.get(f"{self.url}/{ctx.command.name}")
+        if url is None:
+            return
         em = discord.Embed(color=ctx.author.color, timestamp=datetime.utcnow())
         em.set_image(url=url)
         em.set_footer(text=f"{ctx.author}")
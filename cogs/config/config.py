@@ -24,7 +24,6 @@ with open(r"cogs/config/events.json") as f:
     events = json.load(f)
 
 ct = parrot_db["telephone"]
-csc = parrot_db["server_config"]
 ctt = parrot_db["ticket"]
 logs = parrot_db["logging"]
 
@@ -47,12 +46,12 @@ class BotConfig(Cog):
     async def config(self, ctx: Context):
         """To config the bot, mod role, prefix, or you can disable the commands and cogs."""
         if not ctx.invoked_subcommand:
-            if data := await csc.find_one({"_id": ctx.guild.id}):
+            if data := await self.bot.server_config.fetch(ctx.guild.id):
                 role = ctx.guild.get_role(data.get("mod_role"))
                 mod_log = ctx.guild.get_channel(data.get("action_log"))
                 await ctx.reply(
                     f"Configuration of this server [server_config]\n\n"
-                    f"`Prefix :` **{data['prefix']}**\n"
+                    f"`Prefix :` **{', '.join(await self.bot.get_guild_prefixes(ctx.guild))}**\n"
                     f"`ModRole:` **{role.name if role else 'None'} ({data.get('mod_role')})**\n"
                     f"`MogLog :` **{mod_log.mention if mod_log else 'None'} ({data.get('action_log')})**\n"
                 )
@@ -91,6 +90,7 @@ class BotConfig(Cog):
             await logs.update_one(
                 {"_id": ctx.guild.id}, {"$set": {str(event): str(webhook.url)}}, upsert=True
             )
+        self.bot.log_webhooks.invalidate(ctx.guild.id)
         await ctx.reply(
             f"{ctx.author.mention} all `{event.replace('_', ' ').title()}` will be posted on {channel.mention}"
         )
@@ -98,17 +98,26 @@ class BotConfig(Cog):
     @config.command(aliases=["prefix"])
     @commands.has_permissions(administrator=True)
     @Context.with_type
-    async def botprefix(self, ctx: Context, *, arg: str):
-        """To set the prefix of the bot. Whatever prefix you passed, will be case sensitive. It is advised to keep a symbol as a prefix. Must not greater than 6 chars"""
-        if len(arg) > 6:
+    async def botprefix(self, ctx: Context, *prefixes: str):
+        """To set the prefix of the bot. Whatever prefix you passed, will be case sensitive. It is advised to keep a symbol as a prefix. Must not greater than 6 chars. Separate the prefixes with space to set upto 5 prefixes, quote a prefix having space in it, like `"hey p"`"""
+        prefixes = list(dict.fromkeys(prefixes))
+        if not prefixes:
+            return await ctx.reply(
+                f"{ctx.author.mention} you must provide at least one prefix."
+            )
+        if len(prefixes) > 5:
+            return await ctx.reply(
+                f"{ctx.author.mention} can not have more than 5 prefixes."
+            )
+        if any(len(prefix) > 6 for prefix in prefixes):
             return await ctx.reply(
                 f"{ctx.author.mention} length of prefix can not be more than 6 characters."
             )
-        post = {"prefix": arg}
-        await self.bot.mongo.parrot_db.update_one({"_id": ctx.guild.id}, {"$set": post})
+        post = {"prefix": prefixes[0] if len(prefixes) == 1 else prefixes}
+        await self.bot.update_server_config(ctx.guild.id, {"$set": post})
 
         await ctx.reply(
-            f"{ctx.author.mention} success! Prefix for **{ctx.guild.name}** is **{arg}**."
+            f"{ctx.author.mention} success! Prefix for **{ctx.guild.name}** is {', '.join(f'`{prefix}`' for prefix in prefixes)}."
         )
 
     @config.command()
@@ -131,12 +140,13 @@ class BotConfig(Cog):
             )
         if duration:
             _ = ShortTime(duration)
-        if _ := await csc.find_one({"_id": ctx.guild.id, "warn_auto.count": count}):
+        data = await self.bot.server_config.fetch(ctx.guild.id)
+        if any(warn["count"] == count for warn in data.get("warn_auto", [])):
             return await ctx.send(
                 f"{ctx.author.mention} warn count {count} already exists."
             )
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {
                 "$addToSet": {
                     "warn_auto": {
@@ -171,8 +181,8 @@ class BotConfig(Cog):
             payload["action"] = flags.action.lower()
         if flags.count:
             payload["count"] = flags.count
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"warn_auto": {**payload}}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"warn_auto": {**payload}}}
         )
         await ctx.send(f"{ctx.author.mention} updated")
 
@@ -182,7 +192,7 @@ class BotConfig(Cog):
     async def muterole(self, ctx: Context, *, role: discord.Role = None):
         """To set the mute role of the server. By default role with name `Muted` is consider as mute role."""
         post = {"mute_role": role.id if role else None}
-        await self.bot.mongo.parrot_db.update_one({"_id": ctx.guild.id}, {"$set": post})
+        await self.bot.update_server_config(ctx.guild.id, {"$set": post})
         if not role:
             return await ctx.reply(
                 f"{ctx.author.mention} mute role reseted! or removed"
@@ -197,7 +207,7 @@ class BotConfig(Cog):
     async def modrole(self, ctx: Context, *, role: discord.Role = None):
         """To set mod role of the server. People with mod role can accesss the Moderation power of Parrot. By default the mod functionality works on the basis of permission"""
         post = {"mod_role": role.id if role else None}
-        await self.bot.mongo.parrot_db.update_one({"_id": ctx.guild.id}, {"$set": post})
+        await self.bot.update_server_config(ctx.guild.id, {"$set": post})
         if not role:
             return await ctx.reply(f"{ctx.author.mention} mod role reseted! or removed")
         await ctx.reply(
@@ -210,7 +220,7 @@ class BotConfig(Cog):
     async def actionlog(self, ctx: Context, *, channel: discord.TextChannel = None):
         """To set the action log, basically the mod log."""
         post = {"action_log": channel.id if channel else None}
-        await self.bot.mongo.parrot_db.update_one({"_id": ctx.guild.id}, {"$set": post})
+        await self.bot.update_server_config(ctx.guild.id, {"$set": post})
         if not channel:
             return await ctx.reply(
                 f"{ctx.author.mention} action log reseted! or removed"
@@ -258,10 +268,12 @@ class BotConfig(Cog):
                 {"$set": {"channel_id": channel.id, "webhook": webhook.url}},
                 upsert=True
             )
+            await self.bot.global_chat.refresh(ctx.guild.id)
             return
         if setting.lower() in ("ignore-role", "ignore_role", "ignorerole", "ignore"):
             post = {"ignore-role": role.id if role else None}
             await self.bot.mongo.parrot_db.global_chat.update_one({"_id": ctx.guild.id}, {"$set": post}, upsert=True)
+            await self.bot.global_chat.refresh(ctx.guild.id)
             if not role:
                 return await ctx.reply(
                     f"{ctx.author.mention} ignore role reseted! or removed"
@@ -275,8 +287,8 @@ class BotConfig(Cog):
     @commands.bot_has_permissions(embed_links=True)
     async def countchannel(self, ctx: Context, *, channel: discord.TextChannel = None):
         """To set the counting channel in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$set": {"counting": channel.id if channel else None}},
         )
         if channel:
@@ -295,8 +307,8 @@ class BotConfig(Cog):
         self, ctx: Context, *, channel: discord.TextChannel = None
     ):
         """To set the one word channel in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$set": {"oneword": channel.id if channel else None}},
         )
         if channel:
@@ -321,8 +333,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def antispam(self, ctx: Context, to_enable: convert_bool):
         """To toggle the spam protection in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$set": {"automod.spam.enable": to_enable}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$set": {"automod.spam.enable": to_enable}}
         )
         await ctx.reply(
             f"{ctx.author.mention} spam protection in the server is set to **{to_enable}**. "
@@ -335,8 +347,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def spamignore(self, ctx: Context, *, channel: discord.TextChannel):
         """To whitelist the spam channel. Pass None to delete the setting"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$addToSet": {"automod.spam.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$addToSet": {"automod.spam.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} spam protection won't be working in **{channel.name}**"
@@ -347,8 +359,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def spamremove(self, ctx: Context, *, channel: discord.TextChannel):
         """To whitelist the spam channel. Pass None to delete the setting"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.spam.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.spam.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} spam protection will be working in **{channel.name}**"
@@ -359,8 +371,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def antilinks(self, ctx: Context, *, to_enable: convert_bool):
         """To toggle the invite protection in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$set": {"automod.antilinks.enable": to_enable}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$set": {"automod.antilinks.enable": to_enable}}
         )
         await ctx.reply(
             f"{ctx.author.mention} anti links protection in the server is set to **{to_enable}**"
@@ -371,8 +383,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def antilinksignore(self, ctx: Context, *, channel: discord.TextChannel):
         """To whitelist the channel from anti links protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$addToSet": {"automod.antilinks.channel": channel.id}},
         )
         await ctx.reply(
@@ -384,8 +396,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def antilinksremove(self, ctx: Context, *, channel: discord.TextChannel):
         """To remove whitelisted channel from anti links protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.antilinks.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.antilinks.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} removed **{channel.name}** in whitelist, for links protection"
@@ -400,8 +412,8 @@ class BotConfig(Cog):
             re.compile(link)
         except re.error:
             return await ctx.reply(f"{ctx.author.mention} invalid regex expression")
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$addToSet": {"automod.antilinks.whitelist": link}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$addToSet": {"automod.antilinks.whitelist": link}}
         )
         await ctx.reply(
             f"{ctx.author.mention} **<{link}>** added for the whitelist link"
@@ -412,8 +424,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def blacklistlink(self, ctx: Context, *, link: str):
         """To remove whitelisted link."""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.antilinks.whitelist": link}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.antilinks.whitelist": link}}
         )
         await ctx.reply(
             f"{ctx.author.mention} **<{link}>** removed for the whitelist link"
@@ -424,8 +436,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def profanityadd(self, ctx: Context, *, word: str):
         """To add profanity words. Can also work for regex. May take 1h to update"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$addToSet": {"automod.profanity.words": word.lower()}},
         )
         await ctx.reply(f"{ctx.author.mention} **||{word}||** added in the list")
@@ -435,8 +447,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def profanitydel(self, ctx: Context, *, word: str):
         """To remove profanity word from list. Can also work for regex"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.profanity.words": word.lower()}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.profanity.words": word.lower()}}
         )
         await ctx.reply(f"{ctx.author.mention} **||{word}||** removed from the list")
 
@@ -445,8 +457,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def profanity(self, ctx: Context, *, to_enable: convert_bool):
         """To add profanity words. Can also work for regex"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$set": {"automod.profanity.enable": to_enable}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$set": {"automod.profanity.enable": to_enable}}
         )
         await ctx.reply(
             f"{ctx.author.mention} profanity system in this server is set to **{to_enable}**"
@@ -457,8 +469,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def profanityignore(self, ctx: Context, *, channel: discord.TextChannel):
         """To ignore the channel from profanity"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$addToSet": {"automod.profanity.channel": channel.id}},
         )
         await ctx.reply(
@@ -470,8 +482,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def profanityremove(self, ctx: Context, *, channel: discord.TextChannel):
         """To remove the ignored channel from profanity"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.profanity.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.profanity.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} removed **{channel.name}** in whitelist, for profanity protection"
@@ -482,8 +494,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def capsprotection(self, ctx: Context, *, to_enable: convert_bool):
         """To toggle the caps protection in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$set": {"automod.caps.enable": to_enable}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$set": {"automod.caps.enable": to_enable}}
         )
         await ctx.reply(
             f"{ctx.author.mention} caps protection for this server is set to **{to_enable}**"
@@ -494,8 +506,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def capslimit(self, ctx: Context, *, limit: int):
         """To toggle the caps protection in the server. It won't work if the limit is less than or equal to 0"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$set": {"automod.caps.limit": limit if limit > 0 else None}},
         )
         await ctx.reply(
@@ -507,8 +519,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def capsignore(self, ctx: Context, *, channel: discord.TextChannel):
         """To ignore the channel from caps protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$addToSet": {"automod.caps.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$addToSet": {"automod.caps.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} added **{channel.name}** in whitelist, for caps protection"
@@ -519,8 +531,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def capsremove(self, ctx: Context, *, channel: discord.TextChannel):
         """To remove the ignored channel from caps protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.caps.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.caps.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} removed **{channel.name}** in whitelist, for caps protection"
@@ -531,8 +543,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def emojiprotection(self, ctx: Context, *, to_enable: convert_bool):
         """To toggle the emoji protection in the server"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$set": {"automod.emoji.enable": to_enable}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$set": {"automod.emoji.enable": to_enable}}
         )
         await ctx.reply(
             f"{ctx.author.mention} emoji protection for this server is set to **{to_enable}**"
@@ -543,8 +555,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def emojilimit(self, ctx: Context, *, limit: int):
         """To toggle the emoji protection in the server. It won't work if the limit is less than 0"""
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$set": {"automod.emoji.limit": limit if limit > 0 else None}},
         )
         await ctx.reply(
@@ -556,8 +568,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def emojiignore(self, ctx: Context, *, channel: discord.TextChannel):
         """To ignore the channel from emoji protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$addToSet": {"automod.emoji.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$addToSet": {"automod.emoji.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} added **{channel.name}** in whitelist, for emoji protection"
@@ -568,8 +580,8 @@ class BotConfig(Cog):
     @Context.with_type
     async def emojiremove(self, ctx: Context, *, channel: discord.TextChannel):
         """To remove the ignored channel from emoji protection"""
-        await csc.update_one(
-            {"_id": ctx.guild.id}, {"$pull": {"automod.emoji.channel": channel.id}}
+        await self.bot.update_server_config(
+            ctx.guild.id, {"$pull": {"automod.emoji.channel": channel.id}}
         )
         await ctx.reply(
             f"{ctx.author.mention} removed **{channel.name}** in whitelist, for emoji protection"
@@ -888,6 +900,7 @@ class BotConfig(Cog):
             await ctx.send(
                 f"{ctx.author.mention} {command} is nither command nor any category"
             )
+        self.bot.command_overrides.invalidate(ctx.guild.id)
 
     @cmdconfig.command()
     @commands.has_permissions(administrator=True)
@@ -912,6 +925,7 @@ class BotConfig(Cog):
             await ctx.send(
                 f"{ctx.author.mention} {command} is nither command nor any category"
             )
+        self.bot.command_overrides.invalidate(ctx.guild.id)
 
     @cmdconfig.command()
     @commands.has_permissions(administrator=True)
@@ -949,6 +963,7 @@ class BotConfig(Cog):
         enable_disable = self.bot.mongo.enable_disable
         collection = enable_disable[f"{ctx.guild.id}"]
         await collection.drop()
+        self.bot.command_overrides.invalidate(ctx.guild.id)
         await ctx.send(f"{ctx.author.mention} reseted everything!")
 
     @commands.command(name="autowarn")
@@ -982,8 +997,8 @@ class BotConfig(Cog):
                 else None,
             },
         }
-        await csc.update_one(
-            {"_id": ctx.guild.id},
+        await self.bot.update_server_config(
+            ctx.guild.id,
             {"$set": {f"automod.{action.lower()}.autowarn": data}},
         )
         await ctx.send(
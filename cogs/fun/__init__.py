@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from .fun import Fun
 # from .one_word_story import OneWordStory
-# from .counting import Counting
+from .counting import Counting
 
 from core import Parrot
 
@@ -10,4 +10,4 @@ from core import Parrot
 def setup(bot: Parrot):
     bot.add_cog(Fun(bot))
     # bot.add_cog(OneWordStory(bot))
-    # bot.add_cog(Counting(bot))
+    bot.add_cog(Counting(bot))
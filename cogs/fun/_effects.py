@@ -1,12 +1,16 @@
 import math
 import random
+from functools import lru_cache
 from io import BytesIO
-from pathlib import Path
-from typing import Callable, Optional, Tuple, List
+from typing import Callable, Optional, Tuple
 
 import discord
+import numpy as np
 from PIL import Image, ImageDraw, ImageOps
 
+from utilities.asset_cache import load_image
+from utilities.colour_index import ColourIndex
+
 easter_like_colours = [
     (255, 247, 0),
     (255, 255, 224),
@@ -23,6 +27,27 @@ easter_like_colours = [
     (64, 224, 208),
 ]
 
+# RGB distances, so that ties go to the first colour like the old sorted()
+easter_index = ColourIndex(
+    {str(i): colour for i, colour in enumerate(easter_like_colours)}, space="rgb"
+)
+
+_easter_lut: Optional[np.ndarray] = None
+
+
+def easter_lut() -> np.ndarray:
+    """
+    The easterified colour of every 6 bit per channel colour, as a (64, 64, 64, 3) array.
+    Indexed by the RGB values shifted right by 2, built on first use.
+    """
+    global _easter_lut
+    if _easter_lut is None:
+        levels = np.arange(0, 256, 4, dtype=np.int32)
+        colours = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), -1)
+        nearest = easter_index.rgb[easter_index.nearest_indices(colours)]
+        _easter_lut = ((colours + nearest) // 2).astype(np.uint8)
+    return _easter_lut
+
 
 class PfpEffects:
     """
@@ -31,10 +56,8 @@ class PfpEffects:
     """
 
     @staticmethod
-    def apply_effect(
-        image_bytes: bytes, effect: Callable, filename: str, *args
-    ) -> discord.File:
-        """Applies the given effect to the image passed to it."""
+    def render_effect(image_bytes: bytes, effect: Callable, *args) -> bytes:
+        """Applies the given effect to the image passed to it, returns the PNG bytes."""
         im = Image.open(BytesIO(image_bytes))
         im = im.convert("RGBA")
         im = im.resize((1024, 1024))
@@ -42,9 +65,15 @@ class PfpEffects:
 
         bufferedio = BytesIO()
         im.save(bufferedio, format="PNG")
-        bufferedio.seek(0)
+        return bufferedio.getvalue()
 
-        return discord.File(bufferedio, filename=filename)
+    @staticmethod
+    def apply_effect(
+        image_bytes: bytes, effect: Callable, filename: str, *args
+    ) -> discord.File:
+        """Applies the given effect to the image passed to it."""
+        image = PfpEffects.render_effect(image_bytes, effect, *args)
+        return discord.File(BytesIO(image), filename=filename)
 
     @staticmethod
     def closest(x: Tuple[int, int, int]) -> Tuple[int, int, int]:
@@ -53,14 +82,7 @@ class PfpEffects:
         Returns a merge between the original colour and the closest colour.
         """
         r1, g1, b1 = x
-
-        def distance(point: Tuple[int, int, int]) -> int:
-            """Finds the difference between a pastel colour and the original pixel colour."""
-            r2, g2, b2 = point
-            return (r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2
-
-        closest_colours = sorted(easter_like_colours, key=distance)
-        r2, g2, b2 = closest_colours[0]
+        r2, g2, b2 = easter_index.nearest_rgb(x)
         r = (r1 + r2) // 2
         g = (g1 + g2) // 2
         b = (b1 + b2) // 2
@@ -86,18 +108,19 @@ class PfpEffects:
         ring.putalpha(mask)
         return ring
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def pride_ring(flag: str, pixels: int) -> Image.Image:
+        """The flag ring of the given thickness, made once per flag and thickness."""
+        ring = load_image(f"extra/pride/flags/{flag}.png").resize((1024, 1024))
+        ring = ring.convert("RGBA")
+        return PfpEffects.crop_ring(ring, pixels)
+
     @staticmethod
     def pridify_effect(image: Image.Image, pixels: int, flag: str) -> Image.Image:
         """Applies the given pride effect to the given image."""
         image = PfpEffects.crop_avatar_circle(image)
-
-        ring = Image.open(Path(f"extra/pride/flags/{flag}.png")).resize(
-            (1024, 1024)
-        )
-        ring = ring.convert("RGBA")
-        ring = PfpEffects.crop_ring(ring, pixels)
-
-        image.alpha_composite(ring, (0, 0))
+        image.alpha_composite(PfpEffects.pride_ring(flag, pixels), (0, 0))
         return image
 
     @staticmethod
@@ -105,11 +128,12 @@ class PfpEffects:
         """
         Applies the 8bit effect to the given image.
         This is done by reducing the image to 32x32 and then back up to 1024x1024.
-        We then quantize the image before returning too.
+        The image is quantized while it is 32x32, every pixel is then repeated the same number of times
+        so the palette is the same, for 1/1024th of the work.
         """
         image = image.resize((32, 32), resample=Image.NEAREST)
-        image = image.resize((1024, 1024), resample=Image.NEAREST)
-        return image.quantize()
+        image = image.quantize()
+        return image.resize((1024, 1024), resample=Image.NEAREST)
 
     @staticmethod
     def flip_effect(image: Image.Image) -> Image.Image:
@@ -141,159 +165,45 @@ class PfpEffects:
             )
             overlay_image = overlay_image.convert("RGBA")
         else:
-            overlay_image = Image.open(Path("extra/easter/chocolate_bunny.png"))
-
-        alpha = image.getchannel("A").getdata()
-        image = image.convert("RGB")
-        image = ImageOps.posterize(image, 6)
+            overlay_image = load_image("extra/easter/chocolate_bunny.png")
 
-        data = image.getdata()
-        data_set = set(data)
-        easterified_data_set = {}
+        rgba = np.asarray(image)
+        # posterize(6) keeps the 6 high bits, which is all the LUT looks at
+        rgb = rgba[..., :3] >> 2
+        out = np.empty_like(rgba)
+        out[..., :3] = easter_lut()[rgb[..., 0], rgb[..., 1], rgb[..., 2]]
+        out[..., 3] = rgba[..., 3]
 
-        for x in data_set:
-            easterified_data_set[x] = PfpEffects.closest(x)
-        new_pixel_data = [
-            (*easterified_data_set[x], alpha[i]) if x in easterified_data_set else x
-            for i, x in enumerate(data)
-        ]
-
-        im = Image.new("RGBA", image.size)
-        im.putdata(new_pixel_data)
+        im = Image.fromarray(out, "RGBA")
         im.alpha_composite(
             overlay_image,
             (im.width - overlay_image.width, (im.height - overlay_image.height) // 2),
         )
         return im
 
-    @staticmethod
-    def split_image(img: Image.Image, squares: int) -> list:
-        """
-        Split an image into a selection of squares, specified by the squares argument.
-        Explanation:
-        1. It gets the width and the height of the Image passed to the function.
-        2. It gets the root of a number of squares (number of squares) passed, which is called xy. Reason: if let's say
-        25 squares (number of squares) were passed, that is the total squares (split pieces) that the image is supposed
-        to be split into. As it is known, a 2D shape has a height and a width, and in this case the program thinks of it
-        as rows and columns. Rows multiplied by columns is equal to the passed squares (number of squares). To get rows
-        and columns, since in this case, each square (split piece) is identical, rows are equal to columns and the
-        program treats the image as a square-shaped, it gets the root out of the squares (number of squares) passed.
-        3. Now width and height are both of the original Image, Discord PFP, so when it comes to forming the squares,
-        the program divides the original image's height and width by the xy. In a case of 25 squares (number of squares)
-        passed, xy would be 5, so if an image was 250x300, x_frac would be 50 and y_frac - 60. Note:
-        x_frac stands for a fracture of width. The reason it's called that is because it is shorter to use x for width
-        in mind and then it's just half of the word fracture, same applies to y_frac, just height instead of width.
-        x_frac and y_frac are width and height of a single square (split piece).
-        4. With left, top, right, bottom, = 0, 0, x_frac, y_frac, the program sets these variables to create the initial
-        square (split piece). Explanation: all of these 4 variables start at the top left corner of the Image, by adding
-        value to right and bottom, it's creating the initial square (split piece).
-        5. In the for loop, it keeps adding those squares (split pieces) in a row and once (index + 1) % xy == 0 is
-        True, it adds to top and bottom to lower them and reset right and left to recreate the initial space between
-        them, forming a square (split piece), it also adds the newly created square (split piece) into the new_imgs list
-        where it stores them. The program keeps repeating this process till all 25 squares get added to the list.
-        6. It returns new_imgs, a list of squares (split pieces).
-        """
-        width, heigth = img.size
-
-        xy = math.sqrt(squares)
-
-        x_frac = width // xy
-        y_frac = heigth // xy
-
-        left, top, right, bottom, = (
-            0,
-            0,
-            x_frac,
-            y_frac,
-        )
-
-        new_imgs = []
-
-        for index in range(squares):
-            new_img = img.crop((left, top, right, bottom))
-            new_imgs.append(new_img)
-
-            if (index + 1) % xy == 0:
-                top += y_frac
-                bottom += y_frac
-                left = 0
-                right = x_frac
-            else:
-                left += x_frac
-                right += x_frac
-
-        return new_imgs
-
-    @staticmethod
-    def join_images(images: List[Image.Image]) -> Image.Image:
-        """
-        Stitches all the image squares into a new image.
-        Explanation:
-        1. Shuffles the passed images to randomize the pieces.
-        2. The program gets a single square (split piece) out of the list and defines single_width as the square's width
-        and single_height as the square's height.
-        3. It gets the root of type integer of the number of images (split pieces) in the list and calls it multiplier.
-        Program then proceeds to calculate total height and width of the new image that it's creating using the same
-        multiplier.
-        4. The program then defines new_image as the image that it's creating, using the previously obtained total_width
-        and total_height.
-        5. Now it defines width_multiplier as well as height with values of 0. These will be used to correctly position
-        squares (split pieces) onto the new_image canvas.
-        6. Similar to how in the split_image function, the program gets the root of number of images in the list.
-        In split_image function, it was the passed squares (number of squares) instead of a number of imgs in the
-        list that it got the square of here.
-        7. In the for loop, as it iterates, the program multiplies single_width by width_multiplier to correctly
-        position a square (split piece) width wise. It then proceeds to paste the newly positioned square (split piece)
-        onto the new_image. The program increases the width_multiplier by 1 every iteration so the image wouldn't get
-        pasted in the same spot and the positioning would move accordingly. It makes sure to increase the
-        width_multiplier before the check, which checks if the end of a row has been reached, -
-        (index + 1) % pieces == 0, so after it, if it was True, width_multiplier would have been reset to 0 (start of
-        the row). If the check returns True, the height gets increased by a single square's (split piece) height to
-        lower the positioning height wise and, as mentioned, the width_multiplier gets reset to 0 and width will
-        then be calculated from the start of the new row. The for loop finishes once all the squares (split pieces) were
-        positioned accordingly.
-        8. Finally, it returns the new_image, the randomized squares (split pieces) stitched back into the format of the
-        original image - user's PFP.
-        """
-        random.shuffle(images)
-        single_img = images[0]
-
-        single_wdith = single_img.size[0]
-        single_height = single_img.size[1]
-
-        multiplier = int(math.sqrt(len(images)))
-
-        total_width = multiplier * single_wdith
-        total_height = multiplier * single_height
-
-        new_image = Image.new("RGBA", (total_width, total_height), (250, 250, 250))
-
-        width_multiplier = 0
-        height = 0
-
-        squares = math.sqrt(len(images))
-
-        for index, image in enumerate(images):
-            width = single_wdith * width_multiplier
-
-            new_image.paste(image, (width, height))
-
-            width_multiplier += 1
-
-            if (index + 1) % squares == 0:
-                width_multiplier = 0
-                height += single_height
-
-        return new_image
-
     @staticmethod
     def mosaic_effect(image: Image.Image, squares: int) -> Image.Image:
         """
         Applies a mosaic effect to the given image.
         The "squares" argument specifies the number of squares to split
         the image into. This should be a square number.
+        The image is cut to a grid of equal squares (the remainder of the division on the right and bottom
+        is dropped), which are shuffled by reshaping the pixel array to (row, column, square pixels) and
+        indexing it with a random permutation.
         """
-        img_squares = PfpEffects.split_image(image, squares)
-        new_img = PfpEffects.join_images(img_squares)
+        pieces = int(math.sqrt(squares))
+        arr = np.asarray(image)
+        size = arr.shape[0] // pieces
+        channels = arr.shape[2]
+
+        grid = arr[: pieces * size, : pieces * size].reshape(
+            pieces, size, pieces, size, channels
+        )
+        tiles = grid.swapaxes(1, 2).reshape(pieces * pieces, size, size, channels)
+
+        order = list(range(len(tiles)))
+        random.shuffle(order)
+        tiles = tiles[order].reshape(pieces, pieces, size, size, channels)
 
-        return new_img
+        mosaic = tiles.swapaxes(1, 2).reshape(pieces * size, pieces * size, channels)
+        return Image.fromarray(mosaic, image.mode)
@@ -1,82 +1,87 @@
 from __future__ import annotations
 
-from typing import Collection
+import asyncio
 
 from core import Parrot, Cog
-from discord.ext import tasks
 import discord
-import typing
 
-from utilities.database import parrot_db
-
-collection = parrot_db["server_config"]
+from utilities.counting import CountingState
 
 
 class Counting(Cog):
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.cache = {}
-        self.clear_cache.start()
+        self.counting = bot.counting
+        self._seed_lock = asyncio.Lock()
+        # only the messages of the configured channels are routed here
+        self.bot.message_router.watch_config(
+            "counting", "counting", self.on_counting_message
+        )
 
-    async def get_last_message(
-        self, channel: discord.TextChannel
-    ) -> typing.Optional[discord.Message]:
-        if channel.last_message:
-            return channel.last_message
-        async for msg in channel.history(limit=1, oldest_first=False):
-            if not msg:
-                return None
-            return msg
+    def cog_unload(self) -> None:
+        self.bot.message_router.unwatch_config("counting")
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not message.guild or message.author.bot:
-            return
+    async def seed(self, message: discord.Message) -> None:
+        """Start the count of a channel which has no state yet from the
+        message before ``message``, once"""
+        async with self._seed_lock:
+            if message.channel.id in self.counting:
+                return
+            async for msg in message.channel.history(limit=1, before=message):
+                try:
+                    count = int(msg.content)
+                except ValueError:
+                    break
+                self.counting.seed(message.channel.id, count, msg.author.id, msg.id)
+                return
+            self.counting.seed(message.channel.id)
 
-        data = await collection.find_one(
-            {"_id": message.guild.id, "counting": message.channel.id}
-        )
-        if not data:
-            return
+    async def on_counting_message(self, message: discord.Message):
+        if message.channel.id not in self.counting:
+            await self.counting.load()
+            await self.seed(message)
 
-        channel = self.bot.get_channel(data["counting"])
-        if not channel:
+        if self.counting.check(message):
             return
 
-        msg = self.get_last_message(message.channel)
-
-        if msg and (message.author.id == msg.author.id):
-            try:
-                return await message.delete()
-            except discord.Forbidden:
-                return await message.channel.send(
-                    "Bot need manage message permission to work properly"
-                )
         try:
-            number = int(msg.content)
-        except ValueError:
-            return await message.channel.send(
-                "One of the recent message was either edited or the message was sent want a number. Requesting the Admin to set the counter as to work properly"
+            await message.delete()
+        except discord.Forbidden:
+            await message.channel.send(
+                "Bot need manage message permission to work properly"
             )
 
+    async def announce(self, channel_id: int, state: CountingState) -> None:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return
         try:
-            new_number = int(message.content)
-        except ValueError:
-            try:
-                await message.delete()
-            except discord.Forbidden:
-                return await message.channel.send(
-                    "Bot need manage message permission to work properly"
-                )
+            await channel.send(
+                f"The message of the last number was removed. "
+                f"The next number is **{state.count + 1}**"
+            )
+        except discord.HTTPException:
+            pass
 
-        if new_number - 1 != number:
-            try:
-                return await message.delete()
-            except discord.Forbidden:
-                return await message.channel.send(
-                    "Bot need manage message permission to work properly"
-                )
+    @Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        state = self.counting.deleted(payload.channel_id, payload.message_id)
+        if state is not None:
+            await self.announce(payload.channel_id, state)
 
-    @tasks.loop(hours=1)
-    async def clear_cache(self):
-        self.cache = {}
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(
+        self, payload: discord.RawBulkMessageDeleteEvent
+    ):
+        for message_id in payload.message_ids:
+            state = self.counting.deleted(payload.channel_id, message_id)
+            if state is not None:
+                await self.announce(payload.channel_id, state)
+
+    @Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        state = self.counting.edited(
+            payload.channel_id, payload.message_id, payload.data.get("content")
+        )
+        if state is not None:
+            await self.announce(payload.channel_id, state)
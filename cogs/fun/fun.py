@@ -15,7 +15,6 @@ import discord
 import aiohttp
 import asyncio
 import math
-from aiohttp import request
 from discord.ext import commands, tasks
 from discord import Embed
 from PIL import Image, ImageColor
@@ -24,8 +23,7 @@ import colorsys
 
 from pathlib import Path
 from random import choice, randint
-from typing import Callable, Optional, Union, TypeVar, List, Tuple, Dict
-from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Optional, Union, TypeVar, List, Tuple, Dict
 from rapidfuzz import fuzz
 
 from dataclasses import dataclass
@@ -33,6 +31,7 @@ from collections import defaultdict
 
 from utilities.paginator import PaginationView
 from utilities import spookifications
+from utilities.colour_index import ColourIndex
 from utilities.constants import Colours
 
 from core import Parrot, Context, Cog
@@ -63,8 +62,6 @@ with open("extra/twister.txt") as t:
 with open(Path("extra/anagram.json"), "r") as f:
     ANAGRAMS_ALL = json.load(f)
 
-_EXECUTOR = ThreadPoolExecutor(10)
-
 FILENAME_STRING = "{effect}_{author}.png"
 THUMBNAIL_SIZE = (80, 80)
 
@@ -169,16 +166,6 @@ WIKI_FEED_API_URL = "https://en.wikipedia.org/api/rest_v1/feed/featured/{date}"
 TRIVIA_QUIZ_ICON = "https://raw.githubusercontent.com/python-discord/branding/main/icons/trivia_quiz/trivia-quiz-dist.png"
 
 
-async def in_executor(func: Callable[..., T], *args) -> T:
-    """
-    Runs the given synchronous function `func` in an executor.
-    This is useful for running slow, blocking code within async
-    functions, so that they don't block the bot.
-    """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_EXECUTOR, func, *args)
-
-
 def file_safe_name(effect: str, display_name: str) -> str:
     """Returns a file safe filename based on the given effect and display name."""
     valid_filename_chars = f"-_. {string.ascii_letters}{string.digits}"
@@ -453,9 +440,8 @@ class Fun(Cog):
         self.game_owners = (
             {}
         )  # A variable to store the person's ID who started the quiz game in a channel.
-        with open(Path(r"extra/ryanzec_colours.json")) as f:
-            self.colour_mapping = json.load(f)
-            del self.colour_mapping["_"]  # Delete source credit entry
+        self.colour_index = ColourIndex.from_json(r"extra/ryanzec_colours.json")
+        self.colour_mapping = self.colour_index.hex
         self.questions = self.load_questions()
         self.question_limit = 0
         self.games: Dict[int, AnagramGame] = {}
@@ -582,27 +568,16 @@ class Fun(Cog):
         return hex_code
 
     def _rgb_to_name(self, rgb: Tuple[int, int, int]) -> Optional[str]:
-        """Convert RGB values to a fuzzy matched name."""
-        input_hex_colour = self._rgb_to_hex(rgb)
-        try:
-            match, certainty, _ = rapidfuzz.process.extractOne(
-                query=input_hex_colour,
-                choices=self.colour_mapping.values(),
-                score_cutoff=80,
-            )
-            colour_name = [
-                name
-                for name, hex_code in self.colour_mapping.items()
-                if hex_code == match
-            ][0]
-        except TypeError:
-            colour_name = None
-        return colour_name
+        """Convert RGB values to the name of the nearest colour."""
+        return self.colour_index.nearest(rgb)
 
     def match_colour_name(
         self, ctx: commands.Context, input_colour_name: str
     ) -> Optional[str]:
         """Convert a colour name to HEX code."""
+        name = self.colour_index.name(input_colour_name)
+        if name is not None:
+            return f"#{self.colour_mapping[name]}"
         try:
             match, certainty, _ = rapidfuzz.process.extractOne(
                 query=input_colour_name,
@@ -809,18 +784,16 @@ class Fun(Cog):
         if comic == "latest":
             info = self.latest_comic_info
         else:
-            async with self.bot.http_session.get(
-                f"{BASE_URL}/{comic}/info.0.json"
-            ) as resp:
-                if resp.status == 200:
-                    info = await resp.json()
-                else:
-                    embed.title = f"XKCD comic #{comic}"
-                    embed.description = (
-                        f"{resp.status}: Could not retrieve xkcd comic #{comic}."
-                    )
-                    await ctx.send(embed=embed)
-                    return
+            # published comics never change
+            try:
+                info = await self.bot.http_session.fetch(
+                    f"{BASE_URL}/{comic}/info.0.json", ttl=86400
+                )
+            except aiohttp.ClientResponseError as e:
+                embed.title = f"XKCD comic #{comic}"
+                embed.description = f"{e.status}: Could not retrieve xkcd comic #{comic}."
+                await ctx.send(embed=embed)
+                return
 
         embed.title = f"XKCD comic #{info['num']}"
         embed.description = f"{info['alt']}"  # fuck you pycord
@@ -856,6 +829,9 @@ class Fun(Cog):
 
         game = AnagramGame(scrambled_letters, correct)
         self.games[ctx.channel.id] = game
+        self.bot.message_router.register(
+            ctx.channel.id, "anagram", self.on_anagram_message
+        )
 
         anagram_embed = discord.Embed(
             title=f"Find anagrams from these letters: '{scrambled_letters.upper()}'",
@@ -863,31 +839,29 @@ class Fun(Cog):
             colour=Colours.purple,
         )
 
-        await ctx.send(embed=anagram_embed)
-        await asyncio.sleep(TIME_LIMIT)
-
-        if game.winners:
-            win_list = ", ".join(game.winners)
-            content = f"Well done {win_list} for getting it right!"
-        else:
-            content = "Nobody got it right."
+        try:
+            await ctx.send(embed=anagram_embed)
+            await asyncio.sleep(TIME_LIMIT)
 
-        answer_embed = discord.Embed(
-            title=f"The words were:  `{'`, `'.join(ANAGRAMS_ALL[game.scrambled])}`!",
-            colour=Colours.pink,
-        )
+            if game.winners:
+                win_list = ", ".join(game.winners)
+                content = f"Well done {win_list} for getting it right!"
+            else:
+                content = "Nobody got it right."
 
-        await ctx.send(content, embed=answer_embed)
+            answer_embed = discord.Embed(
+                title=f"The words were:  `{'`, `'.join(ANAGRAMS_ALL[game.scrambled])}`!",
+                colour=Colours.pink,
+            )
 
-        # Game is finished, let's remove it from the dict
-        self.games.pop(ctx.channel.id)
+            await ctx.send(content, embed=answer_embed)
+        finally:
+            # Game is finished, let's remove it from the dict
+            self.games.pop(ctx.channel.id, None)
+            self.bot.message_router.unregister(ctx.channel.id, "anagram")
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    async def on_anagram_message(self, message: discord.Message) -> None:
         """Check a message for an anagram attempt and pass to an ongoing game."""
-        if message.author.bot or not message.guild:
-            return
-
         game = self.games.get(message.channel.id)
         if not game:
             return
@@ -1033,13 +1007,15 @@ class Fun(Cog):
             #     return contains_correct_answer
 
             def check(m: discord.Message) -> bool:
-                return (m.channel.id == ctx.channel.id) and any(
+                return any(
                     fuzz.ratio(answer.lower(), m.content.lower()) > quiz_entry.var_tol
                     for answer in quiz_entry.answers
                 )
 
             try:
-                msg = await self.bot.wait_for("message", check=check, timeout=10)
+                msg = await self.bot.wait_for_message(
+                    ctx.channel, check=check, timeout=10
+                )
             except asyncio.TimeoutError:
                 # In case of TimeoutError and the game has been stopped, then do nothing.
                 if not self.game_status[ctx.channel.id]:
@@ -1190,9 +1166,6 @@ class Fun(Cog):
         tries = 6
         guessed_letters = set()
 
-        def check(msg: discord.Message) -> bool:
-            return msg.author == ctx.author and msg.channel == ctx.channel
-
         original_message = await ctx.send(
             content=f"{ctx.author.mention}",
             embed=Embed(
@@ -1209,8 +1182,8 @@ class Fun(Cog):
             )
 
             try:
-                message = await self.bot.wait_for(
-                    event="message", timeout=60.0, check=check
+                message = await self.bot.wait_for_message(
+                    ctx.channel, author=ctx.author, timeout=60.0
                 )
             except asyncio.exceptions.TimeoutError:
                 timeout_embed = Embed(
@@ -1644,12 +1617,12 @@ class Fun(Cog):
             fact_url = f"https://some-random-api.ml/facts/{animal}"
             image_url = f"https://some-random-api.ml/img/{'birb' if animal == 'bird' else animal}"
 
-            async with request("GET", image_url, headers={}) as response:
+            async with self.bot.http_session.get(image_url) as response:
                 if response.status == 200:
                     data = await response.json()
                     image_link = data.get("link")
 
-            async with request("GET", fact_url, headers={}) as response:
+            async with self.bot.http_session.get(fact_url) as response:
                 if response.status == 200:
                     data = await response.json()
 
@@ -1678,19 +1651,16 @@ class Fun(Cog):
         """Image Generator. Gay Pride."""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                "https://some-random-api.ml/canvas/gay?avatar={}".format(
-                    member.display_avatar.url
-                )
-            ) as wastedImage:
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            "https://some-random-api.ml/canvas/gay?avatar={}".format(
+                member.display_avatar.url
+            )
+        ) as wastedImage:
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "gay.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "gay.png")
+            )  # replying the file
 
     @commands.command()
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -1700,17 +1670,14 @@ class Fun(Cog):
         """Provide a glass filter on your profile picture, try it!"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/glass?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/glass?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await wastedSession.close()  # closing the session and;
-
-                await ctx.reply(
-                    file=discord.File(imageData, "glass.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "glass.png")
+            )  # replying the file
 
     @commands.command()
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -1720,17 +1687,14 @@ class Fun(Cog):
         """Image generator, Horny card generator."""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/horny?avatar={member.display_avatar.url}."
-            ) as wastedImage:
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/horny?avatar={member.display_avatar.url}."
+        ) as wastedImage:
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await wastedSession.close()  # closing the session and;
-
-                await ctx.reply(
-                    file=discord.File(imageData, "horny.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "horny.png")
+            )  # replying the file
 
     @commands.command(aliases=["insult"])
     @commands.max_concurrency(1, per=commands.BucketType.user)
@@ -1739,10 +1703,11 @@ class Fun(Cog):
         """Insult your enemy, Ugh!"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://insult.mattbas.org/api/insult") as response:
-                insult = await response.text()
-                await ctx.reply(f"**{member.name}** {insult}")
+        async with self.bot.http_session.get(
+            "https://insult.mattbas.org/api/insult"
+        ) as response:
+            insult = await response.text()
+            await ctx.reply(f"**{member.name}** {insult}")
 
     @commands.command(aliases=["its-so-stupid"])
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -1753,17 +1718,14 @@ class Fun(Cog):
         member = ctx.author
         if len(comment) > 20:
             comment = comment[:19:]
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/its-so-stupid?avatar={member.display_avatar.url}&dog={comment}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/its-so-stupid?avatar={member.display_avatar.url}&dog={comment}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await wastedSession.close()  # closing the session and;
-
-                await ctx.reply(
-                    file=discord.File(imageData, "itssostupid.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "itssostupid.png")
+            )  # replying the file
 
     @commands.command()
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -1773,17 +1735,14 @@ class Fun(Cog):
         """Image generator. Makes you behind the bars. Haha"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/jail?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/jail?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await wastedSession.close()  # closing the session and;
-
-                await ctx.reply(
-                    file=discord.File(imageData, "jail.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "jail.png")
+            )  # replying the file
 
     @commands.command()
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -1793,17 +1752,14 @@ class Fun(Cog):
         """This command is not made by me. :|"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/lolice?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/lolice?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "lolice.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "lolice.png")
+            )  # replying the file
 
     @commands.command(name="meme")
     @commands.bot_has_permissions(embed_links=True)
@@ -1812,12 +1768,11 @@ class Fun(Cog):
     async def meme(self, ctx: Context):
         """Random meme generator."""
         link = "https://memes.blademaker.tv/api?lang=en"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as response:
-                if response.status == 200:
-                    res = await response.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as response:
+            if response.status == 200:
+                res = await response.json()
+            else:
+                return
         title = res["title"]
         ups = res["ups"]
         downs = res["downs"]
@@ -1838,12 +1793,11 @@ class Fun(Cog):
     async def fakepeople(self, ctx: Context):
         """Fake Identity generator."""
         link = "https://randomuser.me/api/"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as response:
-                if response.status == 200:
-                    res = await response.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as response:
+            if response.status == 200:
+                res = await response.json()
+            else:
+                return
         res = res["results"][0]
         name = f"{res['name']['title']} {res['name']['first']} {res['name']['last']}"
         address = f"{res['location']['street']['number']}, {res['location']['street']['name']}, {res['location']['city']}, {res['location']['state']}, {res['location']['country']}, {res['location']['postcode']}"
@@ -1882,17 +1836,14 @@ class Fun(Cog):
         """Good for those, who are hell simp! LOL"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/simpcard?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/simpcard?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "simpcard.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "simpcard.png")
+            )  # replying the file
 
     @commands.command(aliases=["trans"])
     @commands.bot_has_permissions(embed_links=True)
@@ -1921,17 +1872,14 @@ class Fun(Cog):
         """User Triggered!"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/triggered?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/triggered?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "triggered.gif")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "triggered.gif")
+            )  # replying the file
 
     @commands.command(aliases=["def", "urban"])
     @commands.bot_has_permissions(embed_links=True)
@@ -1956,12 +1904,11 @@ class Fun(Cog):
         text = urllib.parse.quote(text)
         link = "http://api.urbandictionary.com/v0/define?term=" + text
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as response:
-                if response.status == 200:
-                    res = await response.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as response:
+            if response.status == 200:
+                res = await response.json()
+            else:
+                return
         if not res["list"]:
             return await ctx.reply(
                 f"{ctx.author.mention} **{t}** means nothings. Try something else"
@@ -2000,17 +1947,14 @@ class Fun(Cog):
         """Overlay 'WASTED' on your profile picture, just like GTA:SA"""
         if member is None:
             member = ctx.author
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/wasted?avatar={member.display_avatar.url}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/wasted?avatar={member.display_avatar.url}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "wasted.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "wasted.png")
+            )  # replying the file
 
     @commands.command(aliases=["youtube-comment", "youtube_comment"])
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -2025,17 +1969,14 @@ class Fun(Cog):
             name = member.name[:20:]
         else:
             name = member.name
-        async with aiohttp.ClientSession() as wastedSession:
-            async with wastedSession.get(
-                f"https://some-random-api.ml/canvas/youtube-comment?avatar={member.display_avatar.url}&username={name}&comment={comment}"
-            ) as wastedImage:  # get users avatar as png with 1024 size
-                imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
-
-                await wastedSession.close()  # closing the session and;
+        async with self.bot.http_session.get(
+            f"https://some-random-api.ml/canvas/youtube-comment?avatar={member.display_avatar.url}&username={name}&comment={comment}"
+        ) as wastedImage:  # get users avatar as png with 1024 size
+            imageData = io.BytesIO(await wastedImage.read())  # read the image/bytes
 
-                await ctx.reply(
-                    file=discord.File(imageData, "ytcomment.png")
-                )  # replying the file
+            await ctx.reply(
+                file=discord.File(imageData, "ytcomment.png")
+            )  # replying the file
 
     @commands.command()
     @commands.bot_has_permissions(embed_links=True)
@@ -2187,7 +2128,7 @@ class Fun(Cog):
         """Pat pat image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2203,7 +2144,7 @@ class Fun(Cog):
         """Burn image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2219,7 +2160,7 @@ class Fun(Cog):
         """Glitch image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url, "level": 2}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2235,7 +2176,7 @@ class Fun(Cog):
         """Bomb image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2251,7 +2192,7 @@ class Fun(Cog):
         """Bubble image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2267,7 +2208,7 @@ class Fun(Cog):
         """Explicit image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2283,7 +2224,7 @@ class Fun(Cog):
         """Lamp image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2299,7 +2240,7 @@ class Fun(Cog):
         """Rain image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2315,7 +2256,7 @@ class Fun(Cog):
         """Layers image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2331,7 +2272,7 @@ class Fun(Cog):
         """Blur image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2347,7 +2288,7 @@ class Fun(Cog):
         """Radiate image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2363,7 +2304,7 @@ class Fun(Cog):
         """Cartoon image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2379,7 +2320,7 @@ class Fun(Cog):
         """Shoot image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2395,7 +2336,7 @@ class Fun(Cog):
         """TV image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2411,7 +2352,7 @@ class Fun(Cog):
         """TV image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2427,7 +2368,7 @@ class Fun(Cog):
         """TV image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2443,7 +2384,7 @@ class Fun(Cog):
         """Magnify image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2459,7 +2400,7 @@ class Fun(Cog):
         """Wrap image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2475,7 +2416,7 @@ class Fun(Cog):
         """Gallery image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2491,7 +2432,7 @@ class Fun(Cog):
         """Paparazzi image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2507,7 +2448,7 @@ class Fun(Cog):
         """Abstract image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2523,7 +2464,7 @@ class Fun(Cog):
         """Balls image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2539,7 +2480,7 @@ class Fun(Cog):
         """Shock image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2555,7 +2496,7 @@ class Fun(Cog):
         """curvy image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/wave", params=params
         )
         file_obj = discord.File(
@@ -2571,7 +2512,7 @@ class Fun(Cog):
         """Hearts image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2587,7 +2528,7 @@ class Fun(Cog):
         """Equation image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2603,7 +2544,7 @@ class Fun(Cog):
         """Boil image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2621,7 +2562,7 @@ class Fun(Cog):
         """Shear image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url, "axis": axis if axis else "X"}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2637,7 +2578,7 @@ class Fun(Cog):
         """Canny image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2653,7 +2594,7 @@ class Fun(Cog):
         """Emojify the image"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/text/{ctx.command.name}", params=params
         )
 
@@ -2671,7 +2612,7 @@ class Fun(Cog):
         """Half Invert image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2687,7 +2628,7 @@ class Fun(Cog):
         """Roll image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2703,7 +2644,7 @@ class Fun(Cog):
         """Optics image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2718,7 +2659,7 @@ class Fun(Cog):
     async def scrapbook(self, ctx: Context, *, text: commands.clean_content):
         """ScrapBook Text image generation"""
         params = {"text": text[:20:]}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2734,7 +2675,7 @@ class Fun(Cog):
         """Earth Quack image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2750,7 +2691,7 @@ class Fun(Cog):
         """Bonks image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2766,7 +2707,7 @@ class Fun(Cog):
         """Infinity image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2782,7 +2723,7 @@ class Fun(Cog):
         """Sob sob sob sob image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2798,7 +2739,7 @@ class Fun(Cog):
         """Sensitive image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2814,7 +2755,7 @@ class Fun(Cog):
         """Ads image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2830,7 +2771,7 @@ class Fun(Cog):
         """Matrix image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2846,7 +2787,7 @@ class Fun(Cog):
         """Pattern image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url}
-        r = await self.bot.session.get(
+        r = await self.bot.http_session.get(
             f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
         )
         file_obj = discord.File(
@@ -2954,15 +2895,19 @@ class Fun(Cog):
             await ctx.send(f"{ctx.author.mention} Could not get user info.")
             return
 
-        image_bytes = await user.display_avatar.replace(size=1024).read()
+        image_bytes = await self.bot.asset_cache.asset(user.display_avatar, size=1024)
         file_name = file_safe_name("eightbit_avatar", ctx.author.display_name)
 
-        file = await in_executor(
-            PfpEffects.apply_effect,
-            image_bytes,
-            PfpEffects.eight_bitify_effect,
-            file_name,
+        image = await self.bot.asset_cache.memo(
+            ("8bitify", user.display_avatar.key),
+            lambda: self.bot.renderer.render(
+                "8bitify",
+                PfpEffects.render_effect,
+                image_bytes,
+                PfpEffects.eight_bitify_effect,
+            ),
         )
+        file = discord.File(io.BytesIO(image), filename=file_name)
 
         embed = discord.Embed(
             title="Your 8-bit avatar",
@@ -2997,12 +2942,21 @@ class Fun(Cog):
                 await ctx.send(f"{ctx.author.mention} Could not get user info.")
                 return
 
-            image_bytes = await user.display_avatar.replace(size=1024).read()
+            image_bytes = await self.bot.asset_cache.asset(
+                user.display_avatar, size=1024
+            )
             filename = file_safe_name("reverse_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect, image_bytes, PfpEffects.flip_effect, filename
+            image = await self.bot.asset_cache.memo(
+                ("reverse", user.display_avatar.key),
+                lambda: self.bot.renderer.render(
+                    "reverse",
+                    PfpEffects.render_effect,
+                    image_bytes,
+                    PfpEffects.flip_effect,
+                ),
             )
+            file = discord.File(io.BytesIO(image), filename=filename)
 
             embed = discord.Embed(
                 title="Your reversed avatar.",
@@ -3054,16 +3008,27 @@ class Fun(Cog):
                     return
                 ctx.send = send_message  # Reassigns ctx.send
 
-            image_bytes = await user.display_avatar.replace(size=256).read()
+            image_bytes = await self.bot.asset_cache.asset(
+                user.display_avatar, size=256
+            )
             file_name = file_safe_name("easterified_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.easterify_effect,
-                file_name,
-                egg,
-            )
+            def render() -> Awaitable[bytes]:
+                return self.bot.renderer.render(
+                    "easterify",
+                    PfpEffects.render_effect,
+                    image_bytes,
+                    PfpEffects.easterify_effect,
+                    egg,
+                )
+
+            if egg is None:
+                # the egg design is random, only the bunny one can be reused
+                key = ("easterify", user.display_avatar.key)
+                image = await self.bot.asset_cache.memo(key, render)
+            else:
+                image = await render()
+            file = discord.File(io.BytesIO(image), filename=file_name)
 
             embed = discord.Embed(
                 title="Your Lovely Easterified Avatar!",
@@ -3079,20 +3044,25 @@ class Fun(Cog):
 
     @staticmethod
     async def send_pride_image(
-        ctx: Context, image_bytes: bytes, pixels: int, flag: str, option: str
+        ctx: Context, avatar: discord.Asset, pixels: int, flag: str, option: str
     ):
         """Gets and sends the image in an embed. Used by the pride commands."""
         async with ctx.typing():
             file_name = file_safe_name("pride_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
-                image_bytes,
-                PfpEffects.pridify_effect,
-                file_name,
-                pixels,
-                flag,
+            image_bytes = await ctx.bot.asset_cache.asset(avatar, size=1024)
+            image = await ctx.bot.asset_cache.memo(
+                ("pride", avatar.key, pixels, flag),
+                lambda: ctx.bot.renderer.render(
+                    "pride",
+                    PfpEffects.render_effect,
+                    image_bytes,
+                    PfpEffects.pridify_effect,
+                    pixels,
+                    flag,
+                ),
             )
+            file = discord.File(io.BytesIO(image), filename=file_name)
 
             embed = discord.Embed(
                 title="Your Lovely Pride Avatar!",
@@ -3128,8 +3098,7 @@ class Fun(Cog):
             if not user:
                 await ctx.send(f"{ctx.author.mention} Could not get user info.")
                 return
-            image_bytes = await user.display_avatar.replace(size=1024).read()
-            await self.send_pride_image(ctx, image_bytes, pixels, flag, option)
+            await self.send_pride_image(ctx, user.display_avatar, pixels, flag, option)
 
     @prideavatar.command()
     async def flags(self, ctx: Context):
@@ -3154,16 +3123,19 @@ class Fun(Cog):
             return
 
         async with ctx.typing():
-            image_bytes = await user.display_avatar.replace(size=1024).read()
+            image_bytes = await self.bot.asset_cache.asset(
+                user.display_avatar, size=1024
+            )
 
             file_name = file_safe_name("spooky_avatar", ctx.author.display_name)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
+            image = await self.bot.renderer.render(
+                "spooky",
+                PfpEffects.render_effect,
                 image_bytes,
                 spookifications.get_random_effect,
-                file_name,
             )
+            file = discord.File(io.BytesIO(image), filename=file_name)
 
             embed = discord.Embed(
                 title="Is this you or am I just really paranoid?",
@@ -3200,15 +3172,16 @@ class Fun(Cog):
 
             file_name = file_safe_name("mosaic_avatar", ctx.author.display_name)
 
-            img_bytes = await user.display_avatar.replace(size=1024).read()
+            img_bytes = await self.bot.asset_cache.asset(user.display_avatar, size=1024)
 
-            file = await in_executor(
-                PfpEffects.apply_effect,
+            image = await self.bot.renderer.render(
+                "mosaic",
+                PfpEffects.render_effect,
                 img_bytes,
                 PfpEffects.mosaic_effect,
-                file_name,
                 squares,
             )
+            file = discord.File(io.BytesIO(image), filename=file_name)
 
             if squares == 1:
                 title = "Hooh... that was a lot of work"
@@ -7,41 +7,29 @@ from discord.ext import tasks
 import discord
 import typing
 
-from utilities.database import parrot_db
-
-collection = parrot_db["server_config"]
-
 
 class OneWordStory(Cog):
     def __init__(self, bot: Parrot):
         self.bot = bot
         self.cache = {}
         self.clear_cache.start()
+        # only the messages of the configured channels are routed here
+        self.bot.message_router.watch_config(
+            "oneword", "oneword", self.on_oneword_message
+        )
+
+    def cog_unload(self) -> None:
+        self.bot.message_router.unwatch_config("oneword")
+        self.clear_cache.cancel()
 
     async def get_last_message(
-        self, channel: discord.TextChannel
+        self, message: discord.Message
     ) -> typing.Optional[discord.Message]:
-        if channel.last_message:
-            return channel.last_message
-        async for msg in channel.history(limit=1, oldest_first=False):
+        async for msg in message.channel.history(limit=1, before=message):
             return msg
 
-    @Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not message.guild or message.author.bot:
-            return
-
-        data = await collection.find_one(
-            {"_id": message.guild.id, "oneword": message.channel.id}
-        )
-        if not data:
-            return
-
-        channel = self.bot.get_channel(data["oneword"])
-        if not channel:
-            return
-
-        msg = self.get_last_message(message.channel)
+    async def on_oneword_message(self, message: discord.Message):
+        msg = await self.get_last_message(message)
 
         if msg and (message.author.id == msg.author.id):
             try:
@@ -51,7 +39,7 @@ class OneWordStory(Cog):
                     "Bot need manage message permission to work properly"
                 )
 
-        if message.content.split(" ") > 2:
+        if len(message.content.split(" ")) > 2:
             try:
                 return await message.delete()
             except discord.Forbidden:
@@ -8,9 +8,10 @@ from discord.ext import commands
 
 from pathlib import Path
 from typing import Optional, Union, List, Tuple
-from contextlib import suppress
 from io import BytesIO
 from PIL import Image
+import numpy as np
+from utilities.colour_index import ColourIndex
 from utilities.constants import Colours, Month
 
 from utilities.deco import seasonal_task
@@ -22,9 +23,14 @@ BUNNY_NAMES = loads(Path(r"extra/easter/bunny_names.json").read_text("utf8"))
 RIDDLE_QUESTIONS = loads(Path(r"extra/easter/easter_riddle.json").read_text("utf8"))
 
 TIMELIMIT = 10
-HTML_COLOURS = loads(Path(r"extra/html_colours.json").read_text("utf8"))
 EGG_FACTS = loads(Path(r"extra/easter/easter_egg_facts.json").read_text("utf8"))
-XKCD_COLOURS = loads(Path(r"extra/xkcd_colours.json").read_text("utf8"))
+# HTML names win over the XKCD ones
+EGG_COLOURS = ColourIndex(
+    {
+        **loads(Path(r"extra/xkcd_colours.json").read_text("utf8")),
+        **loads(Path(r"extra/html_colours.json").read_text("utf8")),
+    }
+)
 EGGHEAD_QUESTIONS = loads(
     Path(r"extra/easter/egghead_questions.json").read_text("utf8")
 )
@@ -83,6 +89,33 @@ def suppress_links(message: str) -> str:
     return message
 
 
+def decorate_egg(num: int, colours: List[Tuple[int, int, int]]) -> bytes:
+    """Paints the egg design `num` with the given colours, runs in the image renderer."""
+    im = Image.open(
+        Path(f"bot/resources/holidays/easter/easter_eggs/design{num}.png")
+    )
+    data = np.asarray(im)
+    # one uint32 per RGBA pixel, to compare whole pixels at once
+    packed = np.ascontiguousarray(data).view(np.uint32)[..., 0]
+
+    replaceable = {
+        tuple(int(v) for v in colour)
+        for colour in np.unique(packed).view(np.uint8).reshape(-1, 4)
+    }
+    replaceable = sorted(replaceable - set(IRREPLACEABLE), key=COLOURS.index)
+
+    new_data = data.copy()
+    for colour, replacing in zip(replaceable, colours):
+        mask = packed == np.array(colour, dtype=np.uint8).view(np.uint32)[0]
+        # Also ensures that the alpha channel has a value
+        new_data[mask] = (*replacing, 255)
+    new_im = Image.fromarray(new_data, im.mode)
+
+    bufferedio = BytesIO()
+    new_im.save(bufferedio, format="PNG")
+    return bufferedio.getvalue()
+
+
 class Easter(Cog):
     """A cog for April"""
 
@@ -96,11 +129,7 @@ class Easter(Cog):
     @staticmethod
     def replace_invalid(colour: str) -> Optional[int]:
         """Attempts to match with HTML or XKCD colour names, returning the int value."""
-        with suppress(KeyError):
-            return int(HTML_COLOURS[colour], 16)
-        with suppress(KeyError):
-            return int(XKCD_COLOURS[colour], 16)
-        return None
+        return EGG_COLOURS.value(colour)
 
     @commands.command(name="fool")
     async def april_fools(self, ctx: Context) -> None:
@@ -202,6 +231,9 @@ class Easter(Cog):
             return
 
         self.current_channel = ctx.channel
+        self.bot.message_router.register(
+            ctx.channel.id, "riddle", self.on_riddle_message
+        )
 
         random_question = random.choice(RIDDLE_QUESTIONS)
         question = random_question["question"]
@@ -214,43 +246,42 @@ class Easter(Cog):
             title=question, description=description, colour=0xCF84E0
         )
 
-        await ctx.send(embed=riddle_embed)
-        await asyncio.sleep(TIMELIMIT)
-
-        hint_embed = discord.Embed(title=f"Here's a hint: {hints[0]}!", colour=0xCF84E0)
+        try:
+            await ctx.send(embed=riddle_embed)
+            await asyncio.sleep(TIMELIMIT)
 
-        await ctx.send(embed=hint_embed)
-        await asyncio.sleep(TIMELIMIT)
+            hint_embed = discord.Embed(
+                title=f"Here's a hint: {hints[0]}!", colour=0xCF84E0
+            )
 
-        hint_embed = discord.Embed(title=f"Here's a hint: {hints[1]}!", colour=0xCF84E0)
+            await ctx.send(embed=hint_embed)
+            await asyncio.sleep(TIMELIMIT)
 
-        await ctx.send(embed=hint_embed)
-        await asyncio.sleep(TIMELIMIT)
+            hint_embed = discord.Embed(
+                title=f"Here's a hint: {hints[1]}!", colour=0xCF84E0
+            )
 
-        if self.winners:
-            win_list = " ".join(self.winners)
-            content = f"Well done {win_list} for getting it right!"
-        else:
-            content = "Nobody got it right..."
+            await ctx.send(embed=hint_embed)
+            await asyncio.sleep(TIMELIMIT)
 
-        answer_embed = discord.Embed(
-            title=f"The answer is: {self.correct}!", colour=0xCF84E0
-        )
+            if self.winners:
+                win_list = " ".join(self.winners)
+                content = f"Well done {win_list} for getting it right!"
+            else:
+                content = "Nobody got it right..."
 
-        await ctx.send(content, embed=answer_embed)
+            answer_embed = discord.Embed(
+                title=f"The answer is: {self.correct}!", colour=0xCF84E0
+            )
 
-        self.winners.clear()
-        self.current_channel = None
+            await ctx.send(content, embed=answer_embed)
+        finally:
+            self.winners.clear()
+            self.bot.message_router.unregister(ctx.channel.id, "riddle")
+            self.current_channel = None
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message) -> None:
+    async def on_riddle_message(self, message: discord.Message) -> None:
         """If a non-bot user enters a correct answer, their username gets added to self.winners."""
-        if self.current_channel != message.channel:
-            return
-
-        if self.bot.user == message.author:
-            return
-
         if message.content.lower() == self.correct.lower():
             self.winners.add(message.author.mention)
 
@@ -292,34 +323,15 @@ class Easter(Cog):
                 q, r = divmod(8, colours_n)
                 colours = colours * q + colours[:r]
             num = random.randint(1, 6)
-            im = Image.open(
-                Path(f"bot/resources/holidays/easter/easter_eggs/design{num}.png")
+            egg = await self.bot.renderer.render(
+                "eggdecorate",
+                decorate_egg,
+                num,
+                [colour.to_rgb() for colour in colours],
             )
-            data = list(im.getdata())
-
-            replaceable = {x for x in data if x not in IRREPLACEABLE}
-            replaceable = sorted(replaceable, key=COLOURS.index)
-
-            replacing_colours = {
-                colour: colours[i] for i, colour in enumerate(replaceable)
-            }
-            new_data = []
-            for x in data:
-                if x in replacing_colours:
-                    new_data.append((*replacing_colours[x].to_rgb(), 255))
-                    # Also ensures that the alpha channel has a value
-                else:
-                    new_data.append(x)
-            new_im = Image.new(im.mode, im.size)
-            new_im.putdata(new_data)
-
-            bufferedio = BytesIO()
-            new_im.save(bufferedio, format="PNG")
-
-            bufferedio.seek(0)
 
             file = discord.File(
-                bufferedio, filename="egg.png"
+                BytesIO(egg), filename="egg.png"
             )  # Creates file to be used in embed
             embed = discord.Embed(
                 title="Your Colourful Easter Egg",
@@ -332,7 +344,7 @@ class Easter(Cog):
             )
 
         await ctx.send(file=file, embed=embed)
-        return new_im
+        return Image.open(BytesIO(egg))
 
     @seasonal_task(Month.APRIL)
     async def send_egg_fact_daily(self) -> None:
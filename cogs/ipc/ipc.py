@@ -16,3 +16,8 @@ class IpcRoutes(Cog):
         )  # get the guild object using parsed guild_id
 
         return guild.member_count  # return the member count to the client
+
+    @ipc.server.route()
+    async def get_stats(self, data):
+        # counters kept up to date by the events, nothing is walked here
+        return self.bot.bot_stats.snapshot()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import discord
-import aiohttp
 from discord.ext import commands
 
 from datetime import datetime
@@ -31,12 +30,11 @@ class Memegen(Cog):
             "text": f"{text}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -56,12 +54,11 @@ class Memegen(Cog):
             "url": f"{member.display_avatar.url}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -83,12 +80,11 @@ class Memegen(Cog):
             "url": f"{member.display_avatar.url}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -115,12 +111,11 @@ class Memegen(Cog):
             "intensity": intensity,
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -139,12 +134,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "blurpify", "image": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -166,12 +160,11 @@ class Memegen(Cog):
             "username": f"{ctx.author.name}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -190,12 +183,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "deepfry", "image": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -214,12 +206,11 @@ class Memegen(Cog):
             text = "No U"
         params = {"type": "tweet", "text": f"{text}", "username": f"{ctx.author.name}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -238,12 +229,11 @@ class Memegen(Cog):
             text = "No U"
         params = {"type": "trumptweet", "text": f"{text}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -267,12 +257,11 @@ class Memegen(Cog):
             "image": f"{member.display_avatar.url}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -291,12 +280,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "awooify", "url": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -315,12 +303,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "animeface", "image": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -339,12 +326,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "iphonex", "url": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -363,12 +349,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "threats", "url": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -385,12 +370,11 @@ class Memegen(Cog):
         """
         params = {"type": "clyde", "text": f"{text}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -413,12 +397,11 @@ class Memegen(Cog):
             "username": f"{member.name}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -439,12 +422,11 @@ class Memegen(Cog):
             "user2": f"{ctx.author.display_avatar.url}",
         }
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -463,12 +445,11 @@ class Memegen(Cog):
             member = ctx.author
         params = {"type": "baguette", "url": f"{member.display_avatar.url}"}
         url = "https://nekobot.xyz/api/imagegen"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         img = res["message"]
         em = discord.Embed(title="", timestamp=datetime.utcnow())
         em.set_image(url=img)
@@ -501,12 +482,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -545,12 +525,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -589,12 +568,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -632,12 +610,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -675,12 +652,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -718,12 +694,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -762,12 +737,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -805,12 +779,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -851,12 +824,11 @@ class Memegen(Cog):
             "max_font_size": fontsize,
         }
         url = "https://api.imgflip.com/caption_image"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(url, params=params) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         if not res["success"]:
             return
@@ -20,7 +20,6 @@ from .robopage import RoboPages
 import datetime
 import inspect
 import itertools
-import pygit2
 import asyncio
 
 from typing import Any, Dict, List, Optional, Union
@@ -619,12 +618,8 @@ class Meta(Cog):
         return f"[`{short_sha2}`](https://github.com/rtk-rnjn/Parrot/commit/{commit.hex}) {short} ({offset})"
 
     def get_last_commits(self, count=3):
-        repo = pygit2.Repository(".git")
-        commits = list(
-            itertools.islice(
-                repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL), count
-            )
-        )
+        # read once at startup
+        commits = self.bot.bot_stats.commits[:count]
         return "\n".join(self.format_commit(c) for c in commits)
 
     @commands.command(name="stats", aliases=["about"])
@@ -648,29 +643,14 @@ class Meta(Cog):
         embed.set_author(name=str(owner), icon_url=owner.display_avatar.url)
 
         # statistics
-        total_members = 0
-        total_unique = len(self.bot.users)
-
-        text = 0
-        voice = 0
-        guilds = 0
-        for guild in self.bot.guilds:
-            guilds += 1
-            if guild.unavailable:
-                continue
-
-            total_members += guild.member_count
-            for channel in guild.channels:
-                if isinstance(channel, discord.TextChannel):
-                    text += 1
-                elif isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
-                    voice += 1
+        stats = self.bot.bot_stats
 
         embed.add_field(
-            name="Members", value=f"{total_members} total\n{total_unique} unique"
+            name="Members", value=f"{stats.members} total\n{stats.users} unique"
         )
         embed.add_field(
-            name="Channels", value=f"{text + voice} total\n{text} text\n{voice} voice"
+            name="Channels",
+            value=f"{stats.channels} total\n{stats.text} text\n{stats.voice} voice",
         )
         process = psutil.Process()
         memory_usage = process.memory_full_info().uss / 1024**2
@@ -680,7 +660,7 @@ class Meta(Cog):
         )
 
         version = discord_version
-        embed.add_field(name="Guilds", value=guilds)
+        embed.add_field(name="Guilds", value=stats.guilds)
         embed.add_field(name="Bot Version", value=VERSION)
         embed.add_field(
             name="Uptime", value=discord.utils.format_dt(self.bot.uptime, "R")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import hashlib
-from typing import BinaryIO, Iterable, List, Optional, Union
+from typing import BinaryIO, List, Optional, Union
 
 from cogs.meta.robopage import SimplePages
 
@@ -17,6 +17,7 @@ import inspect
 import json
 from pathlib import Path
 import io
+from functools import partial
 import string
 from html import unescape
 
@@ -42,7 +43,7 @@ from qrcode.image.styles.colormasks import (
 from core import Parrot, Context, Cog
 
 from utilities.youtube_search import YoutubeSearch
-from utilities.converters import ToAsync, convert_bool
+from utilities.converters import convert_bool
 from utilities.paginator import PaginationView
 from utilities.ttg import Truths
 
@@ -119,12 +120,14 @@ def _prepare_input(text: str) -> str:
     return text
 
 
-def _process_image(data: bytes, out_file: BinaryIO) -> None:
+def _process_image(data: bytes) -> bytes:
     image = Image.open(io.BytesIO(data)).convert("RGBA")
     width, height = image.size
     background = Image.new("RGBA", (width + 2 * PAD, height + 2 * PAD), "WHITE")
     background.paste(image, (PAD, PAD), image)
-    background.save(out_file)
+    out_file = io.BytesIO()
+    background.save(out_file, format="PNG")
+    return out_file.getvalue()
 
 
 class InvalidLatexError(Exception):
@@ -135,7 +138,6 @@ class InvalidLatexError(Exception):
         self.logs = logs
 
 
-@ToAsync()
 def _create_qr(
     text: str,
     *,
@@ -143,7 +145,7 @@ def _create_qr(
     board_size: Optional[int] = 10,
     border: Optional[int] = 4,
     **kw,
-) -> str:
+) -> bytes:
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
@@ -153,9 +155,9 @@ def _create_qr(
     qr.add_data(text)
     qr.make(fit=True)
     img = qr.make_image(fill_color="black", back_color="white", **kw)
-    _timestamp = int(datetime.datetime.utcnow().timestamp())  # float float
-    img.save(f"temp/{_timestamp}.png")
-    return f"temp/{_timestamp}.png"
+    buffer = io.BytesIO()
+    img.save(buffer)
+    return buffer.getvalue()
 
 
 class QRCodeFlags(
@@ -194,20 +196,21 @@ class Misc(Cog):
 
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.snipes = {}
+        # snapshots, bounded in number and age
+        self.snipes = bot.snipes
 
-        @bot.listen("on_message_delete")
-        async def on_message_delete(msg):
-            if msg.author.bot:
-                return
-            self.snipes[msg.channel.id] = msg
+    @Cog.listener()
+    async def on_message_delete(self, msg: discord.Message):
+        if msg.author.bot:
+            return
+        self.snipes.deleted(msg)
 
-        @bot.listen("on_message_edit")
-        async def on_message_edit(before, after):
-            if before.author.bot or after.author.bot:
-                return
-            if before.content != after.content:
-                self.snipes[before.channel.id] = [before, after]
+    @Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        if before.author.bot or after.author.bot:
+            return
+        if before.content != after.content:
+            self.snipes.edited(before, after)
 
     async def wiki_request(
         self, channel: discord.TextChannel, search: str
@@ -257,24 +260,27 @@ class Misc(Cog):
         async with self.bot.http_session.get(
             f"{LATEX_API_URL}/{response_json['filename']}", raise_for_status=True
         ) as response:
-            _process_image(await response.read(), out_file)
+            data = await response.read()
+        image = await self.bot.renderer.render("latex", _process_image, data)
+        out_file.write(image)
 
     async def _upload_to_pastebin(
         self, text: str, lang: str = "txt"
     ) -> Optional[str]:
         """Uploads `text` to the paste service, returning the url if successful."""
-        async with aiohttp.ClientSession() as aioclient:
-            post = await aioclient.post("https://hastebin.com/documents", data=text)
-            if post.status == 200:
-                response = await post.text()
-                return f"https://hastebin.com/{response[8:-2]}"
-
-            # Rollback bin
-            post = await aioclient.post(
-                "https://bin.readthedocs.fr/new", data={"code": text, "lang": lang}
-            )
-            if post.status == 200:
-                return str(post.url)
+        post = await self.bot.http_session.post(
+            "https://hastebin.com/documents", data=text
+        )
+        if post.status == 200:
+            response = await post.text()
+            return f"https://hastebin.com/{response[8:-2]}"
+
+        # Rollback bin
+        post = await self.bot.http_session.post(
+            "https://bin.readthedocs.fr/new", data={"code": text, "lang": lang}
+        )
+        if post.status == 200:
+            return str(post.url)
 
     @commands.command()
     @commands.max_concurrency(1, commands.BucketType.guild, wait=True)
@@ -326,12 +332,11 @@ class Misc(Cog):
         new_text = urllib.parse.quote(text)
         link = "http://twitch.center/customapi/math?expr=" + new_text
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.text()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.text()
+            else:
+                return
         embed = discord.Embed(
             title="Calculated!!",
             description=f"```ini\n[Answer is: {res}]```",
@@ -385,14 +390,13 @@ class Misc(Cog):
         """
         new_expression = urllib.parse.quote(expression)
         link = f"https://newton.now.sh/api/v2/{operation}/{new_expression}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return await ctx.reply(
-                        f"{ctx.author.mention} invalid **{expression}** or either **{operation}**"
-                    )
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return await ctx.reply(
+                    f"{ctx.author.mention} invalid **{expression}** or either **{operation}**"
+                )
         result = res["result"]
         embed = discord.Embed(
             title="Calculated!!",
@@ -418,7 +422,7 @@ class Misc(Cog):
                 f"{ctx.author.mention} **{nat}** is not a valid country code."
             )
         link = f"http://newsapi.org/v2/top-headlines?country={nat}&apiKey={NEWS_KEY}"
-        r = await self.bot.session.get(link)
+        r = await self.bot.http_session.get(link)
         res = await r.json()
 
         if res["status"].upper() != "OK":
@@ -466,7 +470,7 @@ class Misc(Cog):
             safe = "active"
         url = f"https://www.googleapis.com/customsearch/v1?key={google_key}&cx={cx}&q={search}&safe={safe}"
 
-        response = await self.bot.session.get(url)
+        response = await self.bot.http_session.get(url)
         if response.status == 200:
             json_ = await response.json()
         else:
@@ -496,36 +500,32 @@ class Misc(Cog):
     @Context.with_type
     async def snipe(self, ctx: Context):
         """Snipes someone's message that's deleted"""
-        snipe = self.snipes.get(ctx.channel.id)
+        snipe = self.snipes.pop(ctx.channel.id)
         if snipe is None:
             return await ctx.reply(f"{ctx.author.mention} no snipes in this channel!")
         # there's gonna be a snipe after this point
         emb = discord.Embed()
-        if isinstance(snipe, Iterable):  # edit snipe
-            emb.set_author(
-                name=str(snipe[0].author), icon_url=snipe[0].author.display_avatar.url
-            )
-            emb.colour = snipe[0].author.colour
+        if isinstance(snipe, tuple):  # edit snipe
+            before, after = snipe
+            emb.set_author(name=before.author_name, icon_url=before.author_avatar)
+            emb.colour = before.author_colour
             emb.add_field(
-                name="Before", value=self.sanitise(snipe[0].content), inline=False
+                name="Before", value=self.sanitise(before.content), inline=False
             )
             emb.add_field(
-                name="After", value=self.sanitise(snipe[1].content), inline=False
+                name="After", value=self.sanitise(after.content), inline=False
             )
-            emb.timestamp = snipe[0].created_at
+            emb.timestamp = before.created_at
         else:  # delete snipe
-            emb.set_author(
-                name=str(snipe.author), icon_url=snipe.author.display_avatar.url
-            )
+            emb.set_author(name=snipe.author_name, icon_url=snipe.author_avatar)
             emb.description = f"{self.sanitise(snipe.content)}"  # fuck you pycord
-            emb.colour = snipe.author.colour
+            emb.colour = snipe.author_colour
             emb.timestamp = snipe.created_at
             emb.set_footer(
                 text=f"Message sniped by {str(ctx.author)}",
                 icon_url=ctx.author.display_avatar.url,
             )
         await ctx.reply(embed=emb)
-        self.snipes[ctx.channel.id] = None
 
     @commands.command(
         aliases=["trutht", "tt", "ttable"],
@@ -574,14 +574,13 @@ class Misc(Cog):
         )
 
         loc = loc.capitalize()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return await ctx.reply(
-                        f"{ctx.author.mention} no location named, **{location}**"
-                    )
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return await ctx.reply(
+                    f"{ctx.author.mention} no location named, **{location}**"
+                )
 
         lat = res["coord"]["lat"]
         lon = res["coord"]["lon"]
@@ -653,7 +652,9 @@ class Misc(Cog):
         self, ctx: Context, limit: Optional[int] = None, *, query: str
     ):
         """Search for videos on YouTube"""
-        results = await YoutubeSearch(query, max_results=limit or 5).to_json()
+        results = await YoutubeSearch(
+            query, max_results=limit or 5, session=self.bot.http_session
+        ).to_json()
         main = json.loads(results)
 
         em_list = []
@@ -833,10 +834,9 @@ class Misc(Cog):
             return await ctx.reply(
                 f"{ctx.author.mention} can not provide more than 10 options"
             )
-        async with aiohttp.ClientSession() as session:
-            poll = await session.post(
-                BASE_URL, json=data, headers={"API-KEY": os.environ["STRAW_POLL"]}
-            )
+        poll = await self.bot.http_session.post(
+            BASE_URL, json=data, headers={"API-KEY": os.environ["STRAW_POLL"]}
+        )
 
         data = await poll.json()
         _exists = await collection.find_one_and_update(
@@ -862,8 +862,9 @@ class Misc(Cog):
         """To get the poll data"""
         URL = f"https://strawpoll.com/api/poll/{content_id}"
 
-        async with aiohttp.ClientSession() as session:
-            poll = await session.get(URL, headers={"API-KEY": os.environ["STRAW_POLL"]})
+        poll = await self.bot.http_session.get(
+            URL, headers={"API-KEY": os.environ["STRAW_POLL"]}
+        )
         try:
             data = await poll.json()
         except json.decoder.JSONDecodeError:
@@ -894,12 +895,11 @@ class Misc(Cog):
         if not _exists:
             return
         URL = "https://strawpoll.com/api/content/delete"
-        async with aiohttp.ClientSession() as session:
-            await session.delete(
-                URL,
-                data={"content_id": content_id},
-                headers={"API-KEY": os.environ["STRAW_POLL"]},
-            )
+        await self.bot.http_session.delete(
+            URL,
+            data={"content_id": content_id},
+            headers={"API-KEY": os.environ["STRAW_POLL"]},
+        )
         await ctx.reply(f"{ctx.author.mention} deleted")
 
     @commands.command(name="orc")
@@ -912,8 +912,7 @@ class Misc(Cog):
         if not link:
             await ctx.reply(f"{ctx.author.mention} must provide the link")
         try:
-            async with aiohttp.ClientSession() as session:
-                res = await session.get(link)
+            res = await self.bot.http_session.get(link)
         except Exception as e:
             return await ctx.reply(
                 f"{ctx.author.mention} something not right. Error raised {e}"
@@ -947,8 +946,10 @@ class Misc(Cog):
             payload["image_factory"] = StyledPilImage
         payload["board_size"] = flags.board_size
         payload["border"] = flags.border
-        path = await _create_qr(text, **payload)
-        f = discord.File(path, filename="name.png")
+        image = await self.bot.renderer.render(
+            "qr", partial(_create_qr, text, **payload)
+        )
+        f = discord.File(io.BytesIO(image), filename="name.png")
         e = discord.Embed().set_image(url="attachment://name.png")
         await ctx.reply(embed=e, file=f)
 
@@ -965,9 +966,8 @@ class Misc(Cog):
         else:
             link = f"https://api.mcsrvstat.us/2/{address}"
 
-        async with aiohttp.ClientSession() as session:
-            res = await session.get(link)
-            data = await res.json()
+        res = await self.bot.http_session.get(link)
+        data = await res.json()
         try:
             if data["online"]:
                 ip = data["ip"]
@@ -1002,7 +1002,7 @@ class Misc(Cog):
     @commands.bot_has_permissions(embed_links=True)
     async def currencies(self, ctx: Context):
         """To see the currencies notations with names"""
-        obj = await self.bot.session.get("https://api.coinbase.com/v2/currencies")
+        obj = await self.bot.http_session.get("https://api.coinbase.com/v2/currencies")
         data = await obj.json()
         entries = [f"`{temp['id']}` `{temp['name']}`" for temp in data["data"]]
         p = SimplePages(entries, ctx=ctx)
@@ -1016,7 +1016,7 @@ class Misc(Cog):
             return await ctx.send(
                 f"{ctx.author.mention} please provide a **valid currency!**"
             )
-        obj = await self.bot.session.get(
+        obj = await self.bot.http_session.get(
             f"https://api.coinbase.com/v2/exchange-rates?currency={currency}"
         )
         data: dict = await obj.json()
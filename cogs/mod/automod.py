@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import random
+import re
+from time import perf_counter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from discord.ext import commands
+import discord
+import emojis
+
+from core import Parrot, Cog, Context
+
+from utilities.infraction import warn
+from utilities.regex import LINKS_NO_PROTOCOLS, LINKS_RE
+from utilities.wordfilter import get_matcher
+
+with open("extra/duke_nekum.txt") as f:
+    quotes = f.read().split("\n")
+
+CUSTOM_EMOJI_RE = re.compile(
+    r"<(?P<animated>a?):(?P<name>[a-zA-Z0-9_]{2,32}):(?P<id>[0-9]{18,22})>"
+)
+CAPS_RE = re.compile(r"[A-Z]")
+
+
+class Rule:
+    """A single automod rule, compiled from the guild config."""
+
+    name: str = ""
+    label: str = ""
+    reason: str = ""
+
+    # spam deletes the burst of messages, not only the current one
+    purge: bool = False
+    # whether edited messages are checked again
+    on_edit: bool = True
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        autowarn = settings.get("autowarn") or {}
+        self.ignore: FrozenSet[int] = frozenset(settings.get("channel") or [])
+        self.to_delete: bool = autowarn.get("to_delete", True)
+        self.to_warn: bool = autowarn.get("enable", False)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} delete={self.to_delete} warn={self.to_warn}>"
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional[Rule]:
+        """Returns None if the rule is disabled or not configured"""
+        if not settings.get("enable"):
+            return None
+        return cls(settings)
+
+    def check(self, message: discord.Message) -> bool:
+        raise NotImplementedError
+
+
+class SpamRule(Rule):
+    name = "spam"
+    label = "Spam Protection"
+    reason = "Spammed 5 messages in 5 seconds"
+    purge = True
+    # editing a message is not sending a new one
+    on_edit = False
+
+    # the counters are the cog's, they must outlive config recompiles
+    cd_mapping: commands.CooldownMapping
+
+    def check(self, message: discord.Message) -> bool:
+        bucket = self.cd_mapping.get_bucket(message)
+        return bool(bucket.update_rate_limit())
+
+
+class LinkRule(Rule):
+    name = "antilinks"
+    label = "Links Protection"
+    reason = "Links posted"
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        super().__init__(settings)
+        self.whitelist: Tuple[str, ...] = tuple(settings.get("whitelist") or [])
+
+    def check(self, message: discord.Message) -> bool:
+        content = message.content
+        if self.whitelist and any(temp in content for temp in self.whitelist):
+            return False
+        return bool(LINKS_RE.search(content) or LINKS_NO_PROTOCOLS.search(content))
+
+
+class ProfanityRule(Rule):
+    name = "profanity"
+    label = "Blacklisted Word"
+    reason = "Bad words usage"
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        super().__init__(settings)
+        self.matcher = get_matcher(settings.get("words") or [])
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional[Rule]:
+        if not settings.get("enable") or not settings.get("words"):
+            return None
+        return cls(settings)
+
+    def check(self, message: discord.Message) -> bool:
+        return self.matcher.search(message.content) is not None
+
+
+class _LimitRule(Rule):
+    key = "limit"
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        super().__init__(settings)
+        self.limit: int = settings[self.key]
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional[Rule]:
+        if not settings.get("enable") or not settings.get(cls.key):
+            return None
+        return cls(settings)
+
+
+class CapsRule(_LimitRule):
+    name = "caps"
+    label = "Excess Caps"
+    reason = "Excess Caps"
+
+    def check(self, message: discord.Message) -> bool:
+        return len(CAPS_RE.findall(message.content)) >= self.limit
+
+
+class EmojiRule(_LimitRule):
+    name = "emoji"
+    label = "Excess Emoji"
+    reason = "Mass Emoji"
+
+    def check(self, message: discord.Message) -> bool:
+        content = message.content
+        count = emojis.count(content) + len(CUSTOM_EMOJI_RE.findall(content))
+        return count >= self.limit
+
+
+class MentionRule(_LimitRule):
+    name = "mention"
+    label = "Mass Mention"
+    reason = "Mass Mention"
+    key = "count"
+
+    def check(self, message: discord.Message) -> bool:
+        return len(message.mentions) >= self.limit
+
+
+RULES = (SpamRule, LinkRule, ProfanityRule, CapsRule, EmojiRule, MentionRule)
+
+
+class RuleSet:
+    """All the enabled automod rules of a guild, compiled once per config"""
+
+    __slots__ = ("source", "rules")
+
+    def __init__(
+        self, source: Dict[str, Any], *, spam_cooldown: commands.CooldownMapping
+    ) -> None:
+        # the config document the rules were compiled from. The config cache
+        # replaces the document on every update, so identity is enough to
+        # know when to recompile.
+        self.source = source
+        automod = source.get("automod") or {}
+        self.rules: List[Rule] = []
+        for cls in RULES:
+            if rule := cls.from_settings(automod.get(cls.name) or {}):
+                if isinstance(rule, SpamRule):
+                    rule.cd_mapping = spam_cooldown
+                self.rules.append(rule)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+
+class Automod(Cog):
+    """Automoderation engine, evaluates every enabled rule in one pass"""
+
+    def __init__(self, bot: Parrot) -> None:
+        self.bot = bot
+        self.rule_sets: Dict[int, RuleSet] = {}
+        # kept here, a warn updates the config and recompiles the rule set
+        self.spam_cooldown = commands.CooldownMapping.from_cooldown(
+            5, 5, commands.BucketType.member
+        )
+        # rule name -> [evaluations, total seconds, max seconds, triggered]
+        self.latency: Dict[str, List[Any]] = {
+            cls.name: [0, 0.0, 0.0, 0] for cls in RULES
+        }
+
+    async def get_rule_set(self, guild: discord.Guild) -> RuleSet:
+        data = await self.bot.server_config.fetch(guild.id)
+        rule_set = self.rule_sets.get(guild.id)
+        if rule_set is None or rule_set.source is not data:
+            rule_set = self.rule_sets[guild.id] = RuleSet(
+                data, spam_cooldown=self.spam_cooldown
+            )
+        return rule_set
+
+    def evaluate(
+        self, rule_set: RuleSet, message: discord.Message, *, edited: bool = False
+    ) -> List[Rule]:
+        """Run every rule over the message, returns the triggered rules"""
+        triggered = []
+        channel_id = message.channel.id
+        for rule in rule_set.rules:
+            if channel_id in rule.ignore or (edited and not rule.on_edit):
+                continue
+            ini = perf_counter()
+            hit = rule.check(message)
+            elapsed = perf_counter() - ini
+
+            stats = self.latency[rule.name]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            if hit:
+                stats[3] += 1
+                triggered.append(rule)
+        return triggered
+
+    async def delete(self, message: discord.Message, *, purge: bool) -> None:
+        if not purge:
+            await message.delete(delay=0)
+            return
+
+        def check(m: discord.Message):
+            return m.author.id == message.author.id
+
+        try:
+            await message.channel.purge(limit=5, check=check)
+        except discord.Forbidden:
+            pass
+
+    async def take_action(self, message: discord.Message, triggered: List[Rule]) -> None:
+        """One delete, one warn and one notice, whatever the number of rules triggered"""
+        to_delete = [rule for rule in triggered if rule.to_delete]
+        to_warn = any(rule.to_warn for rule in triggered)
+
+        if to_delete:
+            await self.delete(message, purge=any(rule.purge for rule in to_delete))
+
+        if to_warn:
+            await warn(
+                message.guild,
+                message.author,
+                f"Automod: {', '.join(rule.reason for rule in triggered)}",
+                moderator=self.bot.user,
+                message=message,
+                at=message.created_at.timestamp(),
+            )
+            ctx = await self.bot.get_context(message, cls=Context)
+            await self.bot.get_cog("Moderator").warn_task(
+                target=message.author, ctx=ctx
+            )
+
+        labels = "".join(f"[{rule.label}] " for rule in triggered)
+        await message.channel.send(
+            f"{message.author.mention} *{random.choice(quotes)}* **{labels}{'[Warning]' if to_warn else ''}**",
+            delete_after=10,
+        )
+
+    async def _on_message_passive(
+        self, message: discord.Message, *, edited: bool = False
+    ) -> None:
+        if message.author.bot or (not message.guild):
+            return
+        perms = message.author.guild_permissions
+
+        if perms.administrator or perms.manage_messages or perms.manage_channels:
+            return
+
+        rule_set = await self.get_rule_set(message.guild)
+        if not rule_set:
+            return
+
+        if triggered := self.evaluate(rule_set, message, edited=edited):
+            await self.take_action(message, triggered)
+
+    @Cog.listener()
+    async def on_message(self, message: discord.Message):
+        await self._on_message_passive(message)
+
+    @Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        if before.content != after.content:
+            await self._on_message_passive(after, edited=True)
+
+    @Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.rule_sets.pop(guild.id, None)
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "evaluations": count,
+                "triggered": hits,
+                "avg_us": round(total / count * 1e6, 2) if count else 0.0,
+                "max_us": round(peak * 1e6, 2),
+            }
+            for name, (count, total, peak, hits) in self.latency.items()
+        }
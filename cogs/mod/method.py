@@ -6,7 +6,6 @@ from utilities.database import parrot_db
 
 import discord
 import asyncio
-import aiohttp
 
 collection = parrot_db["server_config"]
 ban_collection = parrot_db["banned_members"]
@@ -952,9 +951,8 @@ async def _emoji_delete(guild, command_name, ctx, destination, emojis, reason):
 async def _emoji_add(guild, command_name, ctx, destination, emojis, reason):
     for emoji in emojis:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(emoji.url) as res:
-                    raw = await res.read()
+            async with ctx.bot.http_session.get(emoji.url) as res:
+                raw = await res.read()
             ej = await guild.create_custom_emoji(
                 name=emoji.name,
                 image=raw,
@@ -972,9 +970,8 @@ async def _emoji_addurl(
     guild, command_name, ctx, destination, url, name, reason
 ):
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as res:
-                raw = await res.read()
+        async with ctx.bot.http_session.get(url) as res:
+            raw = await res.read()
         emoji = await guild.create_custom_emoji(
             name=name,
             image=raw,
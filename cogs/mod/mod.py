@@ -965,9 +965,6 @@ class Moderator(Cog):
     ):
         """Why to learn the commands. This is all in one mod command."""
 
-        def check_msg(m):
-            return m.author == ctx.author and m.channel == ctx.channel
-
         if not target:
             return await ctx.send_help(ctx.command)
         guild = ctx.guild
@@ -1071,7 +1068,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Role, [ID, NAME, MENTION]"
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=30, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=30
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 role = await commands.RoleConverter().convert(ctx, m.content)
@@ -1092,7 +1091,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Role, [ID, NAME, MENTION]"
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=30, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=30
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 role = await commands.RoleConverter().convert(ctx, m.content)
@@ -1114,7 +1115,9 @@ class Moderator(Cog):
                     delete_after=30,
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=30, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=30
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
 
@@ -1151,9 +1154,6 @@ class Moderator(Cog):
                     and reaction.message.id == msg.id
                 )
 
-            def check_msg(m):
-                return m.author == ctx.author and m.channel == ctx.channel
-
             try:
                 reaction, user = await self.bot.wait_for(
                     "reaction_add", timeout=60.0, check=check
@@ -1178,7 +1178,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Channel Topic", delete_after=60
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=60, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=60
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 await mt._change_channel_topic(
@@ -1196,7 +1198,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Channel Name", delete_after=60
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=60, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=60
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 await mt._change_channel_name(
@@ -1263,7 +1267,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Channel Name", delete_after=60
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=60, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=60
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 await mt._change_channel_name(
@@ -1336,7 +1342,9 @@ class Moderator(Cog):
                     delete_after=60,
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=60, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=60
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 try:
@@ -1360,7 +1368,9 @@ class Moderator(Cog):
                     f"{ctx.author.mention} Enter the Role Name", delete_after=60
                 )
                 try:
-                    m = await self.bot.wait_for("message", timeout=60, check=check_msg)
+                    m = await self.bot.wait_for_message(
+                        ctx.channel, author=ctx.author, timeout=60
+                    )
                 except asyncio.TimeoutError:
                     return await msg.delete(delay=0)
                 await mt._change_role_name(
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import os
 
+import aiohttp
+
 from datetime import datetime
 import discord
-import aiohttp
 from discord.ext import commands
 
 from utilities.paginator import PaginationView
@@ -56,12 +57,11 @@ class NASA(Cog):
         """Asteroid Picture of the Day"""
         link = f"https://api.nasa.gov/planetary/apod?api_key={NASA_KEY}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        # the picture changes once a day
+        try:
+            res = await self.bot.http_session.fetch(link, ttl=1800)
+        except aiohttp.ClientResponseError:
+            return
 
         title = res["title"]
         expln = res["explanation"]
@@ -92,12 +92,11 @@ class NASA(Cog):
         """Earth Polychromatic Imaging Camera. Date must be in "YYYY-MM-DD" format"""
         s_link = f"https://epic.gsfc.nasa.gov/api/images.php?date={date}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(s_link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(s_link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         em_list = []
         for index in range(0, len(res)):
@@ -131,12 +130,11 @@ class NASA(Cog):
         """You can literally find any asteroid in the space by date. Date must be in "YYYY-MM-DD" format"""
         link = f"https://api.nasa.gov/neo/rest/v1/feed?start_date={start}&end_date={end}&api_key={NASA_KEY}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         em_list = []
 
         for date in res["near_earth_objects"]:
@@ -213,12 +211,11 @@ class NASA(Cog):
         """Find any asteroid in the space by ID. "$help findaid" for syntax"""
         link = f"https://api.nasa.gov/neo/rest/v1/neo/{id}?api_key={NASA_KEY}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
         name = res["name"]
         link_self = res["nasa_jpl_url"]
 
@@ -259,12 +256,11 @@ class NASA(Cog):
         """Mars Rovers Pictures. Date must be in "YYYY-MM-DD" format"""
         link = f"https://api.nasa.gov/mars-photos/api/v1/rovers/curiosity/photos?earth_date={date}&api_key={NASA_KEY}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
+        async with self.bot.http_session.get(link) as r:
+            if r.status == 200:
+                res = await r.json()
+            else:
+                return
 
         em_list = []
 
@@ -299,13 +295,12 @@ class NASA(Cog):
     async def nasasearch(self, ctx: Context, *, string: commands.clean_content):
         """NASA Image and Video Library"""
         link = f"https://images-api.nasa.gov/search?q={string}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                if r.status >= 300:
-                    return await ctx.reply(
-                        f"{ctx.author.mention} could not find **{string}** in NASA Image and Video Library | Http status: {r.status}"
-                    )
-                res = await r.json()
+        async with self.bot.http_session.get(link) as r:
+            if r.status >= 300:
+                return await ctx.reply(
+                    f"{ctx.author.mention} could not find **{string}** in NASA Image and Video Library | Http status: {r.status}"
+                )
+            res = await r.json()
 
         if not res["collection"]["items"]:
             await ctx.reply(
@@ -317,12 +312,11 @@ class NASA(Cog):
             description = res["collection"]["items"][index]["data"][0]["description"]
             preview = res["collection"]["items"][index]["links"][0]["href"]
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get() as r:
-                    if r.status == 200:
-                        media = r.json()
-                    else:
-                        pass
+            async with self.bot.http_session.get() as r:
+                if r.status == 200:
+                    media = r.json()
+                else:
+                    pass
             img, vid, srt = [], [], []
             i, j, k = 1, 1, 1
             for link in media:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import discord
-import aiohttp
 import datetime
 import time
 from discord.ext import commands
 
 from core import Parrot, Context, Cog
 
+NEKOBOT_URL = "https://nekobot.xyz/api/image"
+
 
 class NSFW(Cog):
     """Want some fun? These are best commands! :') :warning: 18+"""
@@ -25,17 +26,11 @@ class NSFW(Cog):
     @Context.with_type
     async def anal(self, ctx: Context):
         """To get Random Anal"""
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "anal"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "anal"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(title="Anal", timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -51,17 +46,11 @@ class NSFW(Cog):
         """
         To get Random GoneWild
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "gonewild"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "gonewild"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -75,17 +64,11 @@ class NSFW(Cog):
     @Context.with_type
     async def hanal(self, ctx: Context):
         """To get Random Hentai Anal"""
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hanal"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hanal"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -99,17 +82,11 @@ class NSFW(Cog):
     @Context.with_type
     async def hentai(self, ctx: Context):
         """To get Random Hentai"""
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hentai"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hentai"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -125,17 +102,11 @@ class NSFW(Cog):
         """
         To get Random Holo
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "holo"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "holo"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -151,17 +122,11 @@ class NSFW(Cog):
         """
         To get Random Neko
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "neko"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "neko"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -177,17 +142,11 @@ class NSFW(Cog):
         """
         To get Random Hneko
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hneko"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hneko"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -203,17 +162,11 @@ class NSFW(Cog):
         """
         To get Random Hkitsune
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hkitsune"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hkitsune"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -229,17 +182,11 @@ class NSFW(Cog):
         """
         To get Random Kemonomimi
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "kemonomimi"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "kemonomimi"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -255,17 +202,11 @@ class NSFW(Cog):
         """
         To get Random PornGif
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "pgif"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "pgif"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -281,17 +222,11 @@ class NSFW(Cog):
         """
         To get Random 4k
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "4k"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "4k"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -307,17 +242,11 @@ class NSFW(Cog):
         """
         To get Random Kanna
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "kanna"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "kanna"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -333,17 +262,11 @@ class NSFW(Cog):
         """
         To get Random Ass
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "ass"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "ass"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -359,17 +282,11 @@ class NSFW(Cog):
         """
         To get Random Pussy
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "pussy"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "pussy"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -385,17 +302,11 @@ class NSFW(Cog):
         """
         To get Random Thigh
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "thigh"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "thigh"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -411,17 +322,11 @@ class NSFW(Cog):
         """
         To get Random Hentai Thigh
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hthigh"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hthigh"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -437,17 +342,11 @@ class NSFW(Cog):
         """
         To get Random Paizuri
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "paizuri"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "paizuri"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -463,17 +362,11 @@ class NSFW(Cog):
         """
         To get Random Tentacle Porn
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "tentacle"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "tentacle"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -489,17 +382,11 @@ class NSFW(Cog):
         """
         To get Random Boobs
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "boobs"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "boobs"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -515,17 +402,11 @@ class NSFW(Cog):
         """
         To get Random Hentai Boobs
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hboobs"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hboobs"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -541,17 +422,11 @@ class NSFW(Cog):
         """
         To get Random Yaoi
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "yaoi"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "yaoi"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -567,17 +442,11 @@ class NSFW(Cog):
         """
         To get Random Hmidriff
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hmidriff"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hmidriff"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -593,17 +462,11 @@ class NSFW(Cog):
         """
         To get Random Hentai Ass
         """
-        url = "https://nekobot.xyz/api/image"
-        params = {"type": "hass"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["message"]
+        img = await self.bot.media_prefetch.get(
+            NEKOBOT_URL, params={"type": "hass"}, field="message"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
@@ -624,12 +487,11 @@ class NSFW(Cog):
         end = time.time() + 60
         while time.time() < end:
             url = f"https://memes.blademaker.tv/api/{subreddit}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as r:
-                    if r.status == 200:
-                        res = await r.json()
-                    else:
-                        return
+            async with self.bot.http_session.get(url) as r:
+                if r.status == 200:
+                    res = await r.json()
+                else:
+                    return
             if res["nsfw"]:
                 break
 
@@ -649,14 +511,11 @@ class NSFW(Cog):
         """
         Best command I guess. It return random ^^
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get("https://scathach.redsplit.org/v3/nsfw/gif/") as r:
-                if r.status == 200:
-                    res = await r.json()
-                else:
-                    return
-
-        img = res["url"]
+        img = await self.bot.media_prefetch.get(
+            "https://scathach.redsplit.org/v3/nsfw/gif/"
+        )
+        if img is None:
+            return
 
         em = discord.Embed(timestamp=datetime.datetime.utcnow())
         em.set_footer(text=f"{ctx.author.name}")
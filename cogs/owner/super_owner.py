@@ -7,19 +7,19 @@ from aiofile import async_open
 from discord.ext import commands
 import discord
 
-import aiohttp
 import datetime
 import os
+import psutil
 import traceback
 import typing
 
-from utilities.database import ban, unban, parrot_db
+from utilities.database import ban, unban
+from utilities.http import BUCKETS
+from utilities.sphinx_index import SphinxIndex
 import re
 import io
-import zlib
 import json
 
-from . import fuzzy
 from collections import Counter
 from utilities.paginator import PaginationView
 from utilities.time import ShortTime
@@ -138,9 +138,8 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
     @Context.with_type
     async def gitload(self, ctx: Context, *, link: str):
         """To load the cog extension from github"""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(link) as r:
-                data = await r.read()
+        async with self.bot.http_session.get(link) as r:
+            data = await r.read()
         name = f"temp/temp{self.count}"
         name_cog = f"temp.temp{self.count}"
         try:
@@ -270,7 +269,7 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
             "searchType": "image",
         }
         url = f"https://www.googleapis.com/customsearch/v1"
-        res = await self.bot.session.get(url, params=params)
+        res = await self.bot.http_session.get(url, params=params)
         data = await res.json()
         ls = []
         for i in data["items"]:
@@ -304,7 +303,7 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
         guild = guild or ctx.guild
         channel_member = channel_member or "members"
         URL = f"https://discord.com/api/guilds/{guild.id if isinstance(guild, discord.Guild) else guild}/widget.json"
-        data = await self.bot.session.get(URL)
+        data = await self.bot.http_session.get(URL)
         json = await data.json()
         if "message" in json:
             return await ctx.reply(f"{ctx.author.mention} can not spy that server")
@@ -377,10 +376,10 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
     @commands.is_owner()
     async def removebg(self, ctx: Context, *, url):
         """To remove the background from image"""
-        async with self.bot.session.get(url) as img:
+        async with self.bot.http_session.get(url) as img:
             imgdata = io.BytesIO(await img.read())
 
-        response = await self.bot.session.post(
+        response = await self.bot.http_session.post(
             "https://api.remove.bg/v1.0/removebg",
             data={"size": "auto", "image_file": imgdata},
             headers={"X-Api-Key": f'{os.environ["REMOVE_BG"]}'},
@@ -424,22 +423,205 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
     @commands.command()
     @commands.is_owner()
     async def announce_global(self, ctx: Context, *, announcement: str):
-        collection = parrot_db["global_chat"]
-        async for webhook in collection.find({}):
-            hook = webhook["webhook"]
-            if hook:
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        webhook = discord.Webhook.from_url(f"{hook}", session=session)
-                        if webhook:
-                            await webhook.send(
-                                content=announcement,
-                                username=f"SERVER",
-                                avatar_url=self.bot.user.display_avatar.url,
-                                allowed_mentions=discord.AllowedMentions.none(),
-                            )
-                except Exception as e:
-                    print(e)
+        await self.bot.global_chat.broadcast(
+            content=announcement,
+            username=f"SERVER",
+            avatar_url=self.bot.user.display_avatar.url,
+            allowed_mentions=discord.AllowedMentions.none(),
+        )
+
+    @commands.group(invoke_without_command=True)
+    @commands.is_owner()
+    async def metrics(self, ctx: Context):
+        """To view the internal metrics of the bot"""
+        if ctx.invoked_subcommand is None:
+            await self.bot.invoke_help_command(ctx)
+
+    @metrics.command(name="config")
+    @commands.is_owner()
+    async def metrics_config(self, ctx: Context):
+        """Guild config cache usage"""
+        stats = self.bot.server_config.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="automod")
+    @commands.is_owner()
+    async def metrics_automod(self, ctx: Context):
+        """Per rule evaluation latency of automod"""
+        stats = self.bot.get_cog("Automod").stats
+        main = "\n".join(
+            f"{name:<10}: {', '.join(f'{k}={v}' for k, v in data.items())}"
+            for name, data in stats.items()
+        )
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="timers")
+    @commands.is_owner()
+    async def metrics_timers(self, ctx: Context):
+        """Timer scheduler state"""
+        stats = self.bot.get_cog("Utils").scheduler.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="globalchat")
+    @commands.is_owner()
+    async def metrics_globalchat(self, ctx: Context):
+        """Global chat fan-out latency and failures"""
+        stats = self.bot.global_chat.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="afk")
+    @commands.is_owner()
+    async def metrics_afk(self, ctx: Context):
+        """AFK index size and lookups"""
+        stats = self.bot.afk.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="logs")
+    @commands.is_owner()
+    async def metrics_logs(self, ctx: Context):
+        """Logging webhook sends and coalesced entries"""
+        stats = self.bot.log_webhooks.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="http")
+    @commands.is_owner()
+    async def metrics_http(self, ctx: Context):
+        """Shared HTTP client usage and the busiest endpoints"""
+        stats = self.bot.http_session.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        buckets = "/".join(
+            "inf" if b == float("inf") else f"{int(b * 1000)}" for b in BUCKETS
+        )
+        lines = [main, "", f"[endpoint] requests avg_ms | <= {buckets} ms"]
+        for endpoint, count, avg, hist in self.bot.http_session.histograms():
+            lines.append(endpoint)
+            lines.append(f"  {count} {avg * 1000:.0f} | {' '.join(map(str, hist))}")
+        main = "\n".join(lines)
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="render")
+    @commands.is_owner()
+    async def metrics_render(self, ctx: Context):
+        """Image renderer queue and per effect timings"""
+        stats = self.bot.renderer.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        lines = [main, "", "effect: renders avg_ms max_ms wait_ms"]
+        for name, count, avg, longest, wait in self.bot.renderer.timings():
+            lines.append(
+                f"{name}: {count} {avg * 1000:.0f} {longest * 1000:.0f} {wait * 1000:.0f}"
+            )
+        main = "\n".join(lines)
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="assets")
+    @commands.is_owner()
+    async def metrics_assets(self, ctx: Context):
+        """Avatar and rendered image cache size and hit rate"""
+        stats = self.bot.asset_cache.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="games")
+    @commands.is_owner()
+    async def metrics_games(self, ctx: Context):
+        """Game AI searches, per game timings and depth"""
+        stats = self.bot.game_ai.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        lines = [main, "", "game: searches avg_ms max_ms nodes depth"]
+        for name, count, avg, longest, nodes, depth in self.bot.game_ai.timings():
+            lines.append(
+                f"{name}: {count} {avg * 1000:.0f} {longest * 1000:.0f} {nodes} {depth:.1f}"
+            )
+        main = "\n".join(lines)
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="router")
+    @commands.is_owner()
+    async def metrics_router(self, ctx: Context):
+        """Routed messages, per handler dispatch counts and latency"""
+        stats = self.bot.message_router.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        lines = [main, "", "handler: calls errors avg_ms max_ms"]
+        for name, handler in self.bot.message_router.handler_stats().items():
+            lines.append(
+                f"{name}: {handler['calls']} {handler['errors']} "
+                f"{handler['avg_ms']} {handler['max_ms']}"
+            )
+        main = "\n".join(lines)
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="waiters")
+    @commands.is_owner()
+    async def metrics_waiters(self, ctx: Context):
+        """Pending message waiters and how many checks they cost"""
+        stats = self.bot.message_waiters.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="counting")
+    @commands.is_owner()
+    async def metrics_counting(self, ctx: Context):
+        """Counting channels in memory, counts and checkpoints"""
+        stats = self.bot.counting.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="memory")
+    @commands.is_owner()
+    async def metrics_memory(self, ctx: Context):
+        """Process memory and what the bounded caches hold"""
+        self.bot.snipes.purge()
+        self.bot.message_cache.purge()
+        memory = psutil.Process().memory_full_info()
+        snipes = self.bot.snipes.stats
+        messages = self.bot.message_cache.stats
+        stats = {
+            "rss": f"{memory.rss / 1024**2:.2f} MiB",
+            "uss": f"{memory.uss / 1024**2:.2f} MiB",
+            "snipes": f"{snipes['entries']}/{snipes['max_entries']}",
+            "snipe bytes": snipes["bytes"],
+            "snipe evicted": snipes["evictions"],
+            "snipe expired": snipes["expirations"],
+            "messages": f"{messages['entries']}/{messages['max_entries']}",
+            "message hits": messages["hit_ratio"],
+            "message evict": messages["evictions"],
+            "config bytes": self.bot.server_config.stats["bytes"],
+            "asset bytes": self.bot.asset_cache.stats["bytes"],
+        }
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="media")
+    @commands.is_owner()
+    async def metrics_media(self, ctx: Context):
+        """Random-media prefetch pool depth and hit rate"""
+        stats = self.bot.media_prefetch.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="rtfd")
+    @commands.is_owner()
+    async def metrics_rtfd(self, ctx: Context):
+        """Sphinx inventory index size, lookups and refreshes"""
+        cog = self.bot.get_cog("DiscordPy")
+        if cog is None:
+            return await ctx.send(f"{ctx.author.mention} DiscordPy cog is not loaded")
+        stats = cog.sphinx.stats
+        main = "\n".join(f"{k:<13}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
+
+    @metrics.command(name="writes")
+    @commands.is_owner()
+    async def metrics_writes(self, ctx: Context):
+        """Write-behind buffer flush sizes and lag"""
+        stats = self.bot.write_behind.stats
+        main = "\n".join(f"{k:<15}: {v}" for k, v in stats.items())
+        await ctx.send(f"```\n{main}```")
 
     @commands.command()
     async def python(self, ctx: Context, *, text: str):
@@ -453,128 +635,34 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
         await ctx.send(embed=discord.Embed(description=data))
 
 
-class SphinxObjectFileReader:
-    # Inspired by Sphinx's InventoryFileReader
-    BUFSIZE = 16 * 1024
-
-    def __init__(self, buffer):
-        self.stream = io.BytesIO(buffer)
-
-    def readline(self):
-        return self.stream.readline().decode("utf-8")
-
-    def skipline(self):
-        self.stream.readline()
-
-    def read_compressed_chunks(self):
-        decompressor = zlib.decompressobj()
-        while True:
-            chunk = self.stream.read(self.BUFSIZE)
-            if len(chunk) == 0:
-                break
-            yield decompressor.decompress(chunk)
-        yield decompressor.flush()
-
-    def read_compressed_lines(self):
-        buf = b""
-        for chunk in self.read_compressed_chunks():
-            buf += chunk
-            pos = buf.find(b"\n")
-            while pos != -1:
-                yield buf[:pos].decode("utf-8")
-                buf = buf[pos + 1 :]
-                pos = buf.find(b"\n")
-
-
 class DiscordPy(Cog, command_attrs=dict(hidden=True)):
     def __init__(self, bot: Parrot):
         self.bot = bot
         with open("extra/docs_links.json") as f:
             self.page_types = json.load(f)
+        self.sphinx = SphinxIndex(
+            "extra/sphinx_index.sqlite3", self.page_types, http=bot.http_session
+        )
+
+    def cog_unload(self) -> None:
+        self.sphinx.close()
+
+    @Cog.listener()
+    async def on_ready(self) -> None:
+        # loads the index from disk, then refreshes it in the background
+        self.sphinx.start()
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="dpy", id=596577034537402378)
 
-    def parse_object_inv(self, stream, url):
-        # key: URL
-        # n.b.: key doesn't have `discord` or `discord.ext.commands` namespaces
-        result = {}
-
-        # first line is version info
-        inv_version = stream.readline().rstrip()
-        _ = stream.readline().rstrip()[11:]
-
-        if inv_version != "# Sphinx inventory version 2":
-            raise RuntimeError("Invalid objects.inv file version.")
-
-        # next line is "# Project: <name>"
-        # then after that is "# Version: <version>"
-        projname = stream.readline().rstrip()[11:]
-
-        # next line says if it's a zlib header
-        line = stream.readline()
-        if "zlib" not in line:
-            raise RuntimeError("Invalid objects.inv file, not z-lib compatible.")
-
-        # This code mostly comes from the Sphinx repository.
-        entry_regex = re.compile(r"(?x)(.+?)\s+(\S*:\S*)\s+(-?\d+)\s+(\S+)\s+(.*)")
-        for line in stream.read_compressed_lines():
-            match = entry_regex.match(line.rstrip())
-            if not match:
-                continue
-
-            name, directive, _, location, dispname = match.groups()
-            domain, _, subdirective = directive.partition(":")
-            if directive == "py:module" and name in result:
-                # From the Sphinx Repository:
-                # due to a bug in 1.1 and below,
-                # two inventory entries are created
-                # for Python modules, and the first
-                # one is correct
-                continue
-
-            # Most documentation pages have a label
-            if directive == "std:doc":
-                subdirective = "label"
-
-            if location.endswith("$"):
-                location = location[:-1] + name
-
-            key = name if dispname == "-" else dispname
-            prefix = f"{subdirective}:" if domain == "std" else ""
-
-            if projname == "discord.py":
-                key = key.replace("discord.ext.commands.", "").replace("discord.", "")
-
-            result[f"{prefix}{key}"] = os.path.join(url, location)
-
-        return result
-
-    async def build_rtfm_lookup_table(self, page_types):
-        cache = {}
-        for key, page in page_types.items():
-            sub = cache[key] = {}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(page + "/objects.inv") as resp:
-                    if resp.status != 200:
-                        raise RuntimeError(
-                            "Cannot build rtfm lookup table, try again later."
-                        )
-
-                    stream = SphinxObjectFileReader(await resp.read())
-                    cache[key] = self.parse_object_inv(stream, page)
-
-        self._rtfm_cache = cache
-
     async def do_rtfm(self, ctx, key, obj):
         if obj is None:
             await ctx.send(self.page_types[key])
             return
 
-        if not hasattr(self, "_rtfm_cache"):
+        if key not in self.sphinx:
             await ctx.trigger_typing()
-            await self.build_rtfm_lookup_table(self.page_types)
 
         obj = re.sub(r"^(?:discord\.(?:ext\.)?)?(?:commands\.)?(.+)", r"\1", obj)
 
@@ -588,12 +676,7 @@ class DiscordPy(Cog, command_attrs=dict(hidden=True)):
                     obj = f"abc.Messageable.{name}"
                     break
 
-        cache = list(self._rtfm_cache[key].items())
-
-        def transform(tup):
-            return tup[0]
-
-        matches = fuzzy.finder(obj, cache, key=lambda t: t[0], lazy=False)[:8]
+        matches = await self.sphinx.search(key, obj)
 
         e = discord.Embed(
             title="Read the Fucking Manual", timestamp=datetime.datetime.utcnow()
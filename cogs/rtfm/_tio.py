@@ -27,7 +27,10 @@ class Tio:
         compilerFlags=None,
         commandLineOptions=None,
         args=None,
+        *,
+        session,
     ):
+        self.session = session
         compilerFlags = compilerFlags or []
         commandLineOptions = commandLineOptions or []
         args = args or []
@@ -51,11 +54,10 @@ class Tio:
         self.request = zlib.compress(bytes_, 9)[2:-4]
 
     async def send(self):
-        async with aiohttp.ClientSession() as client_session:
-            async with client_session.post(self.backend, data=self.request) as res:
-                if res.status != 200:
-                    raise aiohttp.HttpProcessingError(res.status)
-
-                data = await res.read()
-                data = data.decode("utf-8")
-                return data.replace(data[:16], "")  # remove token
+        async with self.session.post(self.backend, data=self.request) as res:
+            if res.status != 200:
+                raise aiohttp.HttpProcessingError(res.status)
+
+            data = await res.read()
+            data = data.decode("utf-8")
+            return data.replace(data[:16], "")  # remove token
@@ -92,9 +92,9 @@ class RerunBtn(discord.ui.Button):
         # we need to strip the prefix and command name ('do run '), the prefix
         # having multiple and even custom possible values
 
-        prefix = await self.bot.get_guild_prefixes(interaction.guild)
-        if payload.startswith(prefix):
-            match = re.match(rf"{prefix}( )?run ", payload)
+        matcher = await self.bot.server_config.prefix_matcher(interaction.guild.id)
+        if prefix := matcher.match(payload):
+            match = re.match(rf"{re.escape(prefix)}( )?run ", payload)
             if not match:
                 return
             span = match.span()
@@ -219,6 +219,7 @@ async def execute_run(bot: Parrot, language, code, rerun=False) -> tuple:
         inputs=inputs,
         commandLineOptions=commandLineOptions,
         args=args,
+        session=bot.http_session,
     )
 
     result = await tio.send()
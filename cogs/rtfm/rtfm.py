@@ -358,7 +358,7 @@ class RTFM(Cog):
 
     @property
     def session(self):
-        return self.bot.session
+        return self.bot.http_session
 
     @staticmethod
     def fmt_error_embed() -> discord.Embed:
@@ -627,7 +627,7 @@ Useful to hide your syntax fails or when you forgot to print the result.""",
 
             url = get_raw(base_url)
 
-            async with self.bot.session.get(url) as response:
+            async with self.bot.http_session.get(url) as response:
                 if response.status == 404:
                     return await ctx.send("Nothing found. Check your link")
                 if response.status != 200:
@@ -695,45 +695,44 @@ Useful to hide your syntax fails or when you forgot to print the result.""",
         base_url = f"https://man.cx/{page}"
         url = urllib.parse.quote_plus(base_url, safe=";/?:@&=$,><-[]")
 
-        async with aiohttp.ClientSession() as client_session:
-            async with client_session.get(url) as response:
-                if response.status != 200:
-                    return await ctx.reply(
-                        "An error occurred (status code: {response.status}). Retry later."
-                    )
+        async with self.bot.http_session.get(url) as response:
+            if response.status != 200:
+                return await ctx.reply(
+                    "An error occurred (status code: {response.status}). Retry later."
+                )
 
-                soup = BeautifulSoup(await response.text(), "lxml")
+            soup = BeautifulSoup(await response.text(), "lxml")
 
-                nameTag = soup.find("h2", string="NAME\n")
+            nameTag = soup.find("h2", string="NAME\n")
 
-                if not nameTag:
-                    # No NAME, no page
-                    return await ctx.reply(f"No manual entry for `{page}`. (Debian)")
+            if not nameTag:
+                # No NAME, no page
+                return await ctx.reply(f"No manual entry for `{page}`. (Debian)")
 
-                # Get the two (or less) first parts from the nav aside
-                # The first one is NAME, we already have it in nameTag
-                contents = soup.find_all("nav", limit=2)[1].find_all("li", limit=3)[1:]
+            # Get the two (or less) first parts from the nav aside
+            # The first one is NAME, we already have it in nameTag
+            contents = soup.find_all("nav", limit=2)[1].find_all("li", limit=3)[1:]
 
-                if contents[-1].string == "COMMENTS":
-                    contents.remove(-1)
+            if contents[-1].string == "COMMENTS":
+                contents.remove(-1)
 
-                title = self.get_content(nameTag)
+            title = self.get_content(nameTag)
 
-                emb = discord.Embed(title=title, url=f"https://man.cx/{page}")
-                emb.set_author(name="Debian Linux man pages")
-                emb.set_thumbnail(
-                    url="https://www.debian.org/logos/openlogo-nd-100.png"
-                )
+            emb = discord.Embed(title=title, url=f"https://man.cx/{page}")
+            emb.set_author(name="Debian Linux man pages")
+            emb.set_thumbnail(
+                url="https://www.debian.org/logos/openlogo-nd-100.png"
+            )
 
-                for tag in contents:
-                    h2 = tuple(
-                        soup.find(
-                            attrs={"name": tuple(tag.children)[0].get("href")[1:]}
-                        ).parents
-                    )[0]
-                    emb.add_field(name=tag.string, value=self.get_content(h2))
+            for tag in contents:
+                h2 = tuple(
+                    soup.find(
+                        attrs={"name": tuple(tag.children)[0].get("href")[1:]}
+                    ).parents
+                )[0]
+                emb.add_field(name=tag.string, value=self.get_content(h2))
 
-                await ctx.reply(embed=emb)
+            await ctx.reply(embed=emb)
 
     @commands.command()
     @commands.bot_has_permissions(embed_links=True)
@@ -63,14 +63,12 @@ async def dial(bot, ctx, server, reverse=False):
         pass
 
     def check_pickup_hangup(m):
-        return (
-            (m.content.lower() in ("pickup", "hangup"))
-            and (m.channel in (channel, target_channel))
-            and (not m.author.bot)
-        )
+        return (m.content.lower() in ("pickup", "hangup")) and (not m.author.bot)
 
     try:
-        _talk = await bot.wait_for("message", check=check_pickup_hangup, timeout=60)
+        _talk = await bot.wait_for_message(
+            (channel, target_channel), check=check_pickup_hangup, timeout=60
+        )
     except asyncio.TimeoutError:
         await asyncio.sleep(0.5)
         await target_channel.send(
@@ -106,14 +104,11 @@ async def dial(bot, ctx, server, reverse=False):
         ini = time.time() + 120
         while True:
 
-            def check_in_channel(m: discord.Message):
-                if m.author.bot:
-                    return False
-                return m.channel in (target_channel, channel)
-
             try:
-                talk_message = await bot.wait_for(
-                    "message", check=check_in_channel, timeout=60.0
+                talk_message = await bot.wait_for_message(
+                    (target_channel, channel),
+                    check=lambda m: not m.author.bot,
+                    timeout=60.0,
                 )
             except asyncio.TimeoutError:
                 await asyncio.sleep(0.5)
@@ -4,18 +4,14 @@ from cogs.meta.robopage import SimplePages
 from cogs.utils import method as mt
 
 from core import Parrot, Cog, Context
-from discord.ext import commands, tasks
+from discord.ext import commands
 import discord
 
-import datetime
-import asyncio
-
 from utilities.database import parrot_db, todo
 from utilities.time import ShortTime
 from utilities.converters import convert_bool
 from utilities.rankcard import rank_card
-
-afk = parrot_db["afk"]
+from utilities.scheduler import TimerScheduler
 
 
 class afkFlags(commands.FlagConverter, prefix="--", delimiter=" "):
@@ -32,10 +28,9 @@ class Utils(Cog):
     def __init__(self, bot: Parrot):
         self.bot = bot
         self.react_collection = parrot_db["reactions"]
-        self.reminder_task.start()
         self.collection = parrot_db["timers"]
-        self.lock = asyncio.Lock()
-
+        self.scheduler = TimerScheduler(self.collection, self.dispatch_timer)
+        self.bot.loop.create_task(self.start_scheduler())
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -92,10 +87,12 @@ class Utils(Cog):
             **kw,
         }
         await self.collection.insert_one(post)
+        self.scheduler.schedule(post)
 
     async def delete_timer(self, **kw):
         collection = self.collection
-        await collection.delete_one(kw)
+        if data := await collection.find_one_and_delete(kw):
+            self.scheduler.cancel(data["_id"])
 
     @commands.group(aliases=["remind"], invoke_without_command=True)
     @Context.with_type
@@ -353,8 +350,7 @@ class Utils(Cog):
                 "ignoredChannel": [],
             }
             await ctx.send(f"{ctx.author.mention} AFK: {text or 'AFK'}")
-            await afk.insert_one({**post})
-            self.bot.afk.add(ctx.author.id)
+            await self.bot.afk.add(post)
 
     @afk.command(name="global")
     async def _global(self, ctx: Context, *, text: commands.clean_content = None):
@@ -371,9 +367,8 @@ class Utils(Cog):
             "text": text or "AFK",
             "ignoredChannel": [],
         }
-        await afk.insert_one({**post})
+        await self.bot.afk.add(post)
         await ctx.send(f"{ctx.author.mention} AFK: {text or 'AFK'}")
-        self.bot.afk.add(ctx.author.id)
 
     @afk.command(name="for")
     async def afk_till(
@@ -394,8 +389,7 @@ class Utils(Cog):
             "text": text or "AFK",
             "ignoredChannel": [],
         }
-        await afk.insert_one({**post})
-        self.bot.afk.add(ctx.author.id)
+        await self.bot.afk.add(post)
         await ctx.send(
             f"{ctx.author.mention} AFK: {text or 'AFK'}\n> Your AFK status will be removed {discord.utils.format_dt(till.dt, 'R')}"
         )
@@ -476,48 +470,45 @@ class Utils(Cog):
                 extra={"name": "REMOVE_AFK", "main": {**payload}},
                 message=ctx.message,
             )
-            await afk.insert_one({**payload})
-            self.bot.afk.add(ctx.author.id)
+            await self.bot.afk.add(payload)
             await ctx.send(
                 f"{ctx.author.mention} AFK: {flags.text or 'AFK'}\n> Your AFK status will be removed {discord.utils.format_dt(flags._for.dt, 'R')}"
             )
             return
-        await afk.insert_one({**payload})
-        self.bot.afk.add(ctx.author.id)
+        await self.bot.afk.add(payload)
         await ctx.send(f"{ctx.author.mention} AFK: {flags.text or 'AFK'}")
 
-    @tasks.loop(seconds=3)
-    async def reminder_task(self):
-        async with self.lock:
-            async for data in self.collection.find(
-                {"expires_at": {"$lte": datetime.datetime.utcnow().timestamp()}}
-            ):
-                cog = self.bot.get_cog("EventCustom")
-                await self.collection.delete_one({"_id": data["_id"]})
-                await cog.on_timer_complete(**data)
-
-    @reminder_task.before_loop
-    async def before_reminder_task(self):
+    async def start_scheduler(self):
         await self.bot.wait_until_ready()
+        self.scheduler.start()
 
+    def cog_unload(self):
+        self.scheduler.stop()
+
+    async def dispatch_timer(self, data: dict):
+        cog = self.bot.get_cog("EventCustom")
+        await cog.on_timer_complete(**data)
 
     @commands.command(aliases=['level'])
     @commands.bot_has_permissions(attach_files=True)
     async def rank(self, ctx: Context, *, member: discord.Member=None):
         """To get the level of the user"""
-        try:
-            self.bot.server_config[ctx.guild.id]["leveling"]["enabled"]
-        except KeyError:
+        data = await self.bot.server_config.fetch(ctx.guild.id)
+        if not (data.get("leveling") or {}).get("enable"):
             return await ctx.send(f"{ctx.author.mention} leveling system is disabled in this server")
-        else:
-            collection = self.bot.mongo.leveling[f"{member.guild.id}"]
-            data = await collection.find_one_and_update({"_id": member.id})
-            level = int((data["xp"]//42) ** 0.55)
-            xp = self.__get_required_xp(level + 1)
-            file = await rank_card(
-                level, 1, member, current_xp=data["xp"], custom_background="#000000", xp_color="#FFFFFF", next_level_xp=xp
-            )
-            await ctx.reply(file=file)
+        member = member or ctx.author
+        collection = self.bot.mongo.leveling[f"{member.guild.id}"]
+        data = await collection.find_one({"_id": member.id}) or {}
+        # xp not flushed yet is still in the write-behind buffer
+        current_xp = data.get("xp", 0) + self.bot.write_behind.pending(
+            collection, member.id, "xp"
+        )
+        level = int((current_xp//42) ** 0.55)
+        xp = self.__get_required_xp(level + 1)
+        file = await rank_card(
+            level, 1, member, current_xp=current_xp, custom_background="#000000", xp_color="#FFFFFF", next_level_xp=xp, renderer=self.bot.renderer, asset_cache=self.bot.asset_cache
+        )
+        await ctx.reply(file=file)
     
     def __get_required_xp(self, level: int) -> int:
         xp = 0
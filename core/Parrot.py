@@ -2,22 +2,27 @@ from __future__ import annotations
 import logging
 
 import os
-from typing import TYPE_CHECKING, Any, Callable, Optional, Dict, Union, List, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    Iterable,
+    Union,
+    List,
+    cast,
+)
 from async_property import async_property
 import jishaku
 import datetime
 import asyncio
 import traceback
-import aiohttp
 import topgg
-import socket
-import re
 import logging
 from collections import Counter, deque, defaultdict
 import discord
 from discord.ext import commands, tasks, ipc
-from aiohttp import AsyncResolver, ClientSession, TCPConnector
-from lru import LRU
 
 from utilities.config import (
     EXTENSIONS,
@@ -34,7 +39,22 @@ from utilities.config import (
 )
 
 from utilities.database import parrot_db, cluster
-from utilities.checks import _can_run
+from utilities.config_cache import GuildConfigCache
+from utilities.counting import CountingChannels
+from utilities.globalchat import GlobalChat
+from utilities.http import HTTPClient
+from utilities.prefetch import MediaPrefetcher
+from utilities.render import ImageRenderer
+from utilities.asset_cache import AssetCache
+from utilities.bot_stats import BotStats
+from utilities.game_ai import GameAI
+from utilities.log_webhooks import LogWebhooks
+from utilities.message_router import MessageRouter
+from utilities.message_store import BoundedCache, SnipeStore
+from utilities.waiters import MessageWaiters
+from utilities.write_behind import WriteBehind
+from utilities.afk import AFKIndex
+from utilities.checks import _can_run, CommandOverrides
 from utilities.paste import Client
 from utilities import log
 from .__template import post
@@ -56,8 +76,23 @@ intents.members = True
 
 dbl_token = os.environ["TOPGG"]
 
+logger = log.get_logger(__name__)
+
 CHANGE_LOG_ID = 796932292458315776
 
+MESSAGE_CACHE_SIZE = 1024
+MESSAGE_CACHE_TTL = 300.0
+SNIPE_CACHE_SIZE = 10_000
+SNIPE_TTL = 3600.0
+
+
+class DBLClient(topgg.DBLClient):
+    @property
+    def guild_count(self) -> int:
+        # `len(bot.guilds)` copies the guild cache on every post
+        stats = self.bot.bot_stats
+        return stats.guilds if stats.ready else len(self.bot.guilds)
+
 
 class Parrot(commands.AutoShardedBot):
     """A custom way to organise a commands.AutoSharedBot."""
@@ -84,7 +119,8 @@ class Parrot(commands.AutoShardedBot):
         self._change_log = None
         self._error_log_token = os.environ["CHANNEL_TOKEN1"]
         self.color = 0x87CEEB
-        self.topggpy = topgg.DBLClient(
+        self.bot_stats = BotStats(self)
+        self.topggpy = DBLClient(
             self, dbl_token, autopost=True, post_shard_count=False
         )
         self.topgg_webhook = topgg.WebhookManager(self).dbl_webhook(
@@ -100,18 +136,32 @@ class Parrot(commands.AutoShardedBot):
         self.identifies = defaultdict(list)
         self._prev_events = deque(maxlen=10)
 
-        self.session = aiohttp.ClientSession(loop=self.loop)
-        self.http_session = ClientSession(
-            connector=TCPConnector(resolver=AsyncResolver(), family=socket.AF_INET)
-        )
-        self.mystbin = Client()
+        self.http_session = HTTPClient()
+        # webhooks want the plain aiohttp session, it is the same pool
+        self.session = self.http_session.session
+        self.mystbin = Client(session=self.session)
+        self.media_prefetch = MediaPrefetcher(self.http_session)
+        self.renderer = ImageRenderer()
+        self.asset_cache = AssetCache()
+        self.game_ai = GameAI()
         self.mongo = cluster
 
         # caching variables
-        self.server_config = LRU(64)
-        self.message_cache: Dict[int, Any] = {}
+        self.server_config = GuildConfigCache(collection, template=post)
+        self.message_router = MessageRouter(self.server_config)
+        self.message_waiters = MessageWaiters()
+        self.global_chat = GlobalChat(parrot_db["global_chat"], session=self.session)
+        self.log_webhooks = LogWebhooks(parrot_db["logging"], session=self.session)
+        self.command_overrides = CommandOverrides()
+        self.write_behind = WriteBehind()
+        # full messages, for `fetch_message_by_channel`
+        self.message_cache: BoundedCache[discord.Message] = BoundedCache(
+            max_entries=MESSAGE_CACHE_SIZE, ttl=MESSAGE_CACHE_TTL
+        )
+        self.snipes = SnipeStore(max_entries=SNIPE_CACHE_SIZE, ttl=SNIPE_TTL)
         self.banned_users: Dict[int, Any] = {}
-        self.afk = set()
+        self.afk = AFKIndex(parrot_db["afk"], write_behind=self.write_behind)
+        self.counting = CountingChannels(parrot_db["counting"])
         for ext in EXTENSIONS:
             try:
                 self.load_extension(ext)
@@ -210,13 +260,23 @@ class Parrot(commands.AutoShardedBot):
         ...
 
     async def on_autopost_success(self) -> None:
-        st = f"[{self.user.name.title()}] Posted server count ({self.topggpy.guild_count}), shard count ({self.shard_count})"
+        st = f"[{self.user.name.title()}] Posted server count ({self.bot_stats.guilds}), shard count ({self.shard_count})"
         print(st)
 
     def run(self) -> None:
         """To run connect and login into discord"""
         super().run(TOKEN, reconnect=True)
 
+    async def close(self) -> None:
+        # counters and xp still in the buffer would be lost otherwise
+        await self.write_behind.close()
+        await self.counting.close()
+        self.media_prefetch.close()
+        self.renderer.close()
+        self.game_ai.close()
+        await super().close()
+        await self.http_session.close()
+
     async def on_ready(self) -> None:
         if not hasattr(self, "uptime"):
             self.uptime = discord.utils.utcnow()
@@ -226,8 +286,22 @@ class Parrot(commands.AutoShardedBot):
             f"[{self.user.name.title()}] Using discord.py of version: {discord.__version__ }"
         )
 
-        ls = await self.mongo.parrot_db.afk.distinct("messageAuthor")
-        self.afk = set(ls)
+        # background services first, a failing load below must not stop them
+        self.bot_stats.start()
+        self.server_config.start()
+        self.write_behind.start()
+        self.counting.start()
+
+        for name, load in (
+            ("message router", self.message_router.start),
+            ("AFK", self.afk.load),
+            ("counting", self.counting.load),
+        ):
+            try:
+                await load()
+            except Exception:
+                # the caches load again on first use
+                logger.exception("could not load the %s cache", name)
 
     async def on_connect(self) -> None:
         print(f"[{self.user.name.title()}] Logged in")
@@ -299,11 +373,13 @@ class Parrot(commands.AutoShardedBot):
 
     async def on_message(self, message: discord.Message) -> None:
         self._seen_messages += 1
+        self.message_waiters.dispatch(message)
 
         if message.guild is None or message.author.bot:
             # to prevent the usage of command in DMs
             return
 
+        self.message_router.dispatch(message)
         await self.process_commands(message)
 
     async def on_message_edit(
@@ -315,6 +391,26 @@ class Parrot(commands.AutoShardedBot):
         if before.content != after.content and before.author.id in OWNER_IDS:
             await self.process_commands(after)
 
+    async def wait_for_message(
+        self,
+        channel: Union[discord.abc.Snowflake, int, Iterable[discord.abc.Snowflake]],
+        *,
+        author: Optional[Union[discord.abc.Snowflake, int]] = None,
+        check: Optional[Callable[[discord.Message], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> discord.Message:
+        """|coro|
+
+        ``wait_for("message")`` for one channel, or a few, and optionally
+        one author. Only the waiters of the channel of a message are checked
+        against it, instead of every pending ``wait_for`` of the bot.
+
+        Raises :class:`asyncio.TimeoutError` when the timeout expires.
+        """
+        return await self.message_waiters.wait(
+            channel, author=author, check=check, timeout=timeout
+        )
+
     async def resolve_member_ids(self, guild: discord.Guild, member_ids: list):
         """|coro|
         
@@ -446,31 +542,36 @@ class Parrot(commands.AutoShardedBot):
 
     async def get_prefix(self, message: discord.Message) -> Union[str, List[str]]:
         """Dynamic prefixing"""
-        try:
-            prefix = self.server_config[message.guild.id]["prefix"]
-        except KeyError:
-            if data := await collection.find_one(
-                {"_id": message.guild.id}
-            ):
-                prefix = data["prefix"]
-                post = data
-            else:
-                post["_id"] = message.guild.id
-                prefix = "$"  # default prefix
-                await collection.insert_one(post)
-            self.server_config[message.guild.id] = post
-        comp = re.compile(f"^({re.escape(prefix)}).*", flags=re.I)
-        match = comp.match(message.content)
-        if match is not None:
-            prefix = match.group(1)
-        return commands.when_mentioned_or(prefix)(self, message)
-
-    async def get_guild_prefixes(self, guild: discord.Guild) -> Optional[str]:
-        try:
-            return self.server_config[guild.id]["prefix"]
-        except KeyError:
-            if data := await collection.find_one({"_id": guild.id}):
-                return data.get("prefix")
+        matcher = await self.server_config.prefix_matcher(message.guild.id)
+        if prefix := matcher.match(message.content):
+            prefixes = [prefix]
+        else:
+            prefixes = list(matcher.prefixes)
+        return commands.when_mentioned(self, message) + prefixes
+
+    async def get_guild_prefixes(self, guild: discord.Guild) -> List[str]:
+        matcher = await self.server_config.prefix_matcher(guild.id)
+        return list(matcher.prefixes)
+
+    async def update_server_config(
+        self, guild_id: int, update: Dict[str, Any], *, upsert: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Update the server config of the guild in database and in cache.
+
+        Parameters
+        -----------
+        guild_id: int
+            The guild whose config is to be updated.
+        update: Dict[str, Any]
+            MongoDB update document, like ``{"$set": {"prefix": "!"}}``
+        Returns
+        ---------
+        Optional[Dict[str, Any]]
+            The updated config, or None if the guild has no config.
+        """
+        return await self.server_config.update(guild_id, update, upsert=upsert)
 
     async def invoke_help_command(self, ctx: Context) -> None:
         return await ctx.send_help(ctx.command)
@@ -484,11 +585,6 @@ class Parrot(commands.AutoShardedBot):
         except Exception as e:
             return None
 
-    @tasks.loop(count=1)
-    async def update_server_config_cache(self, guild_id: int):
-        if data := await collection.find_one({"_id": guild_id}):
-            self.server_config[guild_id] = data
-
     @tasks.loop(count=1)
     async def update_banned_members(self):
         async for data in collection_ban.find({}):
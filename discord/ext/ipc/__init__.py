@@ -8,5 +8,5 @@ _VersionInfo = collections.namedtuple(
     "_VersionInfo", "major minor micro release serial"
 )
 
-version = "2.1.1"
-version_info = _VersionInfo(2, 1, 1, "final", 0)
+version = "2.2.0"
+version_info = _VersionInfo(2, 2, 0, "final", 0)
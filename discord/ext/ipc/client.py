@@ -3,6 +3,7 @@ import logging
 
 import aiohttp
 from discord.ext.ipc.errors import NotConnected
+from discord.ext.ipc.serializer import dumps, loads
 
 log = logging.getLogger(__name__)
 
@@ -18,10 +19,17 @@ class Client:
         The port of the IPC server. If not supplied the port will be found automatically, defaults to None
     secret_key: Union[str, bytes]
         The secret key for your IPC server. Must match the server secret_key or requests will not go ahead, defaults to None
+    timeout: float
+        Seconds to wait for the response of a request, defaults to 60
     """
 
     def __init__(
-        self, host="localhost", port=None, multicast_port=20000, secret_key=None
+        self,
+        host="localhost",
+        port=None,
+        multicast_port=20000,
+        secret_key=None,
+        timeout=60.0,
     ):
         """Constructor"""
         self.loop = asyncio.get_event_loop()
@@ -37,6 +45,13 @@ class Client:
         self.multicast = None
 
         self.multicast_port = multicast_port
+        self.timeout = timeout
+
+        # id -> (websocket, future of the response), requests in flight
+        self._pending = {}
+        self._last_id = 0
+        self._reader = None
+        self._connecting = asyncio.Lock()
 
     @property
     def url(self):
@@ -51,29 +66,92 @@ class Client:
         :class:`~aiohttp.ClientWebSocketResponse`
             The websocket connection to the server
         """
-        self.session = aiohttp.ClientSession()
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
 
         if not self.port:
             self.multicast = await self.session.ws_connect(self.url, autoping=False)
 
             payload = {"connect": True, "headers": {"Authorization": self.secret_key}}
-            await self.multicast.send_json(payload)
+            await self.multicast.send_bytes(dumps(payload))
             recv = await self.multicast.receive()
 
             if recv.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED):
                 raise NotConnected("Multicast server connection failed.")
 
-            port_data = recv.json()
+            port_data = loads(recv.data)
             self.port = port_data["port"]
 
         self.websocket = await self.session.ws_connect(
-            self.url, autoping=False, autoclose=False
+            self.url, autoping=True, autoclose=False
         )
+        self._reader = self.loop.create_task(self._read(self.websocket))
+
+        return self.websocket
 
+    async def _connect(self):
+        async with self._connecting:
+            if self.websocket is None or self.websocket.closed:
+                await self.init_sock()
         return self.websocket
 
+    async def _read(self, websocket):
+        """Resolves the pending requests with the responses of the server,
+        which come in the order they complete."""
+        try:
+            async for message in websocket:
+                if message.type not in (
+                    aiohttp.WSMsgType.TEXT,
+                    aiohttp.WSMsgType.BINARY,
+                ):
+                    continue
+
+                data = loads(message.data)
+                _, future = self._pending.pop(data.get("id"), (None, None))
+                if future is not None and not future.done():
+                    future.set_result(data.get("response"))
+        finally:
+            # the connection is gone, whatever was in flight with it failed
+            for request_id, (sent_on, future) in list(self._pending.items()):
+                if sent_on is websocket:
+                    del self._pending[request_id]
+                    if not future.done():
+                        future.set_exception(NotConnected("IPC connection closed."))
+
+    async def _send(self, payload):
+        for retry in range(2):
+            try:
+                websocket = await self._connect()
+                break
+            except aiohttp.ClientError as error:
+                if retry:
+                    raise NotConnected(str(error)) from error
+                await asyncio.sleep(5)
+
+        self._last_id += 1
+        payload["id"] = request_id = self._last_id
+        payload["headers"] = {"Authorization": self.secret_key}
+
+        future = self.loop.create_future()
+        self._pending[request_id] = (websocket, future)
+        timer = self.loop.call_later(self.timeout, self._expire, future)
+        try:
+            await websocket.send_bytes(dumps(payload))
+            return await future
+        finally:
+            timer.cancel()
+            self._pending.pop(request_id, None)
+
+    @staticmethod
+    def _expire(future):
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+
     async def request(self, endpoint, **kwargs):
         """Make a request to the IPC server process.
+
+        Requests are pipelined: any number of them can be awaited at once
+        on the same connection.
         Parameters
         ----------
         endpoint: str
@@ -81,34 +159,31 @@ class Client:
         **kwargs
             The data to send to the endpoint
         """
-        if not self.session:
-            await self.init_sock()
-
-        payload = {
-            "endpoint": endpoint,
-            "data": kwargs,
-            "headers": {"Authorization": self.secret_key},
-        }
-
-        await self.websocket.send_json(payload)
-
-        recv = await self.websocket.receive()
-
-        if recv.type == aiohttp.WSMsgType.PING:
-            await self.websocket.ping()
-
-            return await self.request(endpoint, **kwargs)
+        return await self._send({"endpoint": endpoint, "data": kwargs})
 
-        if recv.type == aiohttp.WSMsgType.PONG:
-            return await self.request(endpoint, **kwargs)
-
-        if recv.type == aiohttp.WSMsgType.CLOSED:
+    async def batch(self, *requests):
+        """Make several requests to the IPC server process in one frame. The
+        server runs them concurrently.
+        Parameters
+        ----------
+        *requests: Tuple[str, dict]
+            The (endpoint, data) pairs to request
+        Returns
+        -------
+        list
+            The responses, in the order of the requests
+        """
+        batch = [{"endpoint": endpoint, "data": data} for endpoint, data in requests]
+        return await self._send({"batch": batch})
+
+    async def close(self):
+        """Closes the connection to the server."""
+        if self.websocket is not None:
+            await self.websocket.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self.multicast is not None:
+            await self.multicast.close()
+        if self.session is not None:
             await self.session.close()
-
-            await asyncio.sleep(5)
-
-            await self.init_sock()
-
-            return await self.request(endpoint, **kwargs)
-
-        return recv.json()
@@ -0,0 +1,21 @@
+try:
+    import orjson
+except ImportError:
+    import json
+
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Serialize ``obj`` to JSON bytes, with orjson when it is installed.
+    Raises :class:`TypeError` for objects which are not JSON serializable."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Deserialize JSON ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,7 +1,9 @@
+import asyncio
 import logging
 
 import aiohttp.web
 from discord.ext.ipc.errors import JSONEncodeError
+from discord.ext.ipc.serializer import dumps, loads
 
 log = logging.getLogger(__name__)
 
@@ -66,6 +68,8 @@ class Server:
         Turn multicasting on/off. Defaults to True
     multicast_port: int
         The port to run the multicasting server on. Defaults to 20000
+    max_concurrency: int
+        The number of requests of a connection processed at once. Defaults to 64
     """
 
     ROUTES = {}
@@ -78,6 +82,7 @@ class Server:
         secret_key=None,
         do_multicast=True,
         multicast_port=20000,
+        max_concurrency=64,
     ):
         self.bot = bot
         self.loop = bot.loop
@@ -92,6 +97,7 @@ class Server:
 
         self.do_multicast = do_multicast
         self.multicast_port = multicast_port
+        self.max_concurrency = max_concurrency
 
         self.endpoints = {}
 
@@ -120,75 +126,164 @@ class Server:
 
         self.ROUTES = {}
 
+    def get_endpoint(self, name):
+        """The coroutine registered as ``name``, ``None`` if there is none.
+        Cog routes registered after the server started are found as well."""
+        if self.ROUTES:
+            self.update_endpoints()
+        return self.endpoints.get(name) or Server.ROUTES.get(name)
+
+    async def process(self, endpoint, data):
+        """Run one endpoint and return its response.
+        Parameters
+        ----------
+        endpoint: str
+            The endpoint to call.
+        data: dict
+            The payload of the request, ``endpoint`` and ``data`` keys.
+        """
+        func = self.get_endpoint(endpoint) if isinstance(endpoint, str) else None
+        if func is None:
+            return {"error": "Invalid or no endpoint given.", "code": 400}
+        if not isinstance(data.get("data"), dict):
+            return {"error": "Request data must be an object.", "code": 400}
+
+        server_response = IpcServerResponse(data)
+        try:
+            attempted_cls = self.bot.cogs.get(func.__qualname__.split(".")[0])
+
+            if attempted_cls:
+                arguments = (attempted_cls, server_response)
+            else:
+                arguments = (server_response,)
+        except AttributeError:
+            # Support base Client
+            arguments = (server_response,)
+
+        try:
+            return await func(*arguments)
+        except Exception as error:
+            self.bot.dispatch("ipc_error", endpoint, error)
+
+            return {
+                "error": "IPC route raised error of type {}".format(
+                    type(error).__name__
+                ),
+                "code": 500,
+            }
+
+    async def dispatch(self, request):
+        """Answer a decoded request: a single endpoint call or a batch of them,
+        run concurrently."""
+        headers = request.get("headers")
+
+        if not headers or headers.get("Authorization") != self.secret_key:
+            return {"error": "Invalid or no token provided.", "code": 403}
+
+        batch = request.get("batch")
+        if batch is not None:
+            if not isinstance(batch, list):
+                return {"error": "Batch must be a list of requests.", "code": 400}
+            return await asyncio.gather(*(self._process_call(call) for call in batch))
+
+        if request.get("data") is None:
+            request["data"] = {}
+        return await self.process(request.get("endpoint"), request)
+
+    async def _process_call(self, call):
+        """Run one call of a batch, a malformed call only fails itself."""
+        if not isinstance(call, dict):
+            return {"error": "Invalid request payload.", "code": 400}
+        endpoint = call.get("endpoint")
+        return await self.process(
+            endpoint, {"endpoint": endpoint, "data": call.get("data") or {}}
+        )
+
+    async def _respond(self, websocket, lock, semaphore, message):
+        """Dispatch one frame and send back its response, tagged with the id
+        of the request. Untagged requests (older clients) get the bare response."""
+        try:
+            try:
+                request = loads(message.data)
+            except ValueError:
+                request = None
+
+            if isinstance(request, dict):
+                response = await self.dispatch(request)
+            else:
+                request = {}
+                response = {"error": "Invalid request payload.", "code": 400}
+
+            if "id" in request:
+                response = {"id": request["id"], "response": response}
+
+            try:
+                payload = dumps(response)
+            except TypeError:
+                error_response = (
+                    "IPC route returned values which are not able to be sent over sockets."
+                    " If you are trying to send a discord.py object,"
+                    " please only send the data you need."
+                )
+                self.bot.dispatch(
+                    "ipc_error",
+                    request.get("endpoint"),
+                    JSONEncodeError(error_response),
+                )
+                response = {"error": error_response, "code": 500}
+                if "id" in request:
+                    response = {"id": request["id"], "response": response}
+                payload = dumps(response)
+
+            async with lock:
+                # answer in the kind of frame the client used
+                if message.type == aiohttp.WSMsgType.BINARY:
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_str(payload.decode("utf-8"))
+        except (ConnectionResetError, RuntimeError) as error:
+            log.debug("IPC response could not be sent: %s", error)
+        finally:
+            semaphore.release()
+
     async def handle_accept(self, request):
         """Handles websocket requests from the client process.
+
+        Requests of a connection are dispatched concurrently, up to
+        ``max_concurrency`` at once, and answered as they complete. Clients
+        match the responses with the ``id`` they gave their requests.
         Parameters
         ----------
         request: :class:`~aiohttp.web.Request`
             The request made by the client, parsed by aiohttp.
         """
-        self.update_endpoints()
-
         websocket = aiohttp.web.WebSocketResponse()
         await websocket.prepare(request)
 
-        async for message in websocket:
-            request = message.json()
-
-            endpoint = request.get("endpoint")
-
-            headers = request.get("headers")
-
-            if not headers or headers.get("Authorization") != self.secret_key:
-                response = {"error": "Invalid or no token provided.", "code": 403}
-            else:
-                if not endpoint or endpoint not in self.endpoints:
-                    response = {"error": "Invalid or no endpoint given.", "code": 400}
-                else:
-                    server_response = IpcServerResponse(request)
-                    try:
-                        attempted_cls = self.bot.cogs.get(
-                            self.endpoints[endpoint].__qualname__.split(".")[0]
-                        )
-
-                        if attempted_cls:
-                            arguments = (attempted_cls, server_response)
-                        else:
-                            arguments = (server_response,)
-                    except AttributeError:
-                        # Support base Client
-                        arguments = (server_response,)
-
-                    try:
-                        ret = await self.endpoints[endpoint](*arguments)
-                        response = ret
-                    except Exception as error:
-                        self.bot.dispatch("ipc_error", endpoint, error)
-
-                        response = {
-                            "error": "IPC route raised error of type {}".format(
-                                type(error).__name__
-                            ),
-                            "code": 500,
-                        }
+        lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = set()
 
-            try:
-                await websocket.send_json(response)
-            except TypeError as error:
-                if str(error).startswith("Object of type") and str(error).endswith(
-                    "is not JSON serializable"
+        try:
+            async for message in websocket:
+                if message.type not in (
+                    aiohttp.WSMsgType.TEXT,
+                    aiohttp.WSMsgType.BINARY,
                 ):
-                    error_response = (
-                        "IPC route returned values which are not able to be sent over sockets."
-                        " If you are trying to send a discord.py object,"
-                        " please only send the data you need."
-                    )
-
-                    response = {"error": error_response, "code": 500}
+                    continue
 
-                    await websocket.send_json(response)
+                # stop reading, and let the client wait, when too busy
+                await semaphore.acquire()
+                task = self.loop.create_task(
+                    self._respond(websocket, lock, semaphore, message)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                    raise JSONEncodeError(error_response)
+        return websocket
 
     async def handle_multicast(self, request):
         """Handles multicasting websocket requests from the client.
@@ -201,7 +296,7 @@ class Server:
         await websocket.prepare(request)
 
         async for message in websocket:
-            request = message.json()
+            request = loads(message.data)
 
             headers = request.get("headers")
 
@@ -227,6 +322,7 @@ class Server:
     def start(self):
         """Starts the IPC server."""
         # self.bot.dispatch("ipc_ready")
+        self.update_endpoints()
 
         self._server = aiohttp.web.Application()
         self._server.router.add_route("GET", "/", self.handle_accept)
@@ -7,7 +7,6 @@ from utilities.database import parrot_db
 import discord
 import asyncio
 
-afk = parrot_db["afk"]
 timers = parrot_db["timers"]
 
 
@@ -72,13 +71,12 @@ class EventCustom(Cog):
         # incase the parser have the excellent connection to DB
         # and the ``delete_one`` takes time
         if name.upper() == "REMOVE_AFK":
-            await afk.delete_one(kw)
-            self.bot.afk.remove(kw.get("messageAuthor"))
+            await self.bot.afk.remove(kw["_id"])
         if name.upper() == "SET_AFK":
-            await afk.insert_one(kw)
-            self.bot.afk.add(kw.get("messageAuthor"))
+            await self.bot.afk.add(kw)
         if name.upper() == "SET_TIMER":
             await timers.insert_one(kw)
+            self.bot.get_cog("Utils").scheduler.schedule(kw)
 
 
 def setup(bot: Parrot) -> None:
@@ -8,14 +8,12 @@ import discord
 import io
 import json
 
-log = parrot_db["logging"]
 server_config = parrot_db["server_config"]
 
 
 class GuildChannel(Cog, command_attrs=dict(hidden=True)):
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.collection = log
 
     def _overwrite_to_json(self, overwrites) -> str:
         try:
@@ -29,31 +27,28 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 
     @Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.bot.bot_stats.channel_delete(channel)
         await self.bot.wait_until_ready()
         if not channel.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": channel.guild.id, "on_channel_delete": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            channel.guild.id, "on_channel_delete"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_channel_delete"], session=self.bot.session
-            )
-            if webhook:
-                channel_type = str(channel.type)
-                TYPE = channel_type.replace("_", " ").title() + " Channel"
-                async for entry in channel.guild.audit_logs(
-                    action=discord.AuditLogAction.channel_delete, limit=5
-                ):
-                    if entry.target.id == channel.id:
+            channel_type = str(channel.type)
+            TYPE = channel_type.replace("_", " ").title() + " Channel"
+            async for entry in channel.guild.audit_logs(
+                action=discord.AuditLogAction.channel_delete, limit=5
+            ):
+                if entry.target.id == channel.id:
 
-                        reason = (
-                            entry.reason or None
-                        )  # Fact is this thing has to be implemented
-                        user = entry.user or "UNKNOWN#0000"  # If the action is too old
-                        deleted_at = (
-                            entry.created_at
-                        )  # The logs can't be proceeded. I dont know why
-                        content = f"""**Channel Delete Event**
+                    reason = (
+                        entry.reason or None
+                    )  # Fact is this thing has to be implemented
+                    user = entry.user or "UNKNOWN#0000"  # If the action is too old
+                    deleted_at = (
+                        entry.created_at
+                    )  # The logs can't be proceeded. I dont know why
+                    content = f"""**Channel Delete Event**
 
 `Name (ID) :` **{channel.name} [`{TYPE}`] ({channel.id})**
 `Created at:` **<t:{int(channel.created_at.timestamp())}>**
@@ -64,37 +59,34 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 `Deleted at:` **{discord.utils.format_dt(deleted_at) if deleted_at else 'Not available'}**
 `Deleted by:` **{user}**
 """
-                        break
-                fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="overwrites.json"),
-                )
+                    break
+            fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="overwrites.json"),
+            )
 
     @Cog.listener()
     async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.bot.bot_stats.channel_create(channel)
         await self.bot.wait_until_ready()
         if not channel.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": channel.guild.id, "on_channel_create": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            channel.guild.id, "on_channel_create"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_channel_create"], session=self.bot.session
-            )
-            if webhook:
-                channel_type = str(channel.type)
-                TYPE = channel_type.replace("_", " ").title() + " Channel"
-                async for entry in channel.guild.audit_logs(
-                    action=discord.AuditLogAction.channel_delete, limit=5
-                ):
-                    if entry.target.id == channel.id:
-                        reason = entry.reason or None
-                        user = entry.user or "UNKNOWN#0000"
-                        entryID = entry.id
-                        content = f"""**Channel Create Event**
+            channel_type = str(channel.type)
+            TYPE = channel_type.replace("_", " ").title() + " Channel"
+            async for entry in channel.guild.audit_logs(
+                action=discord.AuditLogAction.channel_delete, limit=5
+            ):
+                if entry.target.id == channel.id:
+                    reason = entry.reason or None
+                    user = entry.user or "UNKNOWN#0000"
+                    entryID = entry.id
+                    content = f"""**Channel Create Event**
 
 `Name (ID) :` **{channel.name} [`{TYPE}`] ({channel.id})**
 `Created at:` **<t:{int(channel.created_at.timestamp())}>**
@@ -105,20 +97,20 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 `Entry ID  :` **{entryID if entryID else None}**
 `Deleted by:` **{user}**
 """
-                        break
-                fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="overwrites.json"),
-                )
+                    break
+            fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="overwrites.json"),
+            )
             if (
                 channel.permissions_for(channel.guild.me).manage_channels
                 and channel.permissions_for(channel.guild.default_role).send_messages
                 and channel.permissions_for(channel.guild.me).manage_roles
             ):
-                if data := await server_config.find_one({"_id": channel.guild.id}):
+                if data := await self.bot.server_config.fetch(channel.guild.id):
                     if data["muted_role"]:
                         if role := channel.guild.get_role(data["muted_role"]):
                             await channel.edit(
@@ -136,27 +128,23 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
         channel = after
         if not channel.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": before.guild.id, "on_channel_update": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            before.guild.id, "on_channel_update"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_channel_update"], session=self.bot.session
-            )
-            if webhook:
-                channel_type = str(channel.type)
-                TYPE = channel_type.replace("_", " ").title() + " Channel"
-                async for entry in channel.guild.audit_logs(
-                    action=discord.AuditLogAction.channel_update, limit=5
-                ):
-                    if entry.target.id == channel.id:
-                        reason = entry.reason or None
-                        user = entry.user or "UNKNOWN#0000"
-                        entryID = entry.id
-                        ls = self._channel_change(before, after, TYPE=channel_type)
-                        ext = ""
-                        for i, j in ls:
-                            ext += f"{i} **{j}**\n"
-                        content = f"""**Channel Update Event**
+            channel_type = str(channel.type)
+            TYPE = channel_type.replace("_", " ").title() + " Channel"
+            async for entry in channel.guild.audit_logs(
+                action=discord.AuditLogAction.channel_update, limit=5
+            ):
+                if entry.target.id == channel.id:
+                    reason = entry.reason or None
+                    user = entry.user or "UNKNOWN#0000"
+                    entryID = entry.id
+                    ls = self._channel_change(before, after, TYPE=channel_type)
+                    ext = ""
+                    for i, j in ls:
+                        ext += f"{i} **{j}**\n"
+                    content = f"""**Channel Update Event**
 
 `Name (ID) :` **{channel.name} [`{TYPE}`] ({channel.id})**
 `Created at:` **<t:{int(channel.created_at.timestamp())}>**
@@ -167,15 +155,15 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 **Change/Update (Before)**
 {ext}
 """
-                        break
+                    break
 
-                fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="overwrites.json"),
-                )
+            fp = io.BytesIO(self._overwrite_to_json(channel.overwrites).encode())
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="overwrites.json"),
+            )
 
     def _channel_change(self, before, after, *, TYPE: str) -> List[Tuple[str, Any]]:
         ls = []
@@ -237,20 +225,16 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
         await self.bot.wait_until_ready()
         if not channel.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": channel.guild.id, "on_message_pin": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            channel.guild.id, "on_message_pin"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_channel_pin"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in channel.guild.audit_logs(
-                    action=discord.AuditLogAction.message_pin, limit=5
-                ):
-                    if entry.target.channel.id == channel.id:
-                        user = entry.user or "UNKNOWN#0000"
-                        entryID = entry.id
-                        content = f"""**Message Pinned**
+            async for entry in channel.guild.audit_logs(
+                action=discord.AuditLogAction.message_pin, limit=5
+            ):
+                if entry.target.channel.id == channel.id:
+                    user = entry.user or "UNKNOWN#0000"
+                    entryID = entry.id
+                    content = f"""**Message Pinned**
 
 `ID       :` **{entry.extra.message_id}**
 `Channel  :` **{channel.mention} ({channel.id})**
@@ -260,27 +244,23 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 `Entry ID :` **{entryID}**
 `Jump URL :` **<https://discord.com/channels/{channel.guild.id}/{channel.id}/{entry.extra.message_id}>**
 """
-                        break
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                )
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                    )
+                    break
 
-        if data := await self.collection.find_one(
-            {"_id": channel.guild.id, "on_message_unpin": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            channel.guild.id, "on_message_unpin"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_channel_unpin"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in channel.guild.audit_logs(
-                    action=discord.AuditLogAction.message_unpin, limit=5
-                ):
-                    if entry.target.channel.id == channel.id:
-                        user = entry.user or "UNKNOWN#0000"
-                        entryID = entry.id
-                        content = f"""**Message Unpinned**
+            async for entry in channel.guild.audit_logs(
+                action=discord.AuditLogAction.message_unpin, limit=5
+            ):
+                if entry.target.channel.id == channel.id:
+                    user = entry.user or "UNKNOWN#0000"
+                    entryID = entry.id
+                    content = f"""**Message Unpinned**
 
 `ID         :` **{entry.extra.message_id}**
 `Channel    :` **{channel.mention} ({channel.id})**
@@ -290,12 +270,12 @@ class GuildChannel(Cog, command_attrs=dict(hidden=True)):
 `Entry ID   :` **{entryID}**
 `Jump URL   :` **<https://discord.com/channels/{channel.guild.id}/{channel.id}/{entry.extra.message_id}>**
 """
-                        break
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                )
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                    )
+                    break
 
     @Cog.listener()
     async def on_guild_integrations_update(self, guild):
@@ -1,25 +1,21 @@
 from __future__ import annotations
 
-from utilities.database import parrot_db
 import discord
 
 from core import Cog, Parrot
 
-log = parrot_db["logging"]
-
 
 class Extra(Cog, command_attrs=dict(hidden=True)):
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.collection = parrot_db["logging"]
 
     @Cog.listener()
     async def on_guild_available(self, guild):
-        pass
+        self.bot.bot_stats.guild_available(guild)
 
     @Cog.listener()
     async def on_guild_unavailable(self, guild):
-        pass
+        self.bot.bot_stats.guild_unavailable(guild)
 
     @Cog.listener()
     async def on_invite_create(self, invite):
@@ -28,19 +24,15 @@ class Extra(Cog, command_attrs=dict(hidden=True)):
             return
         if not invite.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": invite.guild.id, "on_invite_create": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            invite.guild.id, "on_invite_create"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_invite_create"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in invite.guild.audit_logs(
-                    action=discord.AuditLogAction.invite_delete, limit=5
-                ):
-                    if entry.extra.id == invite.id:
-                        reason = entry.reason or None
-                        content = f"""**On Invite Create**
+            async for entry in invite.guild.audit_logs(
+                action=discord.AuditLogAction.invite_delete, limit=5
+            ):
+                if entry.extra.id == invite.id:
+                    reason = entry.reason or None
+                    content = f"""**On Invite Create**
 
 `Member Count?  :` **{invite.approximate_member_count}**
 `Presence Count?:` **{invite.approximate_presence_count}**
@@ -52,12 +44,12 @@ class Extra(Cog, command_attrs=dict(hidden=True)):
 `Inviter?    :` **{invite.inviter}**
 `Reason?     :` **{reason}**
 """
-                        await webhook.send(
-                            content=content,
-                            avatar_url=self.bot.user.avatar.url,
-                            username=self.bot.user.name,
-                        )
-                        break
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                    )
+                    break
 
     @Cog.listener()
     async def on_invite_delete(self, invite):
@@ -66,21 +58,17 @@ class Extra(Cog, command_attrs=dict(hidden=True)):
             return
         if not invite.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": invite.guild.id, "on_invite_create": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            invite.guild.id, "on_invite_create"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_invite_create"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in invite.guild.audit_logs(
-                    action=discord.AuditLogAction.invite_delete, limit=5
-                ):
-                    if entry.extra.id == invite.id:
-                        reason = entry.reason or None
-                        user = entry.user or "UNKNOWN#0000"
+            async for entry in invite.guild.audit_logs(
+                action=discord.AuditLogAction.invite_delete, limit=5
+            ):
+                if entry.extra.id == invite.id:
+                    reason = entry.reason or None
+                    user = entry.user or "UNKNOWN#0000"
 
-                        content = f"""**On Invite Create**
+                    content = f"""**On Invite Create**
 
 `Member Count?  :` **{invite.approximate_member_count}**
 `Presence Count?:` **{invite.approximate_presence_count}**
@@ -93,12 +81,12 @@ class Extra(Cog, command_attrs=dict(hidden=True)):
 `Reason?     :` **{reason}**
 `Deleted By? :` **{user}**
 """
-                        await webhook.send(
-                            content=content,
-                            avatar_url=self.bot.user.avatar.url,
-                            username=self.bot.user.name,
-                        )
-                        break
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                    )
+                    break
 
 
 def setup(bot):
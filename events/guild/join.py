@@ -20,6 +20,7 @@ class GuildJoin(Cog, command_attrs=dict(hidden=True)):
 
     @Cog.listener()
     async def on_guild_join(self, guild: discord.Guild):
+        self.bot.bot_stats.guild_join(guild)
         await self.bot.wait_until_ready()
         try:
             CONTENT = f"""
@@ -28,7 +29,7 @@ class GuildJoin(Cog, command_attrs=dict(hidden=True)):
 `Server Owner `: `{guild.owner}` | {guild.owner.id}
 `Server Region`: {str(guild.region).replace('_', ' ').title()}.
 
-Total server on count **{len(self.bot.guilds)}**. Total users on count: **{len(self.bot.users)}**
+Total server on count **{self.bot.bot_stats.guilds}**. Total users on count: **{self.bot.bot_stats.users}**
 """
         except AttributeError:
             return
@@ -39,10 +40,11 @@ Total server on count **{len(self.bot.guilds)}**. Total users on count: **{len(s
             "avatar_url": self.bot.user.display_avatar.url,
             "content": CONTENT,
         }
-        await self.bot.session.post(self.url, json=data)
+        await self.bot.http_session.post(self.url, json=data)
 
     @Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
+        self.bot.bot_stats.guild_remove(guild)
         await self.bot.wait_until_ready()
         try:
             CONTENT = f"""
@@ -51,18 +53,21 @@ Total server on count **{len(self.bot.guilds)}**. Total users on count: **{len(s
 `Server Owner `: `{guild.owner}` | {guild.owner.id}
 `Server Region`: {str(guild.region).replace('_', ' ').title()}.
 
-Total server on count **{len(self.bot.guilds)}**. Total users on count: **{len(self.bot.users)}**
+Total server on count **{self.bot.bot_stats.guilds}**. Total users on count: **{self.bot.bot_stats.users}**
 """
         except AttributeError:
             return
 
         await guild_remove(guild.id)
+        self.bot.global_chat.forget(guild.id)
+        self.bot.log_webhooks.forget(guild.id)
+        self.bot.command_overrides.invalidate(guild.id)
         data = {
             "username": "Parrot",
             "avatar_url": self.bot.user.display_avatar.url,
             "content": CONTENT,
         }
-        await self.bot.session.post(self.url, json=data)
+        await self.bot.http_session.post(self.url, json=data)
 
 
     @Cog.listener()
@@ -6,7 +6,6 @@ import discord
 import time
 
 collection = parrot_db["server_config"]
-log = parrot_db["logging"]
 
 
 class Member(Cog, command_attrs=dict(hidden=True)):
@@ -16,15 +15,12 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 
     @Cog.listener()
     async def on_member_join(self, member: discord.Member):
+        self.bot.bot_stats.member_join(member)
         await self.bot.wait_until_ready()
-        if data := await log.find_one(
-            {"_id": member.guild.id, "on_member_join": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            member.guild.id, "on_member_join"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_member_join"], session=self.bot.session
-            )
-            if webhook:
-                content = f"""**Member Joined Event**
+            content = f"""**Member Joined Event**
 
 `Name (ID)  :` **{member} (`{member.id}`)**
 `Account age:` **{discord.utils.format_dt(member.created_at)}**
@@ -34,11 +30,11 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 `Badges     :` **{', '.join([str(i).replace('.', ':').split(':')[1].replace('_', ' ').title() if i else None for i in member.public_flags.all()])}**
 `Premium Since:` **{discord.utils.format_dt(member.premium_since) if member.premium_since else None}**
 """
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                )
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+            )
 
         data = await collection.find_one({"_id": member.guild.id})
         if data:
@@ -63,15 +59,12 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 
     @Cog.listener()
     async def on_member_remove(self, member):
+        self.bot.bot_stats.member_remove(member)
         await self.bot.wait_until_ready()
-        if data := await log.find_one(
-            {"_id": member.guild.id, "on_member_leave": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            member.guild.id, "on_member_leave"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_member_leave"], session=self.bot.session
-            )
-            if webhook:
-                content = f"""**Member Joined Event**
+            content = f"""**Member Joined Event**
 
 `Name (ID)  :` **{member} (`{member.id}`)**
 `Account age:` **{discord.utils.format_dt(member.created_at)}**
@@ -82,11 +75,11 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 `Badges     :` **{', '.join([str(i).replace('.', ':').split(':')[1].replace('_', ' ').title() if i else None for i in member.public_flags.all()])}**
 `Premium Since:` **{discord.utils.format_dt(member.premium_since) if member.premium_since else None}**
 """
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                )
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+            )
 
         if data := await collection.find_one({"_id": member.guild.id}):
             muted = member.guild.get_role(data["mute_role"]) or discord.utils.get(
@@ -126,17 +119,13 @@ class Member(Cog, command_attrs=dict(hidden=True)):
     @Cog.listener()
     async def on_member_update(self, before, after):
         await self.bot.wait_until_ready()
-        if data := await log.find_one(
-            {"_id": after.guild.id, "on_member_update": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            after.guild.id, "on_member_update"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_member_update"], session=self.bot.session
-            )
             ch = ""
             for i, j in self._member_change(before, after):
                 ch += f"{i} {j}\n"
-            if webhook:
-                content = f"""**On Member Update**
+            content = f"""**On Member Update**
 
 `Name       :` **{after.name} (`{after.id}`)**
 `Account age:` **{discord.utils.format_dt(after.created_at)}**
@@ -147,11 +136,11 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 **Change/Update (Before)**
 {ch}
 """
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                )
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+            )
 
     @Cog.listener()
     async def on_voice_state_update(self, member, before, after):
@@ -159,14 +148,10 @@ class Member(Cog, command_attrs=dict(hidden=True)):
         if member.bot:
             return
         if before is None:
-            if data := await log.find_one(
-                {"_id": member.guild.id, "on_vc_join": {"$exists": True}}
+            if webhook := await self.bot.log_webhooks.get(
+                member.guild.id, "on_vc_join"
             ):
-                webhook = discord.Webhook.from_url(
-                    data["on_vc_join"], session=self.bot.session
-                )
-                if webhook:
-                    content = f"""**On VC Join Event**
+                content = f"""**On VC Join Event**
 
 `Member     :` **{member}** (`{member.id}`)
 `Channel    :` **{before.channel.mention}** (`{before.channel.id}`)
@@ -175,22 +160,18 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 `Self Mute  :` **{before.self_mute}**
 `Self Deaf  :` **{before.self_deaf}**
 """
-                    await webhook.send(
-                        content=content,
-                        avatar_url=self.bot.user.avatar.url,
-                        username=self.bot.user.name,
-                    )
-                    return
+                await webhook.send(
+                    content=content,
+                    avatar_url=self.bot.user.avatar.url,
+                    username=self.bot.user.name,
+                )
+                return
 
         if after is None:
-            if data := await log.find_one(
-                {"_id": member.guild.id, "on_vc_leave": {"$exists": True}}
+            if webhook := await self.bot.log_webhooks.get(
+                member.guild.id, "on_vc_leave"
             ):
-                webhook = discord.Webhook.from_url(
-                    data["on_vc_leave"], session=self.bot.session
-                )
-                if webhook:
-                    content = f"""**On VC Leave Event**
+                content = f"""**On VC Leave Event**
 
 `Member     :` **{member}** (`{member.id}`)
 `Channel    :` **{after.channel.mention}** (`{after.channel.id}`)
@@ -199,22 +180,18 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 `Self Mute  :` **{after.self_mute}**
 `Self Deaf  :` **{after.self_deaf}**
 """
-                    await webhook.send(
-                        content=content,
-                        avatar_url=self.bot.user.avatar.url,
-                        username=self.bot.user.name,
-                    )
-                    return
+                await webhook.send(
+                    content=content,
+                    avatar_url=self.bot.user.avatar.url,
+                    username=self.bot.user.name,
+                )
+                return
 
         if before and after:
-            if data := await log.find_one(
-                {"_id": member.guild.id, "on_vc_move": {"$exists": True}}
+            if webhook := await self.bot.log_webhooks.get(
+                member.guild.id, "on_vc_move"
             ):
-                webhook = discord.Webhook.from_url(
-                    data["on_vc_move"], session=self.bot.session
-                )
-                if webhook:
-                    content = f"""**On VC Move Event**
+                content = f"""**On VC Move Event**
 
 `Member     :` **{member}** (`{member.id}`)
 `Channel (A):` **{after.channel.mention}** (`{after.channel.id}`) 
@@ -224,12 +201,12 @@ class Member(Cog, command_attrs=dict(hidden=True)):
 `Self Mute  :` **A: {after.self_mute}** | **B: {after.self_mute}**
 `Self Deaf  :` **A: {after.self_deaf}** | **B: {after.self_deaf}**
 """
-                    await webhook.send(
-                        content=content,
-                        avatar_url=self.bot.user.avatar.url,
-                        username=self.bot.user.name,
-                    )
-                    return
+                await webhook.send(
+                    content=content,
+                    avatar_url=self.bot.user.avatar.url,
+                    username=self.bot.user.name,
+                )
+                return
 
     @Cog.listener()
     async def on_presence_update(self, before, after):
@@ -10,7 +10,6 @@ import json
 class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.collection = parrot_db["logging"]
 
     def permissions_to_json(self, permissions) -> str:
         return json.dumps(dict(permissions), indent=4) if permissions else "{}"
@@ -20,18 +19,12 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
         await self.bot.wait_until_ready()
         if not role.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": role.guild.id, "on_role_create": {"$exists": True}}
-        ):
-            webhook = discord.Webhook.from_url(
-                data["on_role_create"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in role.guild.audit_logs(
-                    action=discord.AuditLogAction.role_create, limit=5
-                ):
-                    if entry.target.id == role.id:
-                        content = f"""**Role Create**
+        if webhook := await self.bot.log_webhooks.get(role.guild.id, "on_role_create"):
+            async for entry in role.guild.audit_logs(
+                action=discord.AuditLogAction.role_create, limit=5
+            ):
+                if entry.target.id == role.id:
+                    content = f"""**Role Create**
 
 `Name (ID)  :` **{role.name} [`{role.id}`]**
 `Created At :` **{discord.utils.format_dt(role.created_at)}**
@@ -42,34 +35,28 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
 `Bot Managed:` **{role.is_bot_managed()}**
 `Integrated :` **{role.is_integration()}**
 """
-                        fp = io.ByteIO(
-                            self.permissions_to_json(role.permissions).encode()
-                        )
-                        await webhook.send(
-                            content=content,
-                            avatar_url=self.bot.user.avatar.url,
-                            username=self.bot.user.name,
-                            file=discord.File(fp, filename="permissions.json"),
-                        )
-                        break
+                    fp = io.ByteIO(
+                        self.permissions_to_json(role.permissions).encode()
+                    )
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                        file=discord.File(fp, filename="permissions.json"),
+                    )
+                    break
 
     @Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role):
         await self.bot.wait_until_ready()
         if not role.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": role.guild.id, "on_role_delete": {"$exists": True}}
-        ):
-            webhook = discord.Webhook.from_url(
-                data["on_role_delete"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in role.guild.audit_logs(
-                    action=discord.AuditLogAction.role_create, limit=5
-                ):
-                    if entry.target.id == role.id:
-                        content = f"""**Role Create**
+        if webhook := await self.bot.log_webhooks.get(role.guild.id, "on_role_delete"):
+            async for entry in role.guild.audit_logs(
+                action=discord.AuditLogAction.role_create, limit=5
+            ):
+                if entry.target.id == role.id:
+                    content = f"""**Role Create**
 
 `Name (ID)  :` **{role.name} [`{role.id}`]**
 `Created At :` **{discord.utils.format_dt(role.created_at)}**
@@ -80,25 +67,25 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
 `Bot Managed:` **{role.is_bot_managed()}**
 `Integrated :` **{role.is_integration()}**
 """
-                        fp = io.ByteIO(
-                            self.permissions_to_json(role.permissions).encode()
-                        )
-                        await webhook.send(
-                            content=content,
-                            avatar_url=self.bot.user.avatar.url,
-                            username=self.bot.user.name,
-                            file=discord.File(fp, filename="permissions.json"),
-                        )
-                        break
-
-        if data := await parrot_db["server_config"].find_one({"_id": role.guild.id}):
+                    fp = io.ByteIO(
+                        self.permissions_to_json(role.permissions).encode()
+                    )
+                    await webhook.send(
+                        content=content,
+                        avatar_url=self.bot.user.avatar.url,
+                        username=self.bot.user.name,
+                        file=discord.File(fp, filename="permissions.json"),
+                    )
+                    break
+
+        if data := await self.bot.server_config.fetch(role.guild.id):
             if data["mod_role"] == role.id:
-                await parrot_db["server_config"].update_one(
-                    {"_id": role.guild.id}, {"$set": {"mod_role": None}}
+                await self.bot.update_server_config(
+                    role.guild.id, {"$set": {"mod_role": None}}
                 )
             if data["mute_role"] == role.id:
-                await parrot_db["server_config"].update_one(
-                    {"_id": role.guild.id}, {"$set": {"mute_role": None}}
+                await self.bot.update_server_config(
+                    role.guild.id, {"$set": {"mute_role": None}}
                 )
 
         if data := await parrot_db["global_chat"].find_one({"_id": role.guild.id}):
@@ -106,6 +93,7 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
                 await parrot_db["global_chat"].update_one(
                     {"_id": role.guild.id}, {"$set": {"ignore_role": None}}
                 )
+                await self.bot.global_chat.refresh(role.guild.id)
 
         if data := await parrot_db["telephone"].find_one({"_id": role.guild.id}):
             if data["pingrole"] == role.id:
@@ -146,25 +134,21 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
         await self.bot.wait_until_ready()
         if not after.guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": before.guild.id, "on_role_update": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            before.guild.id, "on_role_update"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_role_update"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in after.guild.audit_logs(
-                    action=discord.AuditLogAction.role_update, limit=5
-                ):
-                    if entry.extra.id == after.id:
-                        reason = entry.reason or None
-                        user = entry.user or "UNKNOWN#0000"
-                        entryID = entry.id
-                        ls = self._update_change(before, after)
-                        ext = ""
-                        for i, j in ls:
-                            ext += f"{i} **{j}**\n"
-                        content = f"""**Role Update Event**
+            async for entry in after.guild.audit_logs(
+                action=discord.AuditLogAction.role_update, limit=5
+            ):
+                if entry.extra.id == after.id:
+                    reason = entry.reason or None
+                    user = entry.user or "UNKNOWN#0000"
+                    entryID = entry.id
+                    ls = self._update_change(before, after)
+                    ext = ""
+                    for i, j in ls:
+                        ext += f"{i} **{j}**\n"
+                    content = f"""**Role Update Event**
 
 `Name (ID) :` **{after.name} ({after.id})**
 `Created at:` **<t:{int(after.created_at.timestamp())}>**
@@ -175,40 +159,34 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
 **Change/Update**
 {ext}
 """
-                        break
-                fp = io.BytesIO(self.permissions_to_json(after.permissions).encode())
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="permissions.json"),
-                )
+                    break
+            fp = io.BytesIO(self.permissions_to_json(after.permissions).encode())
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="permissions.json"),
+            )
 
     @Cog.listener()
     async def on_guild_emojis_update(self, guild, before, after):
         await self.bot.wait_until_ready()
         if not guild.me.guild_permissions.view_audit_log:
             return
-        if data := await self.collection.find_one(
-            {"_id": guild.id, "on_emoji_create": {"$exists": True}}
-        ):
-            webhook = discord.Webhook.from_url(
-                data["on_emoji_create"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in guild.audit_logs(
-                    action=discord.AuditLogAction.emoji_create, limit=1
-                ):
-                    emoji_name = entry.name
-                    if isinstance(entry.target, discord.Emoji):
-                        animated = entry.target.animated
-                        _id = entry.target.id
-                        url = entry.target.url
-                    else:
-                        animated = None
-                        _id = entry.target.id
-                        url = None
-                content = f"""**On Emoji Create**
+        if webhook := await self.bot.log_webhooks.get(guild.id, "on_emoji_create"):
+            async for entry in guild.audit_logs(
+                action=discord.AuditLogAction.emoji_create, limit=1
+            ):
+                emoji_name = entry.name
+                if isinstance(entry.target, discord.Emoji):
+                    animated = entry.target.animated
+                    _id = entry.target.id
+                    url = entry.target.url
+                else:
+                    animated = None
+                    _id = entry.target.id
+                    url = None
+            content = f"""**On Emoji Create**
 
 `Name    `: **{emoji_name}**
 `Raw     `: **`{entry.target if isinstance(entry.target, discord.Emoji) else None}`**
@@ -222,26 +200,20 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
                 username=self.bot.user.name,
             )
 
-        if data := await self.collection.find_one(
-            {"_id": guild.id, "on_emoji_delete": {"$exists": True}}
-        ):
-            webhook = discord.Webhook.from_url(
-                data["on_emoji_delete"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in guild.audit_logs(
-                    action=discord.AuditLogAction.emoji_delete, limit=1
-                ):
-                    emoji_name = entry.name
-                    if isinstance(entry.target, discord.Emoji):
-                        animated = entry.target.animated
-                        _id = entry.target.id
-                        url = entry.target.url
-                    else:
-                        animated = None
-                        _id = entry.target.id
-                        url = None
-                content = f"""**On Emoji Create**
+        if webhook := await self.bot.log_webhooks.get(guild.id, "on_emoji_delete"):
+            async for entry in guild.audit_logs(
+                action=discord.AuditLogAction.emoji_delete, limit=1
+            ):
+                emoji_name = entry.name
+                if isinstance(entry.target, discord.Emoji):
+                    animated = entry.target.animated
+                    _id = entry.target.id
+                    url = entry.target.url
+                else:
+                    animated = None
+                    _id = entry.target.id
+                    url = None
+            content = f"""**On Emoji Create**
 
 `Raw     `: **`{entry.target if isinstance(entry.target, discord.Emoji) else None}`**
 `ID      `: **{_id}**
@@ -253,26 +225,20 @@ class GuildRoleEmoji(Cog, command_attrs=dict(hidden=True)):
                 username=self.bot.user.name,
             )
 
-        if data := await self.collection.find_one(
-            {"_id": guild.id, "on_emoji_update": {"$exists": True}}
-        ):
-            webhook = discord.Webhook.from_url(
-                data["on_emoji_update"], session=self.bot.session
-            )
-            if webhook:
-                async for entry in guild.audit_logs(
-                    action=discord.AuditLogAction.emoji_update, limit=1
-                ):
-                    emoji_name = entry.name
-                    if isinstance(entry.target, discord.Emoji):
-                        animated = entry.target.animated
-                        _id = entry.target.id
-                        url = entry.target.url
-                    else:
-                        animated = None
-                        _id = entry.target.id
-                        url = None
-                content = f"""**On Emoji Create**
+        if webhook := await self.bot.log_webhooks.get(guild.id, "on_emoji_update"):
+            async for entry in guild.audit_logs(
+                action=discord.AuditLogAction.emoji_update, limit=1
+            ):
+                emoji_name = entry.name
+                if isinstance(entry.target, discord.Emoji):
+                    animated = entry.target.animated
+                    _id = entry.target.id
+                    url = entry.target.url
+                else:
+                    animated = None
+                    _id = entry.target.id
+                    url = None
+            content = f"""**On Emoji Create**
 
 `Raw     `: **`{entry.target if isinstance(entry.target, discord.Emoji) else None}`**
 `ID      `: **{_id}**
@@ -10,7 +10,7 @@ from core import Parrot, Context, Cog
 
 from utilities.log import get_logger
 from utilities.exceptions import ParrotCheckFailure
-from utilities.database import parrot_db, cmd_increment
+from utilities.database import parrot_db
 
 with open("extra/quote.txt") as f:
     quote = f.read()
@@ -49,14 +49,15 @@ class Cmd(Cog, command_attrs=dict(hidden=True)):
 
     def __init__(self, bot: Parrot):
         self.bot = bot
-        self.collection = parrot_db["logging"]
 
     @Cog.listener()
     async def on_command(self, ctx: Context):
         """This event will be triggered when the command is being completed; triggered by [discord.User]!"""
         if ctx.author.bot:
             return
-        await cmd_increment(ctx.command.qualified_name)
+        self.bot.write_behind.inc(
+            parrot_db["cmd_count"], ctx.command.qualified_name, {"count": 1}
+        )
 
     @Cog.listener()
     async def on_command_completion(self, ctx: Context):
@@ -64,45 +65,36 @@ class Cmd(Cog, command_attrs=dict(hidden=True)):
         if ctx.cog is None:
             return
         if ctx.cog.qualified_name.lower() == "moderator":
-            if data := await self.collection.find_one(
-                {"_id": ctx.guild.id, "on_mod_commands": {"$exists": True}}
+            if webhook := await self.bot.log_webhooks.get(
+                ctx.guild.id, "on_mod_commands"
             ):
-                webhook = discord.Webhook.from_url(
-                    data["on_mod_commands"], session=self.bot.session
-                )
-                if webhook:
-                    main_content = f"""**On Moderator Command**
+                main_content = f"""**On Moderator Command**
 
 `Mod    `: **{ctx.author}**
 `Command`: **{ctx.command.qualified_name}**
 `Content`: **{ctx.message.content}**
 """
-                    await webhook.send(
-                        content=main_content,
-                        avatar_url=self.bot.user.avatar.url,
-                        username=self.bot.user.name,
-                    )
+                await webhook.send(
+                    content=main_content,
+                    avatar_url=self.bot.user.avatar.url,
+                    username=self.bot.user.name,
+                )
 
         if ctx.cog.qualified_name.lower() == "botconfig":
-            await self.bot.update_server_config_cache(ctx.guild.id)
-            if data := await self.collection.find_one(
-                {"_id": ctx.guild.id, "on_config_commands": {"$exists": True}}
+            if webhook := await self.bot.log_webhooks.get(
+                ctx.guild.id, "on_config_commands"
             ):
-                webhook = discord.Webhook.from_url(
-                    data["on_config_commands"], session=self.bot.session
-                )
-                if webhook:
-                    main_content = f"""**On Config Command**
+                main_content = f"""**On Config Command**
 
 `Admin  `: **{ctx.author}**
 `Command`: **{ctx.command.qualified_name}**
 `Content`: **{ctx.message.content}**
 """
-                    await webhook.send(
-                        content=main_content,
-                        avatar_url=self.bot.user.avatar.url,
-                        username=self.bot.user.name,
-                    )
+                await webhook.send(
+                    content=main_content,
+                    avatar_url=self.bot.user.avatar.url,
+                    username=self.bot.user.name,
+                )
 
     @Cog.listener()
     async def on_command_error(self, ctx: Context, error):
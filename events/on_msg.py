@@ -7,31 +7,25 @@ from core import Parrot, Cog
 
 from discord.ext import commands
 
-import aiohttp
 import asyncio
 import discord
 import io
 import json
-from discord import Webhook
 import textwrap
 import re
 from aiohttp import ClientResponseError
 from urllib.parse import quote_plus
 
 import typing as tp
-from pymongo import InsertOne, DeleteMany, ReplaceOne, UpdateOne
+from pymongo import InsertOne, DeleteMany, ReplaceOne
+from lru import LRU
 
-from utilities.database import parrot_db
+from utilities.database import msg_db
 from utilities.regex import LINKS_NO_PROTOCOLS, INVITE_RE
+from utilities.wordfilter import GLOBAL_CHAT_MATCHER
 
 from time import time
 
-collection = parrot_db["global_chat"]
-afk = parrot_db["afk"]
-timer = parrot_db["timers"]
-
-with open("extra/profanity.json") as f:
-    bad_dict = json.load(f)
 
 TRIGGER = (
     "ok google,",
@@ -101,14 +95,14 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
             3, 5, commands.BucketType.channel
         )
         self.collection = None
-        self.log_collection = parrot_db["logging"]
         self.pattern_handlers = [
             (GITHUB_RE, self._fetch_github_snippet),
             (GITHUB_GIST_RE, self._fetch_github_gist_snippet),
             (GITLAB_RE, self._fetch_gitlab_snippet),
             (BITBUCKET_RE, self._fetch_bitbucket_snippet),
         ]
-        self.message_append = []
+        # member id -> xp, as of the last database read plus the buffered increments
+        self.xp: LRU = LRU(10000)
         self.message_cooldown = commands.CooldownMapping.from_cooldown(
             1, 10, commands.BucketType.member, 
         )
@@ -294,7 +288,7 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
     async def query_ddg(self, query: str) -> tp.Optional[str]:
         link = "https://api.duckduckgo.com/?q={}&format=json&pretty=1".format(query)
         # saying `ok google`, and querying from ddg LOL.
-        res = await self.bot.session.get(link)
+        res = await self.bot.http_session.get(link)
         data = json.loads(await res.text())
         if data.get("Abstract"):
             return data.get("Abstract")
@@ -324,12 +318,7 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
                     pass
 
     def refrain_message(self, msg: str):
-        if "chod" in msg.replace(",", "").split(" "):
-            return False
-        for bad_word in bad_dict:
-            if bad_word.lower() in msg.replace(",", "").split(" "):
-                return False
-        return True
+        return GLOBAL_CHAT_MATCHER.search(msg) is None
 
     def is_banned(self, user) -> bool:
         # return True if member is banned else False
@@ -341,14 +330,10 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
             return bool(self.bot.banned_users[user.id].get("global"))
 
     async def on_invite(self, message: discord.Message, invite_link: list):
-        if data := await self.log_collection.find_one(
-            {"_id": message.guild.id, "on_invite_post": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            message.guild.id, "on_invite_post"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_invite_post"], session=self.bot.session
-            )
-            if webhook:
-                content = f"""**Invite Link Posted**
+            content = f"""**Invite Link Posted**
 
 `Author (ID):` **{message.author} [`{message.author.id}`]**
 `Message ID :` **{message.id}**
@@ -357,19 +342,19 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
 
 `Content    :` **{message.content[:250:]}**
 """
-                msg = message
-                if content:
-                    fp = io.BytesIO(
-                        f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
-                    )
-                else:
-                    fp = io.BytesIO("NOTHING HERE".encode())
-                await webhook.send(
-                    content=content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="content.txt"),
+            msg = message
+            if content:
+                fp = io.BytesIO(
+                    f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
                 )
+            else:
+                fp = io.BytesIO("NOTHING HERE".encode())
+            await webhook.send(
+                content=content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="content.txt"),
+            )
 
     @Cog.listener()
     async def on_message(self, message):
@@ -396,13 +381,12 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
 
         await self.quick_answer(message)
         await self._on_message_passive(message)
-        channel = await collection.find_one(
-            {"_id": message.guild.id, "channel_id": message.channel.id}
-        )
+        await self._on_message_leveling(message)
+        entry = await self.bot.global_chat.get(message.guild.id)
         if links := INVITE_RE.findall(message.content):
             await self.on_invite(message, links)
 
-        if channel:
+        if entry is not None and entry.channel_id == message.channel.id:
             bucket = self.cd_mapping.get_bucket(message)
             retry_after = bucket.update_rate_limit()
 
@@ -412,9 +396,7 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
                     delete_after=10,
                 )
 
-            guild = channel
-            role_id = guild.get("ignore_role") or guild.get("ignore-role") or 0
-            if message.author._roles.has(role_id):
+            if message.author._roles.has(entry.ignore_role):
                 return
 
             if message.content.startswith(
@@ -471,25 +453,12 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
                     "Bot requires **Manage Messages** permission(s) to function properly."
                 )
 
-            async for webhook in collection.find({}, {"webhook": 1}):
-                hook = webhook["webhook"]
-                if hook:
-                    try:
-                        async with aiohttp.ClientSession() as session:
-                            webhook = Webhook.from_url(f"{hook}", session=session)
-                            if webhook:
-                                await webhook.send(
-                                    content=message.content[:1990],
-                                    username=f"{message.author}",
-                                    avatar_url=message.author.display_avatar.url,
-                                    allowed_mentions=discord.AllowedMentions.none(),
-                                )
-                    except discord.NotFound:
-                        await collection.delete_one(
-                            {"webhook": hook}
-                        )  # all hooks are unique
-                    except discord.HTTPException as e:
-                        pass
+            await self.bot.global_chat.broadcast(
+                content=message.content[:1990],
+                username=f"{message.author}",
+                avatar_url=message.author.display_avatar.url,
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
 
     @Cog.listener()
     async def on_message_delete(self, message):
@@ -502,75 +471,67 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
     @Cog.listener()
     async def on_raw_message_delete(self, payload):
         await self.bot.wait_until_ready()
-        if data := await self.log_collection.find_one(
-            {"_id": payload.guild_id, "on_message_delete": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            payload.guild_id, "on_message_delete"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_message_delete"], session=self.bot.session
-            )
-            if webhook:
-                if payload.cached_message:
-                    msg = payload.cached_message
-                    message_author = msg.author
-                    if (message_author.id == self.bot.user.id) or message_author.bot:
-                        return
-                    content = msg.content
-                else:
+            if payload.cached_message:
+                msg = payload.cached_message
+                message_author = msg.author
+                if (message_author.id == self.bot.user.id) or message_author.bot:
                     return
+                content = msg.content
+            else:
+                return
 
-                main_content = f"""**Message Delete Event**
+            main_content = f"""**Message Delete Event**
 
 `ID      :` **{payload.message_id}**
 `Channel :` **<#{payload.channel_id}>**
 `Author  :` **{message_author}**
 `Deleted at:` **<t:{int(time())}>**
 """
-                if content:
-                    fp = io.BytesIO(
-                        f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
-                    )
-                else:
-                    fp = io.BytesIO("NOTHING HERE".encode())
-                await webhook.send(
-                    content=main_content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="content.txt"),
+            if content:
+                fp = io.BytesIO(
+                    f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
                 )
+            else:
+                fp = io.BytesIO("NOTHING HERE".encode())
+            await webhook.send(
+                content=main_content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="content.txt"),
+            )
 
     @Cog.listener()
     async def on_raw_bulk_message_delete(self, payload):
         await self.bot.wait_until_ready()
-        if data := await self.log_collection.find_one(
-            {"_id": payload.guild_id, "on_bulk_message_delete": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            payload.guild_id, "on_bulk_message_delete"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_bulk_message_delete"], session=self.bot.session
-            )
             main = ""
-            if webhook:
-                if payload.cached_messages:
-                    msgs = payload.cached_messages
-                else:
-                    msgs = []
-                for msg in msgs:
-                    if not msg.bot:
-                        main += f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n"
-                if msgs:
-                    fp = io.BytesIO(main.encode())
-                else:
-                    fp = io.BytesIO("NOTHING HERE", filename="content.txt")
-                main_content = f"""**Bulk Message Delete**
+            if payload.cached_messages:
+                msgs = payload.cached_messages
+            else:
+                msgs = []
+            for msg in msgs:
+                if not msg.bot:
+                    main += f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n"
+            if msgs:
+                fp = io.BytesIO(main.encode())
+            else:
+                fp = io.BytesIO("NOTHING HERE", filename="content.txt")
+            main_content = f"""**Bulk Message Delete**
 
 `Total Messages:` **{len(msgs)}**
 `Channel       :` **<#{payload.channel_id}>**
 """
-                await webhook.send(
-                    content=main_content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="content.txt"),
-                )
+            await webhook.send(
+                content=main_content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="content.txt"),
+            )
 
     @Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
@@ -584,7 +545,9 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
         if message.author.bot:
             return
 
-        self.message_append.append(UpdateOne({"_id": message.author.id}, {"$inc": {"count": 1}}, upsert=True))
+        self.bot.write_behind.inc(
+            msg_db[f"{message.guild.id}"], message.author.id, {"count": 1}
+        )
 
         bucket = self.message_cooldown.get_bucket(message)
         retry_after = bucket.update_rate_limit()
@@ -592,34 +555,34 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
         if retry_after:
             return
 
-        try:
-            enable = self.bot.server_config[message.guild.id]["leveling"]["enable"]
-        except KeyError:
+        data = await self.bot.server_config.fetch(message.guild.id)
+        leveling = data.get("leveling") or {}
+        if not leveling.get("enable"):
             return
 
-        try:
-            role = self.bot.server_config[message.guild.id]["leveling"]["ignore_role"] or 0
-        except KeyError:
-            role = 0
-
+        role = leveling.get("ignore_role") or 0
         if message.author._roles.has(role):
             return
 
-        if enable:
-            await self.__add_xp(member=message.author, xp=12, msg=message)
-
-        try:
-            channel = self.bot.server_config[message.guild.id]["leveling"]["channel"]
-        except KeyError:
-            return
-        else:
-            pass
+        await self.__add_xp(member=message.author, xp=12, msg=message)
 
     async def __add_xp(self, *, member: discord.Member, xp: int, msg: discord.Message):
         collection = self.bot.mongo.leveling[f"{member.guild.id}"]
-        data = await collection.find_one_and_update({"_id": member.id}, {"$inc": {"xp": xp}})
-        level = int((data["xp"]//42) ** 0.55)
-        await self.__add_role__xp(msg.guild.id, level, msg)
+        key = (member.guild.id, member.id)
+        try:
+            current = self.xp[key]
+        except KeyError:
+            data = await collection.find_one({"_id": member.id}) or {}
+            current = data.get("xp", 0) + self.bot.write_behind.pending(
+                collection, member.id, "xp"
+            )
+        current += xp
+        self.xp[key] = current
+        self.bot.write_behind.inc(collection, member.id, {"xp": xp})
+        level = int((current//42) ** 0.55)
+        # rewards are only handed out on level up, not on every message
+        if level > int(((current - xp)//42) ** 0.55):
+            await self.__add_role__xp(msg.guild.id, level, msg)
 
     async def __add_role__xp(self, guild_id: int, level: int, msg: discord.Message):
         try:
@@ -628,7 +591,7 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
             return
         
         for reward in ls:
-            if reward['lvl'] <= level:
+            if reward['lvl'] <= level and not msg.author._roles.has(reward["role"]):
                 await self.__add_roles(msg.author, discord.Object(id=reward["role"]), reason=f"Level Up role! On reaching: {level}")
 
     async def __add_roles(self, member, role: tp.Union[discord.Roles, discord.Object], reason: tp.Optional[str]=None):
@@ -644,79 +607,58 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
             return
 
         # code: when the AFK user messages
-        if message.author.id in self.bot.afk:
-            if data := await afk.find_one(
-                {
-                    "$or": [
-                        {"messageAuthor": message.author.id, "guild": message.guild.id},
-                        {"messageAuthor": message.author.id, "global": True},
-                    ]
-                }
-            ):
+        if data := await self.bot.afk.get(message.author.id, message.guild.id):
+            if message.channel.id in data["ignoredChannel"]:
+                return  # There exists `$nin` operator in MongoDB
+            await message.channel.send(
+                f"{message.author.mention} welcome back! You were AFK <t:{int(data['at'])}:R>\n"
+                f"> You were mentioned **{len(data['pings'])}** times"
+            )
+            try:
+                if str(message.author.display_name).startswith(("[AFK]", "[AFK] ")):
+                    name = message.author.display_name[5:]
+                    if len(name) != 0 or name not in (" ", ""):
+                        await message.author.edit(
+                            nick=name, reason=f"{message.author} came after AFK"
+                        )
+            except discord.Forbidden:
+                pass
+            await self.bot.afk.remove(data["_id"])
+            await self.bot.get_cog("Utils").delete_timer(_id=data["_id"])
+
+        # code from someone mentions the AFK user
+        for user in message.mentions:
+            if data := await self.bot.afk.get(user.id, message.guild.id):
                 if message.channel.id in data["ignoredChannel"]:
-                    return  # There exists `$nin` operator in MongoDB
+                    continue
+                post = {
+                    "messageAuthor": message.author.id,
+                    "channel": message.channel.id,
+                    "messageURL": message.jump_url,
+                }
+                self.bot.afk.add_ping(data, post)
                 await message.channel.send(
-                    f"{message.author.mention} welcome back! You were AFK <t:{int(data['at'])}:R>\n"
-                    f"> You were mentioned **{len(data['pings'])}** times"
+                    f"{message.author.mention} {self.bot.get_user(data['messageAuthor'])} is AFK: {data['text']}"
                 )
-                try:
-                    if str(message.author.display_name).startswith(("[AFK]", "[AFK] ")):
-                        name = message.author.display_name[5:]
-                        if len(name) != 0 or name not in (" ", ""):
-                            await message.author.edit(
-                                nick=name, reason=f"{message.author} came after AFK"
-                            )
-                except discord.Forbidden:
-                    pass
-                await afk.delete_one({"_id": data["_id"]})
-                await timer.delete_one({"_id": data["_id"]})
-                self.bot.afk = set(await afk.distinct("messageAuthor"))
-
-        # code from someone mentions the AFK user
-        if message.mentions:
-            for user in message.mentions:
-                if data := await afk.find_one(
-                    {
-                        "$or": [
-                            {"messageAuthor": user.id, "guild": user.guild.id},
-                            {"messageAuthor": user.id, "global": True},
-                        ]
-                    }
-                ):
-                    if message.channel.id in data["ignoredChannel"]:
-                        return
-                    post = {
-                        "messageAuthor": message.author.id,
-                        "channel": message.channel.id,
-                        "messageURL": message.jump_url,
-                    }
-                    afk.update_one({"_id": data["_id"]}, {"$addToSet": {"pings": post}})
-                    await message.channel.send(
-                        f"{message.author.mention} {self.bot.get_user(data['messageAuthor'])} is AFK: {data['text']}"
-                    )
 
     @Cog.listener()
     async def on_raw_message_edit(self, payload):
         await self.bot.wait_until_ready()
-        if data := await self.log_collection.find_one(
-            {"_id": payload.guild_id, "on_message_edit": {"$exists": True}}
+        if webhook := await self.bot.log_webhooks.get(
+            payload.guild_id, "on_message_edit"
         ):
-            webhook = discord.Webhook.from_url(
-                data["on_message_edit"], session=self.bot.session
-            )
-            if webhook:
-                if payload.cached_message:
-                    msg = payload.cached_message
-                    message_author = msg.author
-                    if message_author.bot:
-                        return
-                    content = msg.content
-                else:
-                    # guild = self.bot.get_guild(payload.guild_id)
-                    message_author = None
-                    content = None
-
-                main_content = f"""**Message Edit Event**
+            if payload.cached_message:
+                msg = payload.cached_message
+                message_author = msg.author
+                if message_author.bot:
+                    return
+                content = msg.content
+            else:
+                # guild = self.bot.get_guild(payload.guild_id)
+                message_author = None
+                content = None
+
+            main_content = f"""**Message Edit Event**
 
 `ID       :` **{payload.message_id}**
 `Channel  :` **<#{payload.channel_id}>**
@@ -724,18 +666,18 @@ class OnMsg(Cog, command_attrs=dict(hidden=True)):
 `Edited at:` **<t:{int(time())}>**
 `Jump URL :` **<https://discord.com/channels/{payload.guild_id}/{payload.channel_id}/{payload.message_id}>**
 """
-                if content:
-                    fp = io.BytesIO(
-                        f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
-                    )
-                else:
-                    fp = io.BytesIO("NOTHING HERE".encode())
-                await webhook.send(
-                    content=main_content,
-                    avatar_url=self.bot.user.avatar.url,
-                    username=self.bot.user.name,
-                    file=discord.File(fp, filename="content.txt"),
+            if content:
+                fp = io.BytesIO(
+                    f"[{msg.created_at}] {msg.author.name}#{msg.author.discriminator} | {msg.content if msg.content else ''} {', '.join([i.url for i in msg.attachments]) if msg.attachments else ''} {', '.join([str(i.to_dict()) for i in msg.embeds]) if msg.embeds else ''}\n".encode()
                 )
+            else:
+                fp = io.BytesIO("NOTHING HERE".encode())
+            await webhook.send(
+                content=main_content,
+                avatar_url=self.bot.user.avatar.url,
+                username=self.bot.user.name,
+                file=discord.File(fp, filename="content.txt"),
+            )
 
 
 def setup(bot):
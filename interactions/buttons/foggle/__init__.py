@@ -7,13 +7,14 @@ import re
 from functools import wraps
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import Literal, NamedTuple, Optional, List, Dict
+from typing import Literal, Optional, List, Dict
 
 import discord
 from discord.ext import commands
 from discord.ext import old_menus as menus
 
 from core import Parrot, Cog, Context
+from utilities.word_graph import grid_neighbours
 
 from .parser import View
 
@@ -171,11 +172,6 @@ The original rules can be found below:
 """
 
 
-class Position(NamedTuple):
-    col: int
-    row: int
-
-
 class Board:
     def __init__(
         self, *, size: int = ORIGINAL, base: int = 10, board=None, magic_number=None
@@ -199,71 +195,60 @@ class Board:
         self.columns = board
         self.number = magic_number
 
-    def board_contains(
-        self, numbers: str, pos: Position = None, passed: List[Position] = None
-    ) -> bool:
-        if passed is None:
-            passed = []
-        # Empty numberss
+        # cells holding each digit, so chains are only searched from and
+        # through matching cells
+        self.digits = [digit for column in board for digit in column]
+        self.cells: Dict[str, List[int]] = defaultdict(list)
+        for cell, digit in enumerate(self.digits):
+            self.cells[digit].append(cell)
+        self._legal: Dict[str, bool] = {}
+
+    def board_contains(self, numbers: str) -> bool:
         if len(numbers) == 0:
             return True
+        # not enough cells of some digit, no need to search
+        if any(numbers.count(d) > len(self.cells.get(d, ())) for d in set(numbers)):
+            return False
 
-        # When starting out
-        if pos is None:
-
-            # Check all positions
-            for col in range(self.size):
-                for row in range(self.size):
-                    if self.board_contains(numbers, Position(col, row)):
-                        return True
-
-        # Checking new squares
-        elif pos not in passed:
-            # Check if letter matches current start of numbers
-            if numbers[0] == self.columns[pos.col][pos.row]:
-
-                # Check adjacent for next letter
-                for x in range(-1, 2):
-                    for y in range(-1, 2):
-
-                        # don't check yourself
-                        if x == 0 and y == 0:
-                            continue
-
-                        new_pos = Position(pos.col + x, pos.row + y)
-
-                        # don't check out of bounds
-                        if (
-                            new_pos.col < 0
-                            or new_pos.col >= self.size
-                            or new_pos.row < 0
-                            or new_pos.row >= self.size
-                        ):
-                            continue
-
-                        if self.board_contains(numbers[1:], new_pos, [*passed, pos]):
-                            return True
+        neighbours = grid_neighbours(self.size)
+        digits = self.digits
+
+        def visit(cell: int, i: int, passed: int) -> bool:
+            if i == len(numbers):
+                return True
+            passed |= 1 << cell
+            return any(
+                visit(new_cell, i + 1, passed)
+                for new_cell in neighbours[cell]
+                if not passed >> new_cell & 1 and digits[new_cell] == numbers[i]
+            )
 
-        # Otherwise cannot find numbers
-        return False
+        return any(visit(cell, 1, 0) for cell in self.cells.get(numbers[0], ()))
 
     def get_chain(self, equation: str) -> str:
         view = View(equation, self.base)
         return re.sub(NUMBER_PATTERN, "", view.string)
 
     def is_legal(self, equation: str) -> bool:
+        # scores ask again for every equation, across every board
+        try:
+            return self._legal[equation]
+        except KeyError:
+            pass
+
         view = View(equation, self.base)
 
         # Check equation
         result = view.parse_full()
-        if result is None:  # If equation is invalid discard
-            return False
-        if result != self.number:
-            return False
+        if result is None or result != self.number:  # If equation is invalid
+            legal = False
+        else:
+            # Check chain is valid
+            chain = self.get_chain(equation)
+            legal = len(chain) >= 3 and self.board_contains(chain)
 
-        # Check chain is valid
-        chain = self.get_chain(equation)
-        return len(chain) >= 3 and self.board_contains(chain)
+        self._legal[equation] = legal
+        return legal
 
     def points(self, equation: str) -> int:
         return POINTS[len(self.get_chain(equation))] if self.is_legal(equation) else -1
@@ -312,10 +297,6 @@ class Game(menus.Menu):
             content="Foggle game started, you have 3 minutes!", embed=self.state
         )
 
-    async def start(self, *args, **kwargs):
-        await super().start(*args, **kwargs)
-        # await self.bot.loop.run_in_executor(None, lambda: self.board.legal_equations)
-
     async def finalize(self, timed_out):
         self.bot.dispatch("foggle_game_complete", self.message.channel)
 
@@ -524,15 +505,22 @@ def foggle_game(game_type: type[Game]):
 
             # Start the game
             self.games[ctx.channel] = game = game_type(size=check_size(ctx), base=base)
-            await game.start(ctx, wait=False)
+            self.bot.message_router.register(
+                ctx.channel.id, "foggle", self.on_foggle_message
+            )
+            try:
+                await game.start(ctx, wait=False)
 
-            # Wait for game to end
-            def check(channel):
-                return channel.id == ctx.channel.id
+                # Wait for game to end
+                def check(channel):
+                    return channel.id == ctx.channel.id
 
-            await self.bot.wait_for("foggle_game_complete", check=check, timeout=200)
-            if ctx.channel in self.games:
-                del self.games[ctx.channel]
+                await self.bot.wait_for(
+                    "foggle_game_complete", check=check, timeout=200
+                )
+            finally:
+                self.games.pop(ctx.channel, None)
+                self.bot.message_router.unregister(ctx.channel.id, "foggle")
 
         return command
 
@@ -595,13 +583,11 @@ class Foggle(Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        # Check if channel has a game going
-        if message.channel not in self.games:
-            return
-
-        await self.games[message.channel].check_message(message)
+    async def on_foggle_message(self, message: discord.Message):
+        # the game may have ended while the message was routed
+        game = self.games.get(message.channel)
+        if game is not None:
+            await game.check_message(message)
 
 
 def setup(bot: Parrot):
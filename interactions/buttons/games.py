@@ -16,9 +16,7 @@ from typing import (
     Literal,
     Optional,
     Union,
-    overload,
     Dict,
-    NamedTuple,
     List,
     Tuple,
 )
@@ -40,6 +38,8 @@ from aiofile import async_open
 from interactions.buttons.secret_hitler.ui.join import JoinUI
 from utilities.paginator import ParrotPaginator
 from utilities.constants import Colours
+from utilities.game_ai import GameAI
+from utilities.word_graph import WordGraph, get_dictionary, grid_neighbours
 
 emoji = emojis  # Idk
 SMALL = 3
@@ -132,19 +132,11 @@ DIE = {
 
 # fmt: on
 
-with open("extra/boggle.txt") as f:
-    DICTIONARY = set(f.read().splitlines())
-
 __1 = {3: 1, 4: 1, 5: 2, 6: 3, 7: 5}
 __2 = {x: 11 for x in range(8, SUPER_BIG**2)}
 POINTS = {**__1, **__2}
 
 
-class Position(NamedTuple):
-    col: int
-    row: int
-
-
 def ordinal(number: int, /) -> str:
     return f'{number}{"tsnrhtdd"[(number // 10 % 10 != 1) * (number % 10 < 4) * number % 10 :: 4]}'
 
@@ -166,67 +158,41 @@ class BoardBoogle:
 
         self.columns = board
 
-    def board_contains(
-        self, word: str, pos: Position = None, passed: List[Position] = None
-    ) -> bool:
-        if passed is None:
-            passed = []
-        # Empty words
-        if len(word) == 0:
-            return True
+    @cached_property
+    def legal_words(self) -> frozenset[str]:
+        """Every word of the dictionary the board contains, solved once by
+        walking the board and the dictionary graph together, so a path is
+        abandoned as soon as no word starts with it.
 
-        # When starting out
-        if pos is None:
-
-            # Check all positions
-            for col in range(self.size):
-                for row in range(self.size):
-                    if self.board_contains(word, Position(col, row)):
-                        return True
-
-        # Checking new squares
-        elif pos not in passed:
-            # Check if letter matches current start of word
-            letter = self.columns[pos.col][pos.row]
-            if letter.isdigit():
-                letter = DIAGRAPHS[letter]
-
-            if word[: len(letter)] == letter:
-
-                # Check adjacent for next letter
-                for x in range(-1, 2):
-                    for y in range(-1, 2):
-
-                        # don't check yourself
-                        if x == 0 and y == 0:
-                            continue
-
-                        new_pos = Position(pos.col + x, pos.row + y)
-
-                        # don't check out of bounds
-                        if (
-                            new_pos.col < 0
-                            or new_pos.col >= self.size
-                            or new_pos.row < 0
-                            or new_pos.row >= self.size
-                        ):
-                            continue
-
-                        if self.board_contains(
-                            word[len(letter) :], new_pos, [*passed, pos]
-                        ):
-                            return True
-
-        # Otherwise cannot find word
-        return False
+        Loads the dictionary on first use, run it in an executor.
+        """
+        dictionary = get_dictionary()
+        neighbours = grid_neighbours(self.size)
+        tiles = [
+            DIAGRAPHS.get(letter, letter)
+            for column in self.columns
+            for letter in column
+        ]
+        found: set[str] = set()
+
+        def visit(cell: int, node: int, word: str, passed: int) -> None:
+            node = dictionary.walk(tiles[cell], node)
+            if node == -1:
+                return
+            word += tiles[cell]
+            passed |= 1 << cell
+            if len(word) >= 3 and dictionary.is_word(node):
+                found.add(word)
+            for new_cell in neighbours[cell]:
+                if not passed >> new_cell & 1:
+                    visit(new_cell, node, word, passed)
+
+        for cell in range(len(tiles)):
+            visit(cell, WordGraph.ROOT, "", 0)
+        return frozenset(found)
 
     def is_legal(self, word: str) -> bool:
-        if len(word) < 3:
-            return False
-        word = word.upper()
-        if word not in DICTIONARY:
-            return False
-        return self.board_contains(word)
+        return len(word) >= 3 and word.upper() in self.legal_words
 
     def points(self, word: str) -> int:
         return POINTS[len(word)] if self.is_legal(word) else 0
@@ -264,12 +230,16 @@ class GameBoogle(menus.Menu):
 
     async def send_initial_message(self, ctx, channel):
         return await channel.send(
-            content="Boggle game started, you have 3 minutes!", embed=self.state
+            content=f"Boggle game started, you have 3 minutes! There are **{len(self.board.legal_words)}** words to find.",
+            embed=self.state,
         )
 
     async def start(self, *args, **kwargs):
+        # loads the dictionary and solves the board off the event loop
+        await asyncio.get_event_loop().run_in_executor(
+            None, lambda: self.board.legal_words
+        )
         await super().start(*args, **kwargs)
-        # await self.bot.loop.run_in_executor(None, lambda: self.board.legal_words)
 
     async def finalize(self, timed_out):
         self.bot.dispatch("boggle_game_complete", self.message.channel)
@@ -306,6 +276,7 @@ class ShuffflingGame(GameBoogle):
             # Shuffle board
             self.shuffle()
             self.boards.append(self.board)
+            await self.bot.loop.run_in_executor(None, lambda: self.board.legal_words)
 
             # Note Board Updated
             await self.message.channel.send("Board Updated!")
@@ -556,15 +527,22 @@ def boggle_game(game_type: type[Game]):
 
             # Start the game
             self.games_boogle[ctx.channel] = game = game_type(size=check_size(ctx))
-            await game.start(ctx, wait=False)
+            self.bot.message_router.register(
+                ctx.channel.id, "boggle", self.on_boggle_message
+            )
+            try:
+                await game.start(ctx, wait=False)
 
-            # Wait for game to end
-            def check(channel):
-                return channel.id == ctx.channel.id
+                # Wait for game to end
+                def check(channel):
+                    return channel.id == ctx.channel.id
 
-            await self.bot.wait_for("boggle_game_complete", check=check, timeout=200)
-            if ctx.channel in self.games_boogle:
-                del self.games_boogle[ctx.channel]
+                await self.bot.wait_for(
+                    "boggle_game_complete", check=check, timeout=200
+                )
+            finally:
+                self.games_boogle.pop(ctx.channel, None)
+                self.bot.message_router.unregister(ctx.channel.id, "boggle")
 
         return command
 
@@ -944,9 +922,12 @@ class Chess:
         timeout: float = 300,
         react_on_success: bool = True,
         custom: str = None,
+        level: Optional[str] = None,
     ) -> None:
         self.white = white
         self.black = black
+        # the difficulty of the bot, if it plays one side
+        self.level = level
 
         self.bot = bot
         self.ctx = ctx
@@ -972,14 +953,12 @@ class Chess:
         def check(m):
             if m.content.lower() in ("exit", "quit", "resign", "abort", "draw"):
                 return True
-            return (
-                (self.ctx.channel.id == m.channel.id)
-                and (m.author == self.turn)
-                and (m.content in LEGAL_MOVES)
-            )
+            return (m.author == self.turn) and (m.content in LEGAL_MOVES)
 
         try:
-            msg = await self.bot.wait_for("message", check=check, timeout=self.timeout)
+            msg = await self.bot.wait_for_message(
+                self.ctx.channel, check=check, timeout=self.timeout
+            )
             return msg
         except asyncio.TimeoutError:
             if not self.game_stop:
@@ -1061,6 +1040,14 @@ Can Claim Draw?: {self.board.can_claim_threefold_repetition()}
             content=content, embed=embed, view=ChessView(game=self, ctx=self.ctx)
         )
         while not self.game_stop:
+            if self.level is not None and self.turn.bot:
+                move = await self.bot.game_ai.chess(self.board.fen(), self.level)
+                if move is None:
+                    return
+                await self.place_move(move)
+                self.switch()
+                continue
+
             msg = await self.wait_for_move()
             if msg is None:
                 return
@@ -1073,7 +1060,9 @@ Can Claim Draw?: {self.board.can_claim_threefold_repetition()}
                 return await self.ctx.send(
                     f"**{msg.author}** resigned/aborted the game. Game Over!"
                 )
-            if msg.content.lower() == "draw":
+            if msg.content.lower() == "draw" and self.level is not None:
+                await self.ctx.send(f"**{self.bot.user}** declined the draw.")
+            elif msg.content.lower() == "draw":
                 value = await self.ctx.prompt(
                     f"**{msg.author}** offered draw! **{self.turn if self.turn.id != msg.author.id else self.alternate_turn}** to accept the draw click `Confirm`",
                     author_id=self.turn.id
@@ -1768,11 +1757,12 @@ class GameC4:
         player2: Optional[discord.Member],
         tokens: list,
         size: int = 7,
+        level: str = "medium",
     ):
         self.bot = bot
         self.channel = channel
         self.player1 = player1
-        self.player2 = player2 or AI_C4(self.bot, game=self)
+        self.player2 = player2 or AI_C4(self.bot, game=self, level=level)
         self.tokens = tokens
 
         self.grid = self.generate_board(size)
@@ -1835,7 +1825,7 @@ class GameC4:
             await self.print_grid()
 
             if isinstance(self.player_active, AI_C4):
-                coords = self.player_active.play()
+                coords = await self.player_active.play()
                 if not coords:
                     await self.game_over(
                         "draw",
@@ -1947,73 +1937,27 @@ class GameC4:
 class AI_C4:
     """The Computer Player for Single-Player games."""
 
-    def __init__(self, bot: Parrot, game: GameC4):
+    def __init__(self, bot: Parrot, game: GameC4, level: str = "medium"):
         self.game = game
+        self.engine = bot.game_ai
+        self.level = level
         self.mention = bot.user.mention
 
-    def get_possible_places(self) -> List[Coordinate]:
-        """Gets all the coordinates where the AI_C4 could possibly place a counter."""
-        possible_coords = []
-        for column_num in range(self.game.grid_size):
-            column = [row[column_num] for row in self.game.grid]
-            for row_num, square in reversed(list(enumerate(column))):
-                if not square:
-                    possible_coords.append((row_num, column_num))
-                    break
-        return possible_coords
-
-    def check_ai_win(self, coord_list: List[Coordinate]) -> Optional[Coordinate]:
-        """
-        Check AI_C4 win.
-        Check if placing a counter in any possible coordinate would cause the AI_C4 to win
-        with 10% chance of not winning and returning None
-        """
-        if random.randint(1, 10) == 1:
-            return
-        for coords in coord_list:
-            if self.game.check_win(coords, 2):
-                return coords
-
-    def check_player_win(self, coord_list: List[Coordinate]) -> Optional[Coordinate]:
-        """
-        Check Player win.
-        Check if placing a counter in possible coordinates would stop the player
-        from winning with 25% of not blocking them  and returning None.
-        """
-        if random.randint(1, 4) == 1:
-            return
-        for coords in coord_list:
-            if self.game.check_win(coords, 1):
-                return coords
-
-    @staticmethod
-    def random_coords(coord_list: List[Coordinate]) -> Coordinate:
-        """Picks a random coordinate from the possible ones."""
-        return random.choice(coord_list)
-
-    def play(self) -> Union[Coordinate, bool]:
+    async def play(self) -> Union[Coordinate, bool]:
         """
         Plays for the AI_C4.
-        Gets all possible coords, and determins the move:
-        1. coords where it can win.
-        2. coords where the player can win.
-        3. Random coord
-        The first possible value is choosen.
+        The column is searched by the game AI, off the event loop,
+        with the depth and time budget of the difficulty level.
         """
-        possible_coords = self.get_possible_places()
-
-        if not possible_coords:
+        column = await self.engine.connect_four(self.game.grid, 2, self.level)
+        if column is None:
             return False
 
-        coords = (
-            self.check_ai_win(possible_coords)
-            or self.check_player_win(possible_coords)
-            or self.random_coords(possible_coords)
-        )
-
-        row, column = coords
-        self.game.grid[row][column] = 2
-        return coords
+        for row in range(self.game.grid_size - 1, -1, -1):
+            if not self.game.grid[row][column]:
+                self.game.grid[row][column] = 2
+                return row, column
+        return False
 
 
 class Board:
@@ -2092,89 +2036,6 @@ class Board:
         return cls(state)
 
 
-class AI:
-    def __init__(self, player: bool) -> None:
-        self.player = player
-
-    def move(self, game: Board) -> Board:
-        column = random.choice(tuple(game.legal_moves))
-        return game.move(*column)
-
-
-class NegamaxAI(AI):
-    def __init__(self, player: bool) -> None:
-        super().__init__(player)
-
-    def heuristic(self, game: Board, sign: int) -> float:
-        if sign == -1:
-            player = not self.player
-        else:
-            player = self.player
-
-        if game.over:
-            if game.winner is None:
-                return 0
-            if game.winner == player:
-                return 1_000_000
-            return -1_000_000
-
-        return random.randint(-10, 10)
-
-    @overload
-    def negamax(
-        self,
-        game: Board,
-        depth: Literal[0] = ...,
-        alpha: float = ...,
-        beta: float = ...,
-        sign: int = ...,
-    ) -> Tuple[int, int]:
-        ...
-
-    @overload
-    def negamax(
-        self,
-        game: Board,
-        depth: int = ...,
-        alpha: float = ...,
-        beta: float = ...,
-        sign: int = ...,
-    ) -> float:
-        ...
-
-    def negamax(
-        self,
-        game: Board,
-        depth: int = 0,
-        alpha: float = float("-inf"),
-        beta: float = float("inf"),
-        sign: int = 1,
-    ) -> Union[float, Tuple[int, int]]:
-        if game.over:
-            return sign * self.heuristic(game, sign)
-
-        move = MISSING
-
-        score = float("-inf")
-        for c in game.legal_moves:
-            move_score = -self.negamax(game.move(*c), depth + 1, -beta, -alpha, -sign)
-
-            if move_score > score:
-                score = move_score
-                move = c
-
-            alpha = max(alpha, score)
-            if alpha >= beta:
-                break
-
-        if depth == 0:
-            return move
-        return score
-
-    def move(self, game: Board) -> Board:
-        return game.move(*self.negamax(game))
-
-
 class ButtonTicTacToe(discord.ui.Button["GameTicTacToe"]):
     def __init__(self, r: int, c: int):
         super().__init__(style=discord.ButtonStyle.secondary, label="\u200b", row=c)
@@ -2204,7 +2065,7 @@ class ButtonTicTacToe(discord.ui.Button["GameTicTacToe"]):
             return
 
         if self.view.current_player.bot:
-            self.view.make_ai_move()
+            await self.view.make_ai_move()
             self.view.update()
 
         if self.view.board.over:
@@ -2220,15 +2081,13 @@ class ButtonTicTacToe(discord.ui.Button["GameTicTacToe"]):
 class GameTicTacToe(discord.ui.View):
     children: List[ButtonTicTacToe]
 
-    def __init__(self, players: Tuple[User, User]):
+    def __init__(self, players: Tuple[User, User], *, engine: GameAI):
         self.players = list(players)
         random.shuffle(self.players)
 
         super().__init__(timeout=None)
         self.board = Board.new_game()
-
-        if self.current_player.bot:
-            self.make_ai_move()
+        self.engine = engine
 
         for r in range(3):
             for c in range(3):
@@ -2265,9 +2124,9 @@ class GameTicTacToe(discord.ui.View):
             return False
         return True
 
-    def make_ai_move(self):
-        ai = NegamaxAI(self.board.current_player)
-        self.board = ai.move(self.board)
+    async def make_ai_move(self):
+        r, c = await self.engine.tictactoe(self.board.state, self.board.current_player)
+        self.board = self.board.move(r, c)
 
     @property
     def current_player(self) -> User:
@@ -2533,7 +2392,12 @@ class GameBattleShip:
         await self.next.user.send("Their turn", delete_after=3.0)
         while True:
             try:
-                await self.bot.wait_for("message", check=self.predicate, timeout=60.0)
+                await self.bot.wait_for_message(
+                    turn_message.channel,
+                    author=self.turn.user,
+                    check=self.predicate,
+                    timeout=60.0,
+                )
             except asyncio.TimeoutError:
                 await self.turn.user.send("You took too long. Game over!")
                 await self.next.user.send(f"{self.turn.user} took too long. Game over!")
@@ -3059,6 +2923,7 @@ class Games(Cog):
         board_size: int,
         emoji1: Any,
         emoji2: Any,
+        level: str = "medium",
     ) -> None:
         """Helper for playing a game of connect four."""
         self.tokens = [":white_circle:", emoji1, emoji2]
@@ -3066,7 +2931,13 @@ class Games(Cog):
 
         try:
             game = GameC4(
-                self.bot, ctx.channel, ctx.author, user, self.tokens, size=board_size
+                self.bot,
+                ctx.channel,
+                ctx.author,
+                user,
+                self.tokens,
+                size=board_size,
+                level=level,
             )
             self.games_c4.append(game)
             await game.start_game()
@@ -3156,6 +3027,7 @@ class Games(Cog):
         board_size: int = 7,
         emoji1: EMOJI_CHECK = "\N{LARGE BLUE CIRCLE}",
         emoji2: EMOJI_CHECK = "\N{LARGE RED CIRCLE}",
+        difficulty: Literal["easy", "medium", "hard"] = "medium",
     ) -> None:
         """Play Connect Four against a computer player."""
         check, emoji = self.check_emojis(emoji1, emoji2)
@@ -3166,7 +3038,7 @@ class Games(Cog):
         if not check_author_result:
             return
 
-        await self._play_game(ctx, None, board_size, emoji1, emoji2)
+        await self._play_game(ctx, None, board_size, emoji1, emoji2, difficulty)
 
     @commands.command(aliases=["akinator"])
     @commands.bot_has_permissions(embed_links=True)
@@ -3198,15 +3070,11 @@ class Games(Cog):
                     "probably not",
                     "pn",
                 )
-                return (
-                    m.content.lower() in replies
-                    and m.channel == ctx.channel
-                    and m.author == ctx.author
-                )
+                return m.content.lower() in replies
 
             try:
-                msg = await self.bot.wait_for(
-                    "message", check=check_response, timeout=30
+                msg = await self.bot.wait_for_message(
+                    ctx.channel, author=ctx.author, check=check_response, timeout=30
                 )
             except asyncio.TimeoutError:
                 return await ctx.send(f"{ctx.author.mention} you didn't answer on time")
@@ -3229,14 +3097,12 @@ class Games(Cog):
         await ctx.send(embed=embed)
 
         def check_yes_no(m):
-            return (
-                m.content.lower() in ("yes", "y", "no", "n")
-                and m.channel == ctx.channel
-                and m.author == ctx.author
-            )
+            return m.content.lower() in ("yes", "y", "no", "n")
 
         try:
-            correct = await self.bot.wait_for("message", check=check_yes_no, timeout=30)
+            correct = await self.bot.wait_for_message(
+                ctx.channel, author=ctx.author, check=check_yes_no, timeout=30
+            )
         except asyncio.TimeoutError:
             return await ctx.send(f"{ctx.author.mention} you didn't answer on time")
         if correct.content.lower() in ("yes", "y"):
@@ -3269,7 +3135,10 @@ class Games(Cog):
         if opponent is None:
             raise commands.BadArgument("Challenge cancelled.")
 
-        game = GameTicTacToe((ctx.author, opponent))
+        game = GameTicTacToe((ctx.author, opponent), engine=self.bot.game_ai)
+        if game.current_player.bot:
+            await game.make_ai_move()
+            game.update()
 
         await ctx.send(f"{game.current_player.mention}'s (X) turn!", view=game)  # type: ignore
 
@@ -3612,6 +3481,17 @@ class Games(Cog):
         game = Chess(white=ctx.author, black=user, bot=self.bot, ctx=ctx, custom=board)
         await game.start()
 
+    @chess.command(name="ai", aliases=["bot", "computer", "cpu"])
+    @commands.max_concurrency(1, commands.BucketType.user)
+    async def chess_ai(
+        self, ctx: Context, difficulty: Literal["easy", "medium", "hard"] = "medium"
+    ):
+        """To play chess against the bot"""
+        game = Chess(
+            white=ctx.author, black=ctx.me, bot=self.bot, ctx=ctx, level=difficulty
+        )
+        await game.start()
+
     @commands.command()
     @commands.max_concurrency(1, commands.BucketType.user)
     @commands.bot_has_permissions(embed_links=True)
@@ -3698,13 +3578,11 @@ class Games(Cog):
         )
         await ctx.send(embed=embed)
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        # Check if channel has a game going
-        if message.channel not in self.games_boogle:
-            return
-
-        await self.games_boogle[message.channel].check_message(message)
+    async def on_boggle_message(self, message: discord.Message):
+        # the game may have ended while the message was routed
+        game = self.games_boogle.get(message.channel)
+        if game is not None:
+            await game.check_message(message)
 
     @commands.command(aliases=["umbrogus", "secret_hitler", "secret-hitler"])
     @commands.bot_has_permissions(embed_links=True)
@@ -295,17 +295,15 @@ async def disambiguate(
     choices = (f"{index}: {entry}" for index, entry in enumerate(entries, start=1))
 
     def check(message: discord.Message) -> bool:
-        return (
-            message.content.isdecimal()
-            and message.author == ctx.author
-            and message.channel == ctx.channel
-        )
+        return message.content.isdecimal()
 
     try:
         if embed is None:
             embed = discord.Embed()
 
-        coro1 = ctx.bot.wait_for("message", check=check, timeout=timeout)
+        coro1 = ctx.bot.wait_for_message(
+            ctx.channel, author=ctx.author, check=check, timeout=timeout
+        )
         coro2 = LinePaginator.paginate(
             choices,
             ctx,
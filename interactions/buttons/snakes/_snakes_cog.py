@@ -22,8 +22,7 @@ from weakref import WeakValueDictionary
 from ._utils import (
     PerlinNoiseFactory,
     get_resource,
-    frame_to_png_bytes,
-    create_snek_frame,
+    snek_frame_png,
     snakes,
     stages,
     SnakeAndLaddersGame,
@@ -231,12 +230,12 @@ class Snakes(Cog):
         return int(hex_rgb, 16)
 
     @staticmethod
-    def _generate_card(buffer: BytesIO, content: dict) -> BytesIO:
+    def _generate_card(image: bytes, content: dict) -> bytes:
         """
         Generate a card from snake information.
         Written by juan and Someone during the first code jam.
         """
-        snake = Image.open(buffer)
+        snake = Image.open(BytesIO(image))
 
         # Get the size of the snake icon, configure the height of the image box (yes, it changes)
         icon_width = 347  # Hardcoded, not much i can do about that
@@ -299,12 +298,11 @@ class Snakes(Cog):
             draw.text([margin + 4, offset], line, font=CARD["font"])
             offset += CARD["font"].getsize(line)[1]
 
-        # Get the image contents as a BufferIO object
+        # Get the image contents as PNG bytes
         buffer = BytesIO()
         full_image.save(buffer, "PNG")
-        buffer.seek(0)
 
-        return buffer
+        return buffer.getvalue()
 
     @staticmethod
     def _snakify(message: str) -> str:
@@ -697,17 +695,20 @@ class Snakes(Cog):
             # Build and send the snek
             text = random.choice(self.snake_idioms)["idiom"]
             factory = PerlinNoiseFactory(dimension=1, octaves=2)
-            image_frame = create_snek_frame(
-                factory,
-                snake_width=width,
-                snake_length=length,
-                snake_color=snek_color,
-                text=text,
-                text_color=text_color,
-                bg_color=bg_color,
+            png_bytes = await self.bot.renderer.render(
+                "snek",
+                partial(
+                    snek_frame_png,
+                    factory,
+                    snake_width=width,
+                    snake_length=length,
+                    snake_color=snek_color,
+                    text=text,
+                    text_color=text_color,
+                    bg_color=bg_color,
+                ),
             )
-            png_bytes = frame_to_png_bytes(image_frame)
-            file = File(png_bytes, filename="snek.png")
+            file = File(BytesIO(png_bytes), filename="snek.png")
             await ctx.send(file=file)
 
     @snakes_group.command(name="get")
@@ -1002,13 +1003,14 @@ class Snakes(Cog):
 
             stream.seek(0)
 
-            func = partial(self._generate_card, stream, content)
-            final_buffer = await self.bot.loop.run_in_executor(None, func)
+            card = await self.bot.renderer.render(
+                "snake_card", self._generate_card, stream.getvalue(), content
+            )
 
         # Send it!
         await ctx.send(
             f"A wild {content['name'].title()} appears!",
-            file=File(final_buffer, filename=content["name"].replace(" ", "") + ".png"),
+            file=File(BytesIO(card), filename=content["name"].replace(" ", "") + ".png"),
         )
 
     @snakes_group.command(name="fact")
@@ -13,6 +13,7 @@ from PIL.ImageDraw import ImageDraw
 from discord import File, Member, Reaction, User
 
 from core import Cog, Context
+from utilities.asset_cache import load_image
 
 SNAKE_RESOURCES = Path("extra/snakes").absolute()
 
@@ -358,6 +359,23 @@ def frame_to_png_bytes(image: Image) -> io.BytesIO:
     return stream
 
 
+def snek_frame_png(perlin_factory: PerlinNoiseFactory, **kwargs) -> bytes:
+    """Creates a snek frame (see `create_snek_frame`) as PNG bytes, for the image renderer."""
+    return frame_to_png_bytes(create_snek_frame(perlin_factory, **kwargs)).getvalue()
+
+
+def board_png(placements: List[Tuple[bytes, Tuple[int, int]]]) -> bytes:
+    """Pastes the player avatars on the snakes and ladders board, for the image renderer."""
+    board_img = load_image(str(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg"))
+    board_img = board_img.copy()
+    for avatar_bytes, box in placements:
+        im = Image.open(io.BytesIO(avatar_bytes)).resize(
+            (BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE)
+        )
+        board_img.paste(im, box=box)
+    return frame_to_png_bytes(board_img).getvalue()
+
+
 log = logging.getLogger(__name__)
 START_EMOJI = "\u2611"  # :ballot_box_with_check: - Start the game
 CANCEL_EMOJI = "\u274C"  # :x: - Cancel or leave the game
@@ -459,13 +477,11 @@ class SnakeAndLaddersGame:
         self.players.append(user)
         self.player_tiles[user.id] = 1
 
-        avatar_bytes = await user.display_avatar.replace(
-            size=PLAYER_ICON_IMAGE_SIZE
-        ).read()
-        im = Image.open(io.BytesIO(avatar_bytes)).resize(
-            (BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE)
+        avatar_bytes = await self.ctx.bot.asset_cache.asset(
+            user.display_avatar, size=PLAYER_ICON_IMAGE_SIZE
         )
-        self.avatar_images[user.id] = im
+        # resized when the board is drawn, in the image renderer
+        self.avatar_images[user.id] = avatar_bytes
 
     async def player_join(self, user: Union[User, Member]) -> None:
         """
@@ -582,7 +598,7 @@ class SnakeAndLaddersGame:
         self.state = "roll"
         for user in self.players:
             self.round_has_rolled[user.id] = False
-        board_img = Image.open(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg")
+        placements = []
         player_row_size = math.ceil(MAX_PLAYERS / 2)
 
         for i, player in enumerate(self.players):
@@ -596,9 +612,12 @@ class SnakeAndLaddersGame:
             )
             x_offset += BOARD_PLAYER_SIZE * (i % player_row_size)
             y_offset -= BOARD_PLAYER_SIZE * math.floor(i / player_row_size)
-            board_img.paste(self.avatar_images[player.id], box=(x_offset, y_offset))
+            placements.append((self.avatar_images[player.id], (x_offset, y_offset)))
 
-        board_file = File(frame_to_png_bytes(board_img), filename="Board.jpg")
+        board = await self.ctx.bot.renderer.render(
+            "snakes_board", board_png, placements
+        )
+        board_file = File(io.BytesIO(board), filename="Board.jpg")
         player_list = "\n".join(
             (user.mention + ": Tile " + str(self.player_tiles[user.id]))
             for user in self.players
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Iterator, List, Optional
+
+from utilities.log import get_logger
+
+__all__ = ("AFKIndex",)
+
+log = get_logger(__name__)
+
+
+class AFKIndex:
+    """In-memory index of the `afk` collection.
+
+    Every AFK document is kept by user, so that the per message checks (is
+    the author back, is a mentioned user AFK) never reach the database for
+    users that are not AFK. Documents are added and removed through the
+    index, which does the database write too. Pings are appended to the
+    document in memory right away and written in batches through the
+    write-behind buffer.
+
+    ``user_id in index`` works like the old set of AFK user ids.
+    """
+
+    def __init__(self, collection, *, write_behind) -> None:
+        self.collection = collection
+        self.write_behind = write_behind
+
+        self._users: Dict[int, List[Dict[str, Any]]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        self.lookups = 0
+        self.hits = 0
+
+    def __repr__(self) -> str:
+        return f"<AFKIndex users={len(self._users)} entries={len(self)}>"
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._users.values())
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._users
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._users)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self._users),
+            "entries": len(self),
+            "lookups": self.lookups,
+            "hits": self.hits,
+        }
+
+    async def load(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+            users: Dict[int, List[Dict[str, Any]]] = {}
+            async for data in self.collection.find({}):
+                users.setdefault(data["messageAuthor"], []).append(data)
+            self._users = users
+            self._loaded = True
+
+    async def get(self, user_id: int, guild_id: int) -> Optional[Dict[str, Any]]:
+        """The AFK of the user in the guild, either server or global one"""
+        if not self._loaded:
+            await self.load()
+        self.lookups += 1
+        for data in self._users.get(user_id, ()):
+            if data.get("guild") == guild_id or data.get("global"):
+                self.hits += 1
+                return data
+        return None
+
+    def _index(self, data: Dict[str, Any]) -> None:
+        entries = self._users.setdefault(data["messageAuthor"], [])
+        if all(entry["_id"] != data["_id"] for entry in entries):
+            entries.append(data)
+
+    async def add(self, data: Dict[str, Any]) -> None:
+        """|coro|
+
+        Insert the AFK document in the database and in the index.
+        """
+        await self.collection.insert_one({**data})
+        if self._loaded:
+            self._index(data)
+
+    async def remove(self, _id: Any) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Delete the AFK document from the database and the index.
+        Returns the removed document, if it was indexed.
+        """
+        removed = None
+        for user_id, entries in list(self._users.items()):
+            for data in entries:
+                if data["_id"] == _id:
+                    removed = data
+                    entries.remove(data)
+                    break
+            if removed is not None:
+                if not entries:
+                    del self._users[user_id]
+                break
+        self.write_behind.discard(self.collection, _id)
+        await self.collection.delete_one({"_id": _id})
+        return removed
+
+    def add_ping(self, data: Dict[str, Any], ping: Dict[str, Any]) -> None:
+        if ping in data["pings"]:
+            return
+        data["pings"].append(ping)
+        self.write_behind.add_to_set(self.collection, data["_id"], "pings", ping)
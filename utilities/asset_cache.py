@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import discord
+from PIL import Image
+
+from utilities.log import get_logger
+
+__all__ = ("AssetCache", "load_image")
+
+log = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def load_image(path: str) -> Image.Image:
+    """A static image of the extra/ folder, decoded once per process.
+
+    The image is shared: use it as a paste/composite source or copy it,
+    never draw on it.
+    """
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+class AssetCache:
+    """LRU cache of image bytes, bounded by their total size.
+
+    Holds the avatars (and other CDN assets) the image commands download,
+    keyed by the asset hash and size, so a new avatar is a new key and
+    nothing has to be invalidated. The same store memoizes rendered images,
+    keyed by the caller with (effect, asset hash, params).
+
+    Concurrent requests for a missing key share one download or render.
+    """
+
+    def __init__(self, *, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+
+        self._data: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._bytes = 0
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<AssetCache entries={len(self._data)} bytes={self._bytes}>"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        try:
+            data = self._data[key]
+        except KeyError:
+            return None
+        self._data.move_to_end(key)
+        return data
+
+    def put(self, key: Hashable, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        if (old := self._data.pop(key, None)) is not None:
+            self._bytes -= len(old)
+        self._data[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    async def memo(
+        self, key: Hashable, factory: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """|coro|
+
+        The bytes cached under ``key``, made by awaiting ``factory()`` on a miss.
+        """
+        data = self.get(key)
+        if data is not None:
+            self.hits += 1
+            return data
+
+        if (pending := self._pending.get(key)) is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_event_loop().create_future()
+        self._pending[key] = future
+        try:
+            data = await factory()
+        except BaseException as e:
+            future.set_exception(e)
+            # nobody else may be waiting on it
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            self.put(key, data)
+            return data
+        finally:
+            del self._pending[key]
+
+    async def asset(
+        self, asset: discord.Asset, *, size: Optional[int] = None
+    ) -> bytes:
+        """|coro|
+
+        The bytes of the asset, at the given size.
+        """
+        if size is not None:
+            asset = asset.replace(size=size)
+        return await self.memo(("asset", asset.key, size), asset.read)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import discord
+import pygit2
+
+from utilities.log import get_logger
+
+__all__ = ("BotStats", "Commit")
+
+log = get_logger(__name__)
+
+
+class Commit(NamedTuple):
+    hex: str
+    message: str
+    commit_time: int
+    commit_time_offset: int
+
+
+def read_commits(path: str = ".git", count: int = 3) -> List[Commit]:
+    repo = pygit2.Repository(path)
+    return [
+        Commit(c.hex, c.message, c.commit_time, c.commit_time_offset)
+        for c in itertools.islice(
+            repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL), count
+        )
+    ]
+
+
+def _is_text(channel) -> bool:
+    return isinstance(channel, discord.TextChannel)
+
+
+def _is_voice(channel) -> bool:
+    return isinstance(channel, (discord.VoiceChannel, discord.StageChannel))
+
+
+class BotStats:
+    """Bot wide counters: guilds, members and channels.
+
+    Counted once on ready, then kept up to date by the guild, channel and
+    member events, so reading them never walks the guilds. Unavailable
+    guilds are not part of the member and channel counts, as before.
+    Events received before the first count are ignored, the count includes them.
+
+    The last commits of the repository are read once, at startup.
+    """
+
+    def __init__(self, bot) -> None:
+        self.bot = bot
+        self.ready = False
+
+        self.guilds = 0
+        self.unavailable = 0
+        self.members = 0
+        self.text = 0
+        self.voice = 0
+
+        self.commits: List[Commit] = []
+        self._commits_task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<BotStats guilds={self.guilds} members={self.members}>"
+
+    @property
+    def users(self) -> int:
+        # Client.users copies the whole user cache into a list
+        return len(self.bot._connection._users)
+
+    @property
+    def channels(self) -> int:
+        return self.text + self.voice
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "guilds": self.guilds,
+            "unavailable": self.unavailable,
+            "members": self.members,
+            "users": self.users,
+            "channels": self.channels,
+            "text": self.text,
+            "voice": self.voice,
+        }
+
+    def rebuild(self, guilds: Iterable[discord.Guild]) -> None:
+        """Count everything again, from the cache"""
+        self.guilds = self.unavailable = self.members = self.text = self.voice = 0
+        for guild in guilds:
+            self.guilds += 1
+            if guild.unavailable:
+                self.unavailable += 1
+                continue
+            self._add(guild, 1)
+        self.ready = True
+
+    def _add(self, guild: discord.Guild, sign: int) -> None:
+        self.members += sign * (guild.member_count or 0)
+        for channel in guild.channels:
+            if _is_text(channel):
+                self.text += sign
+            elif _is_voice(channel):
+                self.voice += sign
+
+    def guild_join(self, guild: discord.Guild) -> None:
+        if self.ready:
+            self.guilds += 1
+            self._add(guild, 1)
+
+    def guild_remove(self, guild: discord.Guild) -> None:
+        if self.ready:
+            self.guilds -= 1
+            if guild.unavailable:
+                self.unavailable -= 1
+            else:
+                self._add(guild, -1)
+
+    def guild_available(self, guild: discord.Guild) -> None:
+        if self.ready:
+            self.unavailable -= 1
+            self._add(guild, 1)
+
+    def guild_unavailable(self, guild: discord.Guild) -> None:
+        if self.ready:
+            self.unavailable += 1
+            self._add(guild, -1)
+
+    def channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        if self.ready:
+            self.text += _is_text(channel)
+            self.voice += _is_voice(channel)
+
+    def channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if self.ready:
+            self.text -= _is_text(channel)
+            self.voice -= _is_voice(channel)
+
+    def member_join(self, member: discord.Member) -> None:
+        if self.ready:
+            self.members += 1
+
+    def member_remove(self, member: discord.Member) -> None:
+        if self.ready:
+            self.members -= 1
+
+    def start(self) -> None:
+        """Count the cache, and read the commits once"""
+        self.rebuild(self.bot.guilds)
+        if self._commits_task is None:
+            self._commits_task = asyncio.get_event_loop().create_task(
+                self._read_commits()
+            )
+
+    async def _read_commits(self) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            self.commits = await loop.run_in_executor(None, read_commits)
+        except pygit2.GitError as e:
+            log.warning("could not read the last commits: %s", e)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-from typing import Callable, Optional
+from typing import Callable, Dict, FrozenSet, Optional
 from collections.abc import Container, Iterable
 
 from discord.ext import commands
@@ -74,33 +75,82 @@ def is_mod():
     return commands.check(predicate)
 
 
+class Override:
+    """Enable/disable overwrite of a command, a cog or "all" in a guild"""
+
+    __slots__ = ("channel_in", "channel_out", "role_in", "role_out", "server")
+
+    def __init__(self, data: dict) -> None:
+        self.channel_in: FrozenSet[int] = frozenset(data.get("channel_in") or [])
+        self.channel_out: FrozenSet[int] = frozenset(data.get("channel_out") or [])
+        self.role_in: FrozenSet[int] = frozenset(data.get("role_in") or [])
+        self.role_out: FrozenSet[int] = frozenset(data.get("role_out") or [])
+        self.server: bool = bool(data.get("server"))
+
+    def allows(self, channel_id: int, role_ids) -> bool:
+        if channel_id in self.channel_in:
+            return True
+        if not self.role_in.isdisjoint(role_ids):
+            return True
+        if not self.role_out.isdisjoint(role_ids):
+            return False
+        if channel_id in self.channel_out:
+            return False
+        return not self.server
+
+
+class CommandOverrides:
+    """In-memory index of the `enable_disable` database, per guild.
+
+    A guild's overwrites are loaded on the first command used in it, and
+    reloaded only after `cmdconfig` changes them. Command checks never hit
+    the database after that.
+    """
+
+    def __init__(self) -> None:
+        self._guilds: Dict[int, Dict[str, Override]] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    async def get(self, guild_id: int) -> Dict[str, Override]:
+        try:
+            return self._guilds[guild_id]
+        except KeyError:
+            pass
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            if guild_id not in self._guilds:
+                overrides = {}
+                async for data in enable_disable[f"{guild_id}"].find({}):
+                    overrides[data["_id"]] = Override(data)
+                self._guilds[guild_id] = overrides
+        self._locks.pop(guild_id, None)
+        return self._guilds[guild_id]
+
+    def invalidate(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    async def can_run(self, ctx) -> bool:
+        overrides = await self.get(ctx.guild.id)
+        if not overrides:
+            return True
+        # `_roles` leaves out @everyone, whose id is the guild's
+        role_ids = {ctx.guild.id, *ctx.author._roles}
+        # most specific overwrite wins
+        for name in (
+            ctx.command.qualified_name,
+            ctx.command.cog.qualified_name,
+            "all",
+        ):
+            if (override := overrides.get(name)) is not None:
+                return override.allows(ctx.channel.id, role_ids)
+        return True
+
+
 async def _can_run(ctx):
     """Return True is the command is whitelisted in specific channel, also with specific role"""
     if ctx.guild is not None:
-        roles = set(ctx.author.roles)
-        collection = enable_disable[f"{ctx.guild.id}"]
         if ctx.command and ctx.command.cog:
-            if data := await collection.find_one(
-                {
-                    "$or": [
-                        {"_id": ctx.command.qualified_name},
-                        {"_id": ctx.command.cog.qualified_name},
-                        {"_id": "all"}
-                    ]
-                }
-            ):
-                if ctx.channel.id in data["channel_in"]:
-                    return True
-                if any(role.id in data["role_in"] for role in roles):
-                    return True
-                if any(role.id in data["role_out"] for role in roles):
-                    return False
-                if ctx.channel.id in data["channel_out"]:
-                    return False
-                if data["server"]:
-                    return False
-                if not data["server"]:
-                    return True
+            return await ctx.bot.command_overrides.can_run(ctx)
         return True
     return False
 
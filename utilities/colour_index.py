@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+__all__ = ("ColourIndex", "rgb_to_lab")
+
+RGB = Tuple[int, int, int]
+
+# sRGB (D65) to CIE XYZ, and the D65 white point
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ],
+    dtype=np.float32,
+)
+_WHITE = np.array([0.95047, 1.0, 1.08883], dtype=np.float32)
+
+# distances computed at once, at most 16 MiB of float32
+_CHUNK = 1 << 22
+
+
+def rgb_to_lab(rgb: Union[np.ndarray, Iterable]) -> np.ndarray:
+    """Convert ``(..., 3)`` sRGB values in 0-255 to CIE Lab, as float32.
+    Euclidean distance in Lab is close to the perceived difference."""
+    c = np.asarray(rgb, dtype=np.float32) / 255.0
+    c = np.where(c > 0.04045, ((c + 0.055) / 1.055) ** 2.4, c / 12.92)
+    xyz = (c @ _RGB_TO_XYZ.T) / _WHITE
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack(
+        (
+            116 * f[..., 1] - 16,
+            500 * (f[..., 0] - f[..., 1]),
+            200 * (f[..., 1] - f[..., 2]),
+        ),
+        axis=-1,
+    )
+
+
+def _parse(value: Union[str, int, Iterable[int]]) -> RGB:
+    if isinstance(value, str):
+        value = int(value.lstrip("#"), 16)  # "0x..." is fine with base 16
+    if isinstance(value, int):
+        return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+    r, g, b = value
+    return r, g, b
+
+
+class ColourIndex:
+    """Named colours, with exact lookup by name and nearest colour search.
+
+    Built once from a ``name -> colour`` mapping, colours being hex strings
+    (``"4C4F56"``, ``"#4c4f56"``, ``"0x4c4f56"``), ints or RGB tuples. The
+    colours are stored in one array, so finding the nearest colour of a
+    pixel, or of a whole image, is a single vectorized argmin instead of a
+    loop in Python.
+
+    Distances are measured in CIE Lab by default, which matches what the
+    eye sees. With ``space="rgb"`` they are squared RGB distances in exact
+    integer arithmetic, and ties go to the first colour of the mapping.
+    """
+
+    def __init__(
+        self, colours: Dict[str, Union[str, int, Iterable[int]]], *, space: str = "lab"
+    ) -> None:
+        if space not in ("lab", "rgb"):
+            raise ValueError(f"unknown colour space {space!r}")
+        self.space = space
+        self.names: List[str] = list(colours)
+        self.rgb = np.array(
+            [_parse(value) for value in colours.values()], dtype=np.uint8
+        ).reshape(-1, 3)
+        # "RRGGBB", upper case
+        self.hex: Dict[str, str] = {
+            name: "%02X%02X%02X" % tuple(rgb) for name, rgb in zip(self.names, self.rgb)
+        }
+        self._lower: Dict[str, str] = {name.lower(): name for name in self.names}
+        self._points = (
+            rgb_to_lab(self.rgb) if space == "lab" else self.rgb.astype(np.int32)
+        )
+        # |p|^2, for |q - p|^2 = |q|^2 - 2 q.p + |p|^2 in one matrix product
+        self._norms = (self._points.astype(np.float32) ** 2).sum(-1)
+
+    def __repr__(self) -> str:
+        return f"<ColourIndex colours={len(self)} space={self.space}>"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._lower
+
+    @classmethod
+    def from_json(cls, path: str, *, space: str = "lab") -> ColourIndex:
+        with open(path, encoding="utf-8") as f:
+            data: Dict[str, Any] = json.load(f)
+        data.pop("_", None)  # source credit entry
+        return cls(data, space=space)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "colours": len(self),
+            "space": self.space,
+            "bytes": self.rgb.nbytes + self._points.nbytes,
+        }
+
+    def name(self, name: str) -> Optional[str]:
+        """The name as stored, from a name in any case"""
+        return self._lower.get(name.lower())
+
+    def value(self, name: str) -> Optional[int]:
+        """The ``0xRRGGBB`` value of a colour name, in any case"""
+        name = self._lower.get(name.lower())
+        return None if name is None else int(self.hex[name], 16)
+
+    def nearest_indices(self, rgb: Union[np.ndarray, Iterable]) -> np.ndarray:
+        """The index of the nearest colour of each ``(..., 3)`` RGB value"""
+        rgb = np.asarray(rgb)
+        shape = rgb.shape[:-1]
+        queries = (
+            rgb_to_lab(rgb) if self.space == "lab" else rgb.astype(np.int32)
+        ).reshape(-1, 3)
+        out = np.empty(len(queries), dtype=np.intp)
+        step = max(1, _CHUNK // max(len(self), 1))
+        points = self._points
+        for start in range(0, len(queries), step):
+            chunk = queries[start : start + step]
+            if self.space == "lab":
+                # |q|^2 is the same for every colour, it does not change the argmin
+                distances = self._norms - 2 * (chunk @ points.T)
+            else:
+                # exact, so that ties are broken by the order of the colours
+                distances = sum(
+                    (chunk[:, None, channel] - points[:, channel]) ** 2
+                    for channel in range(3)
+                )
+            out[start : start + step] = distances.argmin(-1)
+        return out.reshape(shape)
+
+    def nearest(self, rgb: RGB) -> Optional[str]:
+        """The name of the colour nearest to ``rgb``"""
+        if not self.names:
+            return None
+        return self.names[int(self.nearest_indices(rgb))]
+
+    def nearest_rgb(self, rgb: RGB) -> Optional[RGB]:
+        if not self.names:
+            return None
+        r, g, b = self.rgb[int(self.nearest_indices(rgb))]
+        return int(r), int(g), int(b)
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import re
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure, PyMongoError
+
+from utilities.log import get_logger
+
+__all__ = ("GuildConfigCache", "PrefixMatcher")
+
+log = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 32 MiB of guild configs
+POLL_INTERVAL = 60.0
+
+
+def _sizeof(obj: Any) -> int:
+    """Rough deep size of a BSON-like document (dict/list/scalars)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_sizeof(k) + _sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_sizeof(i) for i in obj)
+    return size
+
+
+class PrefixMatcher:
+    """Case insensitive matcher of the prefixes of a guild, compiled once.
+
+    ``match`` returns the prefix as typed in the message, so ``$Help`` and
+    ``$help`` both work when the prefix has letters in it.
+    """
+
+    __slots__ = ("prefixes", "pattern")
+
+    def __init__(self, prefixes: Union[str, List[str]]) -> None:
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        # longest first, so "!!" wins over "!"
+        alternatives = "|".join(
+            re.escape(p) for p in sorted(self.prefixes, key=len, reverse=True)
+        )
+        self.pattern: re.Pattern = re.compile(f"(?:{alternatives})", flags=re.I)
+
+    def __repr__(self) -> str:
+        return f"<PrefixMatcher prefixes={self.prefixes}>"
+
+    def match(self, content: str) -> Optional[str]:
+        match = self.pattern.match(content)
+        return match.group(0) if match else None
+
+
+class GuildConfigCache:
+    """Write-through cache of the `server_config` collection.
+
+    Entries are loaded once per guild and kept in LRU order, bounded by an
+    estimate of their memory usage rather than a fixed number of guilds.
+    Config commands write through :meth:`update`, which applies the change
+    in MongoDB and stores the returned document in place. Writes done by other
+    processes are picked up from a change stream, or by polling when change
+    streams are not available on the deployment.
+
+    The mapping interface (``cache[guild_id]``) never touches the database and
+    raises :class:`KeyError` on a miss, so existing ``try/except KeyError``
+    call sites keep working.
+    """
+
+    def __init__(
+        self,
+        collection,
+        *,
+        template: Optional[Dict[str, Any]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        self.collection = collection
+        self.template = template or {}
+        self.max_bytes = max_bytes
+        self.poll_interval = poll_interval
+
+        self._data: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+        self._prefixes: Dict[int, PrefixMatcher] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._watcher: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[int, Dict[str, Any]], None]] = []
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<GuildConfigCache entries={len(self)} bytes={self.bytes} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._data)
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._data
+
+    def __getitem__(self, guild_id: int) -> Dict[str, Any]:
+        try:
+            data = self._data[guild_id]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._data.move_to_end(guild_id)
+        return data
+
+    def __setitem__(self, guild_id: int, data: Dict[str, Any]) -> None:
+        self.pop(guild_id, None)
+        size = _sizeof(data)
+        self._data[guild_id] = data
+        self._sizes[guild_id] = size
+        self.bytes += size
+        self._evict()
+        for listener in self._listeners:
+            listener(guild_id, data)
+
+    def __delitem__(self, guild_id: int) -> None:
+        if self.pop(guild_id, None) is None:
+            raise KeyError(guild_id)
+
+    def get(self, guild_id: int, default: Any = None) -> Any:
+        try:
+            return self[guild_id]
+        except KeyError:
+            return default
+
+    def pop(self, guild_id: int, default: Any = None) -> Any:
+        data = self._data.pop(guild_id, default)
+        self.bytes -= self._sizes.pop(guild_id, 0)
+        self._prefixes.pop(guild_id, None)
+        return data
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self._prefixes.clear()
+        self.bytes = 0
+
+    def add_listener(self, listener: Callable[[int, Dict[str, Any]], None]) -> None:
+        """Call ``listener(guild_id, config)`` whenever a config is stored,
+        i.e. loaded, updated through :meth:`update` or changed elsewhere."""
+        self._listeners.append(listener)
+
+    def _evict(self) -> None:
+        while self.bytes > self.max_bytes and len(self._data) > 1:
+            guild_id, _ = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(guild_id, 0)
+            self._prefixes.pop(guild_id, None)
+            self.evictions += 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    async def fetch(self, guild_id: int) -> Dict[str, Any]:
+        """|coro|
+
+        Get the config of the guild, loading it from database on a miss.
+        A default document is inserted if the guild has none.
+        """
+        try:
+            return self[guild_id]
+        except KeyError:
+            pass
+
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            # someone else may have loaded it while we were waiting
+            if guild_id in self._data:
+                return self._data[guild_id]
+            data = await self.collection.find_one({"_id": guild_id})
+            if data is None:
+                data = {**copy.deepcopy(self.template), "_id": guild_id}
+                await self.collection.update_one(
+                    {"_id": guild_id}, {"$setOnInsert": data}, upsert=True
+                )
+            self[guild_id] = data
+        self._locks.pop(guild_id, None)
+        return data
+
+    async def prefix_matcher(self, guild_id: int) -> PrefixMatcher:
+        """|coro|
+
+        Get the compiled prefix matcher of the guild. It lives as long as
+        the cached config it was compiled from.
+        """
+        try:
+            matcher = self._prefixes[guild_id]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._data.move_to_end(guild_id)
+            return matcher
+        data = await self.fetch(guild_id)
+        matcher = self._prefixes[guild_id] = PrefixMatcher(
+            data.get("prefix") or self.template.get("prefix", "$")
+        )
+        return matcher
+
+    async def update(
+        self, guild_id: int, update: Dict[str, Any], *, upsert: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Write-through update. Applies the MongoDB update document and stores
+        the resulting config in the cache, in the same round trip.
+        """
+        data = await self.collection.find_one_and_update(
+            {"_id": guild_id},
+            update,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
+        )
+        if data is None:
+            self.pop(guild_id, None)
+        else:
+            self[guild_id] = data
+        return data
+
+    def invalidate(self, guild_id: int) -> None:
+        if guild_id in self._data:
+            self.invalidations += 1
+        self.pop(guild_id, None)
+
+    def start(self) -> None:
+        """Start listening for changes made by other processes."""
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.get_event_loop().create_task(self._watch())
+
+    def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    async def _watch(self) -> None:
+        try:
+            await self._watch_change_stream()
+        except asyncio.CancelledError:
+            raise
+        except OperationFailure as e:
+            # change streams need a replica set, standalone servers raise here
+            log.warning("change stream unavailable (%s), polling server_config", e)
+            await self._poll()
+
+    async def _watch_change_stream(self) -> None:
+        pipeline = [
+            {"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}
+        ]
+        resume_token = None
+        while True:
+            try:
+                async with self.collection.watch(
+                    pipeline, full_document="updateLookup", resume_after=resume_token
+                ) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        self._apply_change(change)
+            except OperationFailure:
+                raise
+            except PyMongoError as e:
+                log.warning("server_config change stream interrupted: %s", e)
+                # entries may have changed while we were not watching
+                resume_token = None
+                self.clear()
+                await asyncio.sleep(5)
+
+    def _apply_change(self, change: Dict[str, Any]) -> None:
+        guild_id = change["documentKey"]["_id"]
+        if guild_id not in self._data:
+            # not cached by this process, nothing to keep coherent
+            return
+        document = change.get("fullDocument")
+        if change["operationType"] == "delete" or document is None:
+            self.invalidate(guild_id)
+        else:
+            self.invalidations += 1
+            self[guild_id] = document
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            ids = list(self._data)
+            if not ids:
+                continue
+            found = set()
+            try:
+                async for data in self.collection.find({"_id": {"$in": ids}}):
+                    found.add(data["_id"])
+                    if data != self._data.get(data["_id"], data):
+                        self.invalidations += 1
+                        self[data["_id"]] = data
+            except PyMongoError as e:
+                log.warning("failed to poll server_config: %s", e)
+                continue
+            for guild_id in set(ids) - found:
+                self.invalidate(guild_id)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional, Set
+
+import discord
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from utilities.log import get_logger
+
+__all__ = ("CountingChannels", "CountingState")
+
+log = get_logger(__name__)
+
+CHECKPOINT_INTERVAL = 30.0
+
+
+class CountingState:
+    __slots__ = ("count", "user_id", "message_id")
+
+    def __init__(
+        self,
+        count: int = 0,
+        user_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+    ) -> None:
+        self.count = count
+        self.user_id = user_id
+        self.message_id = message_id
+
+    def __repr__(self) -> str:
+        return f"<CountingState count={self.count} user_id={self.user_id}>"
+
+    def to_document(self) -> Dict[str, Any]:
+        return {"count": self.count, "user": self.user_id, "message": self.message_id}
+
+
+class CountingChannels:
+    """The state of every counting channel, kept in memory.
+
+    For each channel, the last number, who counted it and in which message.
+    The states are loaded once from the `counting` collection, and the
+    channels changed since the last checkpoint are written back in one bulk
+    write every ``interval`` seconds and when the bot closes. Validating a
+    message is a dict lookup and an integer comparison.
+
+    Deleting or editing the message holding the current number leaves the
+    count where it was, :meth:`deleted` and :meth:`edited` tell the caller so
+    the channel can be told which number comes next.
+    """
+
+    def __init__(self, collection, *, interval: float = CHECKPOINT_INTERVAL) -> None:
+        self.collection = collection
+        self.interval = interval
+
+        self._states: Dict[int, CountingState] = {}
+        self._dirty: Set[int] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+        self.accepted = 0
+        self.rejected = 0
+        self.checkpoints = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        return f"<CountingChannels channels={len(self)} dirty={len(self._dirty)}>"
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._states
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channels": len(self),
+            "dirty": len(self._dirty),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "checkpoints": self.checkpoints,
+            "errors": self.errors,
+        }
+
+    def get(self, channel_id: int) -> Optional[CountingState]:
+        return self._states.get(channel_id)
+
+    async def load(self) -> None:
+        """|coro|
+
+        Read the state of every channel, once.
+        """
+        async with self._load_lock:
+            if self._loaded:
+                return
+            async for data in self.collection.find({}):
+                # counts made before the load are more recent
+                self._states.setdefault(
+                    data["_id"],
+                    CountingState(
+                        data.get("count", 0), data.get("user"), data.get("message")
+                    ),
+                )
+            self._loaded = True
+
+    def seed(
+        self,
+        channel_id: int,
+        count: int = 0,
+        user_id: Optional[int] = None,
+        message_id: Optional[int] = None,
+    ) -> CountingState:
+        """Set the state of a channel, e.g. one which has none yet"""
+        state = self._states[channel_id] = CountingState(count, user_id, message_id)
+        self._dirty.add(channel_id)
+        return state
+
+    def check(self, message: discord.Message) -> bool:
+        """Count ``message`` if it is the next number, sent by someone else
+        than the last counter. ``False`` if it is not."""
+        state = self._states[message.channel.id]
+        try:
+            number = int(message.content)
+        except ValueError:
+            number = None
+        if message.author.id == state.user_id or number != state.count + 1:
+            self.rejected += 1
+            return False
+        state.count = number
+        state.user_id = message.author.id
+        state.message_id = message.id
+        self._dirty.add(message.channel.id)
+        self.accepted += 1
+        return True
+
+    def deleted(self, channel_id: int, message_id: int) -> Optional[CountingState]:
+        """The state of the channel, if ``message_id`` held its current count"""
+        state = self._states.get(channel_id)
+        if state is None or state.message_id != message_id:
+            return None
+        state.message_id = None
+        self._dirty.add(channel_id)
+        return state
+
+    def edited(
+        self, channel_id: int, message_id: int, content: Optional[str]
+    ) -> Optional[CountingState]:
+        """The state of the channel, if ``message_id`` held its current count
+        and no longer shows it. ``content`` is ``None`` when not edited."""
+        state = self._states.get(channel_id)
+        if state is None or state.message_id != message_id or content is None:
+            return None
+        if content.strip() == str(state.count):
+            return None
+        return self.deleted(channel_id, message_id)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, set()
+            operations = [
+                UpdateOne(
+                    {"_id": channel_id},
+                    {"$set": self._states[channel_id].to_document()},
+                    upsert=True,
+                )
+                for channel_id in dirty
+                if channel_id in self._states
+            ]
+            if not operations:
+                return
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+            except PyMongoError as e:
+                # the states are still in memory, the next checkpoint writes them
+                self.errors += 1
+                self._dirty |= dirty
+                log.warning("counting checkpoint failed: %s", e)
+                return
+            self.checkpoints += 1
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
@@ -18,11 +18,6 @@ enable_disable = cluster["enable_disable"]
 warn_db = cluster["warn_db"]
 
 
-async def cmd_increment(cmd: str) -> None:
-    collection = parrot_db["cmd_count"]
-    await collection.update_one({"_id": cmd}, {"$inc": {"count": 1}}, upsert=True)
-
-
 async def telephone_update(guild_id: int, event: str, value) -> None:
     collection = parrot_db["telephone"]
     if _ := await collection.find_one({"_id": guild_id}):
@@ -52,3 +52,20 @@ class CommandDisabledCategory(ParrotCheckFailure):
 class CommandDisabledServer(ParrotCheckFailure):
     def __init__(self):
         super().__init__("Command Disabled. This command is disabled in this server")
+
+
+# resources
+
+
+class RendererBusy(ParrotCheckFailure):
+    def __init__(self):
+        super().__init__(
+            "Too many images are being made right now. Try again in a few seconds"
+        )
+
+
+class GameAIBusy(ParrotCheckFailure):
+    def __init__(self):
+        super().__init__(
+            "Too many games are thinking right now. Try again in a few seconds"
+        )
@@ -0,0 +1,590 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import chess
+import chess.polyglot
+
+from utilities.exceptions import GameAIBusy
+from utilities.log import get_logger
+
+__all__ = ("GameAI", "LEVELS", "tictactoe_move", "connect_four_move", "chess_move")
+
+log = get_logger(__name__)
+
+LEVELS = ("easy", "medium", "hard")
+
+# level: (max depth, seconds, chance of a random move)
+C4_LEVELS = {
+    "easy": (2, 0.2, 0.2),
+    "medium": (6, 1.0, 0.0),
+    "hard": (64, 3.0, 0.0),
+}
+CHESS_LEVELS = {
+    "easy": (1, 1.0, 0.0),
+    "medium": (2, 3.0, 0.0),
+    "hard": (4, 8.0, 0.0),
+}
+
+# transposition tables of the worker process, kept between searches so the
+# positions of the previous moves of a game are already known
+_TABLES: Dict[Any, Dict[int, Tuple[int, int, int, Any]]] = {}
+MAX_ENTRIES = 500_000
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def _table(key: Any) -> Dict[int, Tuple[int, int, int, Any]]:
+    table = _TABLES.get(key)
+    if table is None or len(table) > MAX_ENTRIES:
+        table = _TABLES[key] = {}
+    return table
+
+
+class _Search:
+    __slots__ = ("table", "deadline", "nodes", "hits")
+
+    def __init__(self, table: Dict, seconds: float) -> None:
+        self.table = table
+        self.deadline = perf_counter() + seconds
+        self.nodes = 0
+        self.hits = 0
+
+    def tick(self) -> None:
+        self.nodes += 1
+        if not self.nodes & 1023 and perf_counter() > self.deadline:
+            raise _OutOfTime()
+
+    def stats(self, depth: int) -> Dict[str, int]:
+        return {"nodes": self.nodes, "hits": self.hits, "depth": depth}
+
+
+def _popcount(n: int) -> int:
+    return bin(n).count("1")
+
+
+# Tic-Tac-Toe: two 9 bit boards, cell r * 3 + c
+
+TTT_LINES = tuple(
+    sum(1 << cell for cell in line)
+    for line in (
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),
+        (0, 4, 8), (2, 4, 6),
+    )
+)  # fmt: skip
+
+
+def _ttt_negamax(table: Dict, mine: int, theirs: int) -> int:
+    # exact value for the player to move, faster wins score higher
+    key = mine << 9 | theirs
+    if key in table:
+        return table[key]
+    if any(theirs & line == line for line in TTT_LINES):
+        value = -(10 - _popcount(mine | theirs))
+    elif mine | theirs == 0x1FF:
+        value = 0
+    else:
+        value = max(
+            -_ttt_negamax(table, theirs, mine | 1 << cell)
+            for cell in range(9)
+            if not (mine | theirs) >> cell & 1
+        )
+    table[key] = value
+    return value
+
+
+def tictactoe_move(
+    cells: Tuple[Optional[bool], ...], player: bool
+) -> Tuple[Tuple[int, int], Dict[str, int]]:
+    """The best (row, column) for ``player``, a random one among equals.
+    ``cells`` is the board row by row."""
+    mine = sum(1 << i for i, cell in enumerate(cells) if cell is player)
+    theirs = sum(1 << i for i, cell in enumerate(cells) if cell is (not player))
+    table = _table("ttt")
+    size = len(table)
+
+    scores = {
+        cell: -_ttt_negamax(table, theirs, mine | 1 << cell)
+        for cell in range(9)
+        if not (mine | theirs) >> cell & 1
+    }
+    best = max(scores.values())
+    cell = random.choice([c for c, score in scores.items() if score == best])
+    stats = {"nodes": len(table) - size, "hits": 0, "depth": 9}
+    return divmod(cell, 3), stats
+
+
+# Connect Four: one bitboard per player, a column being height + 1 bits,
+# bottom row first, so that a sentinel bit separates the columns
+
+C4_WIN = 1_000_000
+
+
+class _C4:
+    __slots__ = (
+        "height",
+        "width",
+        "step",
+        "bottom",
+        "top",
+        "columns",
+        "board",
+        "centre",
+        "order",
+    )
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.step = step = height + 1
+        self.bottom = [1 << (c * step) for c in range(width)]
+        self.top = [1 << (c * step + height - 1) for c in range(width)]
+        self.columns = [((1 << height) - 1) << (c * step) for c in range(width)]
+        self.board = sum(self.columns)
+        middle = width // 2
+        self.centre = self.columns[middle] | (
+            self.columns[middle - 1] if width % 2 == 0 else 0
+        )
+        # centre columns first, they take part in more lines
+        self.order = sorted(range(width), key=lambda c: abs(middle - c))
+
+    def won(self, stones: int) -> bool:
+        for shift in (1, self.step, self.step - 1, self.step + 1):
+            pairs = stones & (stones >> shift)
+            if pairs & (pairs >> 2 * shift):
+                return True
+        return False
+
+    def threats(self, stones: int, mask: int) -> int:
+        # empty cells completing four of ``stones``
+        found = (stones << 1) & (stones << 2) & (stones << 3)
+        for shift in (self.step, self.step - 1, self.step + 1):
+            pairs = (stones << shift) & (stones << 2 * shift)
+            found |= pairs & (stones << 3 * shift)
+            found |= pairs & (stones >> shift)
+            pairs = (stones >> shift) & (stones >> 2 * shift)
+            found |= pairs & (stones << shift)
+            found |= pairs & (stones >> 3 * shift)
+        return found & (self.board ^ mask)
+
+    def evaluate(self, stones: int, mask: int) -> int:
+        other = stones ^ mask
+        return (
+            10
+            * (
+                _popcount(self.threats(stones, mask))
+                - _popcount(self.threats(other, mask))
+            )
+            + _popcount(stones & self.centre)
+            - _popcount(other & self.centre)
+        )
+
+
+def _c4_negamax(
+    s: _Search,
+    game: _C4,
+    stones: int,
+    mask: int,
+    depth: int,
+    alpha: int,
+    beta: int,
+    ply: int,
+) -> Tuple[int, int]:
+    s.tick()
+    playable = [c for c in game.order if not mask & game.top[c]]
+    if not playable:
+        return 0, -1
+
+    for column in playable:
+        if game.won(stones | ((mask + game.bottom[column]) & game.columns[column])):
+            return C4_WIN - ply, column
+
+    if depth == 0:
+        return game.evaluate(stones, mask), -1
+
+    key = stones + mask
+    entry = s.table.get(key)
+    best_move = -1
+    if entry is not None:
+        s.hits += 1
+        entry_depth, flag, value, best_move = entry
+        if entry_depth >= depth:
+            if flag == EXACT:
+                return value, best_move
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            elif flag == UPPER:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, best_move
+        if best_move in playable:
+            playable.remove(best_move)
+            playable.insert(0, best_move)
+
+    original_alpha = alpha
+    best, best_move = -C4_WIN * 2, playable[0]
+    for column in playable:
+        new_mask = mask | (mask + game.bottom[column])
+        value, _ = _c4_negamax(
+            s, game, stones ^ mask, new_mask, depth - 1, -beta, -alpha, ply + 1
+        )
+        value = -value
+        if value > best:
+            best, best_move = value, column
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+
+    flag = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+    s.table[key] = (depth, flag, best, best_move)
+    return best, best_move
+
+
+def connect_four_move(
+    grid: List[List[int]], player: int, level: str
+) -> Tuple[Optional[int], Dict[str, int]]:
+    """The column ``player`` should play, None if the grid is full.
+    ``grid`` is a list of rows, top first, 0 being an empty square."""
+    height, width = len(grid), len(grid[0])
+    game = _C4(width, height)
+    stones = mask = 0
+    ply = 0
+    for row, squares in enumerate(grid):
+        for column, square in enumerate(squares):
+            if square:
+                bit = 1 << (column * game.step + height - 1 - row)
+                mask |= bit
+                ply += 1
+                if square == player:
+                    stones |= bit
+
+    playable = [c for c in game.order if not mask & game.top[c]]
+    if not playable:
+        return None, {"nodes": 0, "hits": 0, "depth": 0}
+
+    max_depth, seconds, blunder = C4_LEVELS[level]
+    if random.random() < blunder:
+        return random.choice(playable), {"nodes": 0, "hits": 0, "depth": 0}
+
+    s = _Search(_table(("c4", width, height)), seconds)
+    move, reached = playable[0], 0
+    try:
+        # iterative deepening, each pass orders the next with the table
+        for depth in range(1, min(max_depth, width * height - ply) + 1):
+            value, move = _c4_negamax(
+                s, game, stones, mask, depth, -C4_WIN * 2, C4_WIN * 2, ply
+            )
+            reached = depth
+            if abs(value) > C4_WIN // 2:
+                break
+    except _OutOfTime:
+        pass
+    return move, s.stats(reached)
+
+
+# Chess: material and centre, alpha-beta with quiescence on python-chess
+
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 0,
+}
+CHESS_MATE = 100_000
+BB_CENTRE = chess.BB_CENTER | chess.BB_D3 | chess.BB_E3 | chess.BB_D6 | chess.BB_E6
+
+
+def _chess_evaluate(board: chess.Board) -> int:
+    white, black = board.occupied_co[chess.WHITE], board.occupied_co[chess.BLACK]
+    score = 0
+    for pieces, value in (
+        (board.pawns, 100),
+        (board.knights, 320),
+        (board.bishops, 330),
+        (board.rooks, 500),
+        (board.queens, 900),
+    ):
+        score += value * (
+            chess.popcount(pieces & white) - chess.popcount(pieces & black)
+        )
+    minor = board.pawns | board.knights | board.bishops
+    score += 10 * (
+        chess.popcount(minor & white & BB_CENTRE)
+        - chess.popcount(minor & black & BB_CENTRE)
+    )
+    return score if board.turn == chess.WHITE else -score
+
+
+def _chess_order(board: chess.Board, moves, first: Optional[chess.Move]):
+    def key(move: chess.Move) -> int:
+        if move == first:
+            return -1_000_000
+        victim = board.piece_type_at(move.to_square)
+        if victim is None:
+            return 0 if move.promotion is None else -PIECE_VALUES[move.promotion]
+        attacker = board.piece_type_at(move.from_square)
+        return PIECE_VALUES[attacker] - 10 * PIECE_VALUES[victim]
+
+    return sorted(moves, key=key)
+
+
+def _chess_quiesce(s: _Search, board: chess.Board, alpha: int, beta: int) -> int:
+    s.tick()
+    stand = _chess_evaluate(board)
+    if stand >= beta:
+        return stand
+    alpha = max(alpha, stand)
+    for move in _chess_order(board, board.generate_legal_captures(), None):
+        board.push(move)
+        value = -_chess_quiesce(s, board, -beta, -alpha)
+        board.pop()
+        if value >= beta:
+            return value
+        alpha = max(alpha, value)
+    return alpha
+
+
+def _chess_negamax(
+    s: _Search, board: chess.Board, depth: int, alpha: int, beta: int, ply: int
+) -> Tuple[int, Optional[chess.Move]]:
+    s.tick()
+    moves = list(board.legal_moves)
+    if not moves:
+        return (-CHESS_MATE + ply if board.is_check() else 0), None
+    if ply and (board.is_repetition(2) or board.halfmove_clock >= 100):
+        return 0, None
+    if depth == 0:
+        return _chess_quiesce(s, board, alpha, beta), None
+
+    key = chess.polyglot.zobrist_hash(board)
+    entry = s.table.get(key)
+    first = None
+    if entry is not None:
+        s.hits += 1
+        entry_depth, flag, value, uci = entry
+        first = chess.Move.from_uci(uci) if uci else None
+        if entry_depth >= depth and ply:
+            if flag == EXACT:
+                return value, first
+            if flag == LOWER:
+                alpha = max(alpha, value)
+            elif flag == UPPER:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, first
+
+    original_alpha = alpha
+    best, best_move = -CHESS_MATE * 2, None
+    for move in _chess_order(board, moves, first):
+        board.push(move)
+        value, _ = _chess_negamax(s, board, depth - 1, -beta, -alpha, ply + 1)
+        board.pop()
+        value = -value
+        if value > best:
+            best, best_move = value, move
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+
+    flag = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+    s.table[key] = (depth, flag, best, best_move.uci() if best_move else None)
+    return best, best_move
+
+
+def chess_move(fen: str, level: str) -> Tuple[Optional[str], Dict[str, int]]:
+    """The move (in SAN) the side to move should play, None if there is none."""
+    board = chess.Board(fen)
+    moves = list(board.legal_moves)
+    if not moves:
+        return None, {"nodes": 0, "hits": 0, "depth": 0}
+
+    max_depth, seconds, _ = CHESS_LEVELS[level]
+    s = _Search(_table("chess"), seconds)
+    move, reached = random.choice(moves), 0
+    try:
+        for depth in range(1, max_depth + 1):
+            _, best = _chess_negamax(
+                s, board, depth, -CHESS_MATE * 2, CHESS_MATE * 2, 0
+            )
+            if best is not None:
+                move, reached = best, depth
+    except _OutOfTime:
+        pass
+    # the search may have been interrupted with moves still pushed
+    board = chess.Board(fen)
+    return board.san(move), s.stats(reached)
+
+
+class _Game:
+    __slots__ = ("count", "total", "max", "nodes", "hits", "depth")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.nodes = 0
+        self.hits = 0
+        self.depth = 0
+
+
+class GameAI:
+    """Plays the computer side of the board games.
+
+    Searches run in a small pool of worker processes, never on the event
+    loop, each within the time budget of its difficulty level. Positions
+    are encoded as bitboards (or FEN for chess) and every worker keeps
+    transposition tables keyed by position between searches.
+
+    At most ``max_pending`` searches are queued or running. Past that,
+    callers wait up to ``queue_timeout`` seconds for a slot, then
+    :class:`GameAIBusy` is raised. Tic-Tac-Toe is solved in a few
+    microseconds once its table is built, so it stays out of the pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        max_pending: int = 16,
+        queue_timeout: float = 10.0,
+    ) -> None:
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self._games: Dict[str, _Game] = {}
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.restarts = 0
+
+    def __repr__(self) -> str:
+        return f"<GameAI workers={self.workers} searches={self.searches}>"
+
+    @property
+    def searches(self) -> int:
+        return sum(g.count for g in self._games.values())
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    async def _search(
+        self, name: str, func: Callable[..., Tuple[Any, Dict]], *args: Any
+    ) -> Any:
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise GameAIBusy() from None
+        finally:
+            self.waiting -= 1
+
+        ini = perf_counter()
+        self.in_flight += 1
+        loop = asyncio.get_event_loop()
+        try:
+            result, stats = await loop.run_in_executor(self._executor(), func, *args)
+        except BrokenProcessPool:
+            log.warning("game AI pool broke while searching %s", name)
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+                self.restarts += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        elapsed = perf_counter() - ini
+        self._record(name, elapsed, stats)
+        return result
+
+    def _record(self, name: str, elapsed: float, stats: Dict[str, int]) -> None:
+        game = self._games.get(name)
+        if game is None:
+            game = self._games[name] = _Game()
+        game.count += 1
+        game.total += elapsed
+        game.max = max(game.max, elapsed)
+        game.nodes += stats["nodes"]
+        game.hits += stats["hits"]
+        game.depth += stats["depth"]
+
+    async def tictactoe(
+        self, state: List[List[Optional[bool]]], player: bool
+    ) -> Tuple[int, int]:
+        """|coro|
+
+        The best (row, column) for ``player``, it never loses.
+        """
+        cells = tuple(cell for row in state for cell in row)
+        ini = perf_counter()
+        move, stats = tictactoe_move(cells, player)
+        self._record("tictactoe", perf_counter() - ini, stats)
+        return move
+
+    async def connect_four(
+        self, grid: List[List[int]], player: int, level: str = "medium"
+    ) -> Optional[int]:
+        """|coro|
+
+        The column to play in, None if the grid is full.
+        """
+        grid = [list(row) for row in grid]
+        return await self._search(
+            "connect_four", connect_four_move, grid, player, level
+        )
+
+    async def chess(self, fen: str, level: str = "medium") -> Optional[str]:
+        """|coro|
+
+        The move to play, in SAN, None if the game is over.
+        """
+        return await self._search("chess", chess_move, fen, level)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "searches": self.searches,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+        }
+
+    def timings(self) -> List[Tuple[str, int, float, float, int, float]]:
+        """Per game (name, searches, avg seconds, max seconds, avg nodes, avg depth)"""
+        return [
+            (
+                name,
+                g.count,
+                g.total / g.count if g.count else 0.0,
+                g.max,
+                g.nodes // g.count if g.count else 0,
+                g.depth / g.count if g.count else 0.0,
+            )
+            for name, g in sorted(self._games.items())
+        ]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter, time
+from typing import Any, Dict, List, Optional
+
+import discord
+
+from utilities.log import get_logger
+
+__all__ = ("GlobalChat",)
+
+log = get_logger(__name__)
+
+
+class WebhookBucket:
+    """Per webhook rate limit, so one busy destination doesn't hit 429s.
+
+    Discord allows 5 webhook executions per 2 seconds on a webhook.
+    """
+
+    __slots__ = ("rate", "per", "_window", "_count", "_lock")
+
+    def __init__(self, rate: int = 5, per: float = 2.0) -> None:
+        self.rate = rate
+        self.per = per
+        self._window = 0.0
+        self._count = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time()
+            if now >= self._window + self.per:
+                self._window = now
+                self._count = 0
+            if self._count >= self.rate:
+                await asyncio.sleep(self._window + self.per - now)
+                self._window = time()
+                self._count = 0
+            self._count += 1
+
+
+class GlobalChatEntry:
+    __slots__ = ("guild_id", "channel_id", "ignore_role", "webhook", "bucket")
+
+    def __init__(self, data: Dict[str, Any], *, session) -> None:
+        self.guild_id: int = data["_id"]
+        self.channel_id: Optional[int] = data.get("channel_id")
+        self.ignore_role: int = data.get("ignore_role") or data.get("ignore-role") or 0
+        url: Optional[str] = data.get("webhook")
+        self.webhook: Optional[discord.Webhook] = (
+            discord.Webhook.from_url(url, session=session) if url else None
+        )
+        self.bucket = WebhookBucket()
+
+
+class GlobalChat:
+    """Registry of the global chat channels and their webhooks, with the
+    broadcaster sending a message to all of them.
+
+    The registry is loaded once and kept in memory. It is refreshed per guild
+    when the global chat config changes, and webhooks that return 404 are
+    dropped from both the registry and the database.
+    """
+
+    def __init__(self, collection, *, session, concurrency: int = 10) -> None:
+        self.collection = collection
+        self.session = session
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.entries: Dict[int, GlobalChatEntry] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        self.broadcasts = 0
+        self.sent = 0
+        self.failures = 0
+        self.removed = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    def __repr__(self) -> str:
+        return f"<GlobalChat entries={len(self.entries)} broadcasts={self.broadcasts}>"
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "webhooks": sum(1 for e in self.entries.values() if e.webhook),
+            "broadcasts": self.broadcasts,
+            "sent": self.sent,
+            "failures": self.failures,
+            "removed": self.removed,
+            "last_latency": round(self.last_latency, 3),
+            "avg_latency": round(self._total_latency / self.broadcasts, 3)
+            if self.broadcasts
+            else 0.0,
+            "max_latency": round(self.max_latency, 3),
+        }
+
+    async def load(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+            entries = {}
+            async for data in self.collection.find({}):
+                entries[data["_id"]] = GlobalChatEntry(data, session=self.session)
+            self.entries = entries
+            self._loaded = True
+
+    async def get(self, guild_id: int) -> Optional[GlobalChatEntry]:
+        if not self._loaded:
+            await self.load()
+        return self.entries.get(guild_id)
+
+    async def refresh(self, guild_id: int) -> None:
+        """To be called after the global chat config of the guild changed"""
+        if not self._loaded:
+            return
+        if data := await self.collection.find_one({"_id": guild_id}):
+            self.entries[guild_id] = GlobalChatEntry(data, session=self.session)
+        else:
+            self.entries.pop(guild_id, None)
+
+    def forget(self, guild_id: int) -> None:
+        self.entries.pop(guild_id, None)
+
+    async def _send(self, entry: GlobalChatEntry, **kwargs: Any) -> None:
+        webhook = entry.webhook
+        if webhook is None:
+            return
+        await entry.bucket.acquire()
+        async with self.semaphore:
+            try:
+                await webhook.send(**kwargs)
+            except discord.NotFound:
+                # webhook (or the channel) was deleted
+                self.removed += 1
+                entry.webhook = None
+                await self.collection.update_one(
+                    {"_id": entry.guild_id}, {"$set": {"webhook": None}}
+                )
+            except discord.HTTPException as e:
+                self.failures += 1
+                log.debug("global chat send to %s failed: %s", entry.guild_id, e)
+            else:
+                self.sent += 1
+
+    async def broadcast(self, **kwargs: Any) -> None:
+        """Send to every connected channel. Accepts the kwargs of `Webhook.send`"""
+        if not self._loaded:
+            await self.load()
+
+        ini = perf_counter()
+        entries: List[GlobalChatEntry] = list(self.entries.values())
+        results = await asyncio.gather(
+            *(self._send(entry, **kwargs) for entry in entries), return_exceptions=True
+        )
+        for entry, result in zip(entries, results):
+            # e.g. a timeout, one channel must not fail the others or the caller
+            if isinstance(result, Exception):
+                self.failures += 1
+                log.warning("global chat send to %s failed: %r", entry.guild_id, result)
+        elapsed = perf_counter() - ini
+
+        self.broadcasts += 1
+        self.last_latency = elapsed
+        self._total_latency += elapsed
+        self.max_latency = max(self.max_latency, elapsed)
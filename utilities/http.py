@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import bisect
+import json
+import socket
+from collections import OrderedDict
+from time import perf_counter, time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp import AsyncResolver, ClientSession, ClientTimeout, TCPConnector
+from multidict import CIMultiDict
+from yarl import URL
+
+from utilities.log import get_logger
+
+__all__ = ("HTTPClient", "BUCKETS")
+
+log = get_logger(__name__)
+
+# upper bounds of the latency histogram buckets, in seconds
+BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf"))
+MAX_ENDPOINTS = 256
+
+
+class _Endpoint:
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets: List[int] = [0] * len(BUCKETS)
+
+    def record(self, elapsed: float, *, error: bool) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.errors += error
+        self.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+
+class _CacheEntry:
+    __slots__ = ("body", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        body: bytes,
+        expires_at: float,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        self.body = body
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class _Request:
+    """Awaitable and async context manager, like the one `ClientSession.get`
+    returns, timing the request on its way.
+    """
+
+    __slots__ = ("client", "method", "url", "kwargs", "_response")
+
+    def __init__(
+        self, client: HTTPClient, method: str, url: Any, kwargs: Dict[str, Any]
+    ) -> None:
+        self.client = client
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        self._response: Optional[aiohttp.ClientResponse] = None
+
+    def __await__(self):
+        return self._send().__await__()
+
+    async def _send(self) -> aiohttp.ClientResponse:
+        ini = perf_counter()
+        error = True
+        try:
+            response = await self.client.session.request(
+                self.method, self.url, **self.kwargs
+            )
+            error = response.status >= 400
+            return response
+        finally:
+            elapsed = perf_counter() - ini
+            self.client._record(self.method, self.url, elapsed, error=error)
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._response = await self._send()
+        return self._response
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._response is not None:
+            self._response.release()
+
+
+class HTTPClient:
+    """The one HTTP client of the bot, to be used by every cog.
+
+    Connections are pooled and kept alive, with at most ``limit_per_host``
+    concurrent connections to the same host and DNS answers cached.
+    ``get``, ``post`` and friends take the same arguments as the
+    :class:`aiohttp.ClientSession` methods and can be awaited or used with
+    ``async with``. Every request is timed, per ``METHOD host/path``.
+
+    :meth:`fetch` is the cached flavour of ``GET``: the body is kept for
+    ``ttl`` seconds, then revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` when the server gave an ETag or a Last-Modified.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        timeout: float = 30.0,
+        cache_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.session = ClientSession(
+            connector=TCPConnector(
+                resolver=AsyncResolver(),
+                family=socket.AF_INET,
+                limit=limit,
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=300,
+            ),
+            timeout=ClientTimeout(total=timeout),
+        )
+        self.cache_bytes = cache_bytes
+
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._cached_bytes = 0
+        self._endpoints: Dict[str, _Endpoint] = {}
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.revalidated = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<HTTPClient endpoints={len(self._endpoints)} cached={len(self._cache)}>"
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self.session.closed
+
+    async def close(self) -> None:
+        await self.session.close()
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> _Request:
+        return _Request(self, method.upper(), url, kwargs)
+
+    def get(self, url: Any, **kwargs: Any) -> _Request:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> _Request:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Any, **kwargs: Any) -> _Request:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: Any, **kwargs: Any) -> _Request:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: Any, **kwargs: Any) -> _Request:
+        return self.request("DELETE", url, **kwargs)
+
+    def _record(self, method: str, url: Any, elapsed: float, *, error: bool) -> None:
+        parts = urlsplit(str(url))
+        key = f"{method} {parts.netloc}{parts.path}"
+        try:
+            endpoint = self._endpoints[key]
+        except KeyError:
+            if len(self._endpoints) >= MAX_ENDPOINTS:
+                # paths with ids in them would grow this without bound
+                key = f"{method} {parts.netloc}/*"
+            endpoint = self._endpoints.setdefault(key, _Endpoint())
+        endpoint.record(elapsed, error=error)
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        ttl: float = 60.0,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        as_json: bool = True,
+    ) -> Any:
+        """|coro|
+
+        Cached ``GET``. Returns the decoded JSON (or the raw bytes when
+        ``as_json`` is False), raises :class:`aiohttp.ClientResponseError`
+        on error statuses.
+        """
+        key = str(URL(url).update_query(params) if params else URL(url))
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires_at > time():
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+            return self._decode(entry.body, as_json)
+
+        self.cache_misses += 1
+        request_headers = CIMultiDict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        async with self.get(url, params=params, headers=request_headers) as response:
+            if response.status == 304 and entry is not None:
+                self.revalidated += 1
+                entry.expires_at = time() + ttl
+                self._store(key, entry)
+                return self._decode(entry.body, as_json)
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        self._store(key, _CacheEntry(body, time() + ttl, etag, last_modified))
+        return self._decode(body, as_json)
+
+    @staticmethod
+    def _decode(body: bytes, as_json: bool) -> Any:
+        # decoded on every call, callers are free to mutate what they get
+        return json.loads(body) if as_json else body
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        if len(entry.body) > self.cache_bytes:
+            return
+        if old := self._cache.pop(key, None):
+            self._cached_bytes -= len(old.body)
+        self._cache[key] = entry
+        self._cached_bytes += len(entry.body)
+        while self._cached_bytes > self.cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted.body)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "endpoints": len(self._endpoints),
+            "requests": sum(e.count for e in self._endpoints.values()),
+            "errors": sum(e.errors for e in self._endpoints.values()),
+            "cached": len(self._cache),
+            "cached_bytes": self._cached_bytes,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "revalidated": self.revalidated,
+        }
+
+    def histograms(self, top: int = 10) -> List[Tuple[str, int, float, List[int]]]:
+        """The busiest endpoints as (endpoint, requests, avg seconds, buckets)"""
+        endpoints = sorted(
+            self._endpoints.items(), key=lambda kv: kv[1].count, reverse=True
+        )
+        return [
+            (key, e.count, e.total / e.count if e.count else 0.0, list(e.buckets))
+            for key, e in endpoints[:top]
+        ]
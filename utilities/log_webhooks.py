@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import discord
+from pymongo.errors import PyMongoError
+
+from utilities.globalchat import WebhookBucket
+from utilities.log import get_logger
+
+__all__ = ("LogWebhook", "LogWebhooks")
+
+log = get_logger(__name__)
+
+MAX_CONTENT = 2000
+MAX_FILES = 10
+MAX_EMBEDS = 10
+# characters of all the embeds of a message together
+MAX_EMBED_CHARS = 6000
+
+
+class _Entry:
+    __slots__ = ("content", "files", "embeds", "kwargs")
+
+    def __init__(
+        self,
+        content: Optional[str],
+        files: List[discord.File],
+        embeds: List[discord.Embed],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.content = content or ""
+        self.files = files
+        self.embeds = embeds
+        self.kwargs = kwargs
+
+
+class LogWebhook:
+    """A logging destination. ``send`` only queues the entry, a worker drains
+    the queue within the webhook rate limit and merges the entries that are
+    waiting into as few messages as Discord allows.
+    """
+
+    def __init__(
+        self, registry: LogWebhooks, guild_id: int, url: str, webhook: discord.Webhook
+    ) -> None:
+        self.registry = registry
+        self.guild_id = guild_id
+        self.url = url
+        self.webhook = webhook
+        self.bucket = WebhookBucket()
+        self._queue: Deque[_Entry] = deque()
+        self._worker: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<LogWebhook guild_id={self.guild_id} queued={len(self._queue)}>"
+
+    async def send(
+        self,
+        content: Optional[str] = None,
+        *,
+        file: Optional[discord.File] = None,
+        files: Optional[List[discord.File]] = None,
+        embed: Optional[discord.Embed] = None,
+        embeds: Optional[List[discord.Embed]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Queue a log entry. Accepts the kwargs of `Webhook.send`"""
+        registry = self.registry
+        if len(self._queue) >= registry.max_queue:
+            self._queue.popleft()
+            registry.dropped += 1
+        files = ([file] if file else []) + list(files or [])
+        embeds = ([embed] if embed else []) + list(embeds or [])
+        self._queue.append(_Entry(content, files, embeds, kwargs))
+        registry.queued += 1
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_event_loop().create_task(self._drain())
+
+    def _next_batch(self) -> List[_Entry]:
+        first = self._queue.popleft()
+        batch = [first]
+        length, n_files, n_embeds = len(first.content), len(first.files), len(first.embeds)
+        embed_chars = sum(len(embed) for embed in first.embeds)
+        while self._queue:
+            entry = self._queue[0]
+            if entry.kwargs != first.kwargs:
+                break
+            length += len(entry.content) + 1
+            n_files += len(entry.files)
+            n_embeds += len(entry.embeds)
+            embed_chars += sum(len(embed) for embed in entry.embeds)
+            if (
+                length > MAX_CONTENT
+                or n_files > MAX_FILES
+                or n_embeds > MAX_EMBEDS
+                or embed_chars > MAX_EMBED_CHARS
+            ):
+                break
+            batch.append(self._queue.popleft())
+        return batch
+
+    async def _drain(self) -> None:
+        registry = self.registry
+        while self._queue:
+            # entries keep piling up while we wait for the rate limit
+            await self.bucket.acquire()
+            if not self._queue:
+                return
+            batch = self._next_batch()
+            content = "\n".join(entry.content for entry in batch if entry.content)
+            kwargs = dict(batch[0].kwargs)
+            if files := [f for entry in batch for f in entry.files]:
+                kwargs["files"] = files
+            if embeds := [e for entry in batch for e in entry.embeds]:
+                kwargs["embeds"] = embeds
+            try:
+                await self.webhook.send(content=content or None, **kwargs)
+            except discord.NotFound:
+                # webhook (or the channel) was deleted
+                self._queue.clear()
+                await registry.remove(self.guild_id, self.url)
+                return
+            except discord.HTTPException as e:
+                registry.failures += 1
+                log.debug("log webhook of %s failed: %s", self.guild_id, e)
+            except Exception:
+                # e.g. a network error, the worker must outlive it
+                registry.failures += 1
+                log.exception("log webhook of %s failed", self.guild_id)
+            else:
+                registry.sends += 1
+                registry.coalesced += len(batch) - 1
+
+
+class LogWebhooks:
+    """Registry of the logging webhooks of the guilds (`logging` collection).
+
+    The event -> webhook map of a guild is loaded once and kept in memory,
+    events sharing a webhook URL share one :class:`LogWebhook`, so bursts of
+    different events to the same channel are merged too. The map is
+    invalidated when the logging config of the guild changes, and webhooks
+    that return 404 are removed from the map and the database.
+    """
+
+    def __init__(self, collection, *, session, max_queue: int = 500) -> None:
+        self.collection = collection
+        self.session = session
+        self.max_queue = max_queue
+        self._guilds: Dict[int, Dict[str, LogWebhook]] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+        self.queued = 0
+        self.sends = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.failures = 0
+        self.removed = 0
+
+    def __repr__(self) -> str:
+        return f"<LogWebhooks guilds={len(self._guilds)} sends={self.sends}>"
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "guilds": len(self._guilds),
+            "queued": self.queued,
+            "sends": self.sends,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "removed": self.removed,
+        }
+
+    async def _load(self, guild_id: int) -> Dict[str, LogWebhook]:
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            if guild_id in self._guilds:
+                return self._guilds[guild_id]
+            data = await self.collection.find_one({"_id": guild_id}) or {}
+            by_url: Dict[str, LogWebhook] = {}
+            events: Dict[str, LogWebhook] = {}
+            for event, url in data.items():
+                if event == "_id" or not isinstance(url, str):
+                    continue
+                if url not in by_url:
+                    webhook = discord.Webhook.from_url(url, session=self.session)
+                    by_url[url] = LogWebhook(self, guild_id, url, webhook)
+                events[event] = by_url[url]
+            self._guilds[guild_id] = events
+        self._locks.pop(guild_id, None)
+        return events
+
+    async def get(self, guild_id: Optional[int], event: str) -> Optional[LogWebhook]:
+        """The webhook the event is logged to, None if the event is not logged"""
+        if guild_id is None:
+            return None
+        try:
+            events = self._guilds[guild_id]
+        except KeyError:
+            events = await self._load(guild_id)
+        return events.get(event)
+
+    def invalidate(self, guild_id: int) -> None:
+        """To be called after the logging config of the guild changed"""
+        self._guilds.pop(guild_id, None)
+
+    forget = invalidate
+
+    async def remove(self, guild_id: int, url: str) -> None:
+        """|coro|
+
+        Unregister every event logged to a deleted webhook.
+        """
+        events = self._guilds.get(guild_id, {})
+        for event in [event for event, hook in events.items() if hook.url == url]:
+            del events[event]
+        self.removed += 1
+        try:
+            data = await self.collection.find_one({"_id": guild_id}) or {}
+            dead = [event for event, value in data.items() if value == url]
+            if not dead:
+                return
+            await self.collection.update_one(
+                {"_id": guild_id}, {"$unset": {event: "" for event in dead}}
+            )
+        except PyMongoError as e:
+            log.warning("failed to unset dead log webhook of %s: %s", guild_id, e)
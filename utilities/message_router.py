@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import discord
+from pymongo.errors import PyMongoError
+
+from utilities.log import get_logger
+
+__all__ = ("MessageRouter",)
+
+log = get_logger(__name__)
+
+Handler = Callable[[discord.Message], Awaitable[Any]]
+
+
+class _HandlerStats:
+    __slots__ = ("calls", "errors", "total", "max")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total / self.calls * 1000, 3) if self.calls else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class MessageRouter:
+    """Delivers guild messages only to the handlers interested in their channel.
+
+    Games register their channel when they start and unregister it when they
+    end. Features configured per guild, like the counting channel, are bound
+    to a key of the guild config with :meth:`watch_config`: the channels are
+    loaded from the database once, then followed through the config cache,
+    so a config command or a change made by another process moves them.
+
+    A message in a channel nobody registered costs a single dict lookup.
+    Handlers of the same channel run concurrently, in a task of their own,
+    so a slow handler never delays command processing.
+    """
+
+    def __init__(self, config=None) -> None:
+        self.config = config
+        # channel id -> handler name -> handler
+        self._channels: Dict[int, Dict[str, Handler]] = {}
+        self._stats: Dict[str, _HandlerStats] = {}
+
+        # config key -> (handler name, handler)
+        self._watched: Dict[str, Tuple[str, Handler]] = {}
+        # (config key, guild id) -> channel id
+        self._configured: Dict[Tuple[str, int], int] = {}
+        self._started = False
+
+        self.routed = 0
+        self.skipped = 0
+
+        if config is not None:
+            config.add_listener(self._config_changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"<MessageRouter channels={len(self._channels)} "
+            f"routed={self.routed} skipped={self.skipped}>"
+        )
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._channels
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channels": len(self._channels),
+            "configured": len(self._configured),
+            "routed": self.routed,
+            "skipped": self.skipped,
+        }
+
+    def handler_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def register(self, channel_id: int, name: str, handler: Handler) -> None:
+        """Deliver the messages of ``channel_id`` to ``handler``. A channel has
+        at most one handler per name, registering again replaces it."""
+        self._channels.setdefault(channel_id, {})[name] = handler
+        self._stats.setdefault(name, _HandlerStats())
+
+    def unregister(self, channel_id: int, name: str) -> None:
+        handlers = self._channels.get(channel_id)
+        if handlers is None:
+            return
+        handlers.pop(name, None)
+        if not handlers:
+            del self._channels[channel_id]
+
+    def is_registered(self, channel_id: int, name: str) -> bool:
+        return name in self._channels.get(channel_id, ())
+
+    def dispatch(self, message: discord.Message) -> Optional[asyncio.Task]:
+        """Schedule the handlers of the channel of ``message``, if any"""
+        handlers = self._channels.get(message.channel.id)
+        if not handlers:
+            self.skipped += 1
+            return None
+        self.routed += 1
+        return asyncio.create_task(self._run(message, list(handlers.items())))
+
+    async def _run(
+        self, message: discord.Message, handlers: List[Tuple[str, Handler]]
+    ) -> None:
+        if len(handlers) == 1:
+            await self._call(message, *handlers[0])
+        else:
+            await asyncio.gather(
+                *(self._call(message, name, handler) for name, handler in handlers)
+            )
+
+    async def _call(
+        self, message: discord.Message, name: str, handler: Handler
+    ) -> None:
+        stats = self._stats[name]
+        ini = perf_counter()
+        try:
+            await handler(message)
+        except Exception:
+            stats.errors += 1
+            log.exception("message handler %r failed in %s", name, message.channel.id)
+        finally:
+            elapsed = perf_counter() - ini
+            stats.calls += 1
+            stats.total += elapsed
+            if elapsed > stats.max:
+                stats.max = elapsed
+
+    def watch_config(self, key: str, name: str, handler: Handler) -> None:
+        """Route the channel stored under ``key`` in each guild config to
+        ``handler``. The channels are loaded now if the router is started,
+        otherwise when it starts."""
+        self._watched[key] = (name, handler)
+        if self._started:
+            asyncio.create_task(self._load(key))
+
+    def unwatch_config(self, key: str) -> None:
+        if key not in self._watched:
+            return
+        for config_key, guild_id in list(self._configured):
+            if config_key == key:
+                self._set_channel(key, guild_id, None)
+        del self._watched[key]
+
+    async def start(self) -> None:
+        """|coro|
+
+        Load the channels of every watched config key, in one query.
+        """
+        if self._started:
+            return
+        self._started = True
+        await self._load(*self._watched)
+
+    async def _load(self, *keys: str) -> None:
+        if not keys or self.config is None:
+            return
+        query = {"$or": [{key: {"$ne": None}} for key in keys]}
+        projection = {key: 1 for key in keys}
+        try:
+            async for data in self.config.collection.find(query, projection):
+                for key in keys:
+                    self._set_channel(key, data["_id"], data.get(key))
+        except PyMongoError as e:
+            log.warning("could not load the configured channels %s: %s", keys, e)
+
+    def _config_changed(self, guild_id: int, data: Dict[str, Any]) -> None:
+        for key in self._watched:
+            self._set_channel(key, guild_id, data.get(key))
+
+    def _set_channel(self, key: str, guild_id: int, channel_id: Optional[int]) -> None:
+        previous = self._configured.get((key, guild_id))
+        if previous == channel_id:
+            return
+        watched = self._watched.get(key)
+        if previous is not None:
+            del self._configured[(key, guild_id)]
+            if watched is not None:
+                self.unregister(previous, watched[0])
+        if channel_id is not None and watched is not None:
+            self._configured[(key, guild_id)] = channel_id
+            self.register(channel_id, *watched)
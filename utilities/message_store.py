@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import datetime
+import sys
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar, Union
+
+import discord
+
+from utilities.log import get_logger
+
+__all__ = ("BoundedCache", "MessageSnapshot", "SnipeStore")
+
+log = get_logger(__name__)
+
+V = TypeVar("V")
+
+
+class BoundedCache(Generic[V]):
+    """A mapping bounded in size and in age.
+
+    Holds at most ``max_entries`` values, the least recently used being
+    evicted first, and each value for ``ttl`` seconds after it was stored.
+    Expired values are dropped when they are looked up, evicted, or by
+    :meth:`purge`.
+    """
+
+    def __init__(self, *, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (expires at, value)
+        self._data: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} entries={len(self)} "
+            f"max_entries={self.max_entries} ttl={self.ttl}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > monotonic()
+
+    def __getitem__(self, key: Hashable) -> V:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: V) -> None:
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            _, (expires, _) = self._data.popitem(last=False)
+            if expires <= monotonic():
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        try:
+            expires, value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        if expires <= monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        try:
+            expires, value = self._data.pop(key)
+        except KeyError:
+            return default
+        return value if expires > monotonic() else default
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge(self) -> int:
+        """Drop every expired value, returns how many were"""
+        now = monotonic()
+        expired = [key for key, (expires, _) in self._data.items() if expires <= now]
+        for key in expired:
+            del self._data[key]
+        self.expirations += len(expired)
+        return len(expired)
+
+    def values(self):
+        now = monotonic()
+        return [value for expires, value in self._data.values() if expires > now]
+
+
+class MessageSnapshot:
+    """What the bot shows of a message once it is gone: its author, content,
+    creation time and attachments. Keeps no reference to the message, its
+    member, guild or embeds."""
+
+    __slots__ = (
+        "id",
+        "channel_id",
+        "author_id",
+        "author_name",
+        "author_avatar",
+        "author_colour",
+        "content",
+        "created_at",
+        "attachments",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        channel_id: int,
+        author_id: int,
+        author_name: str,
+        author_avatar: str,
+        author_colour: int,
+        content: str,
+        created_at: datetime.datetime,
+        attachments: Tuple[str, ...] = (),
+    ) -> None:
+        self.id = id
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.author_name = author_name
+        self.author_avatar = author_avatar
+        self.author_colour = author_colour
+        self.content = content
+        self.created_at = created_at
+        self.attachments = attachments
+
+    def __repr__(self) -> str:
+        return f"<MessageSnapshot id={self.id} author_id={self.author_id}>"
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> MessageSnapshot:
+        author = message.author
+        return cls(
+            message.id,
+            message.channel.id,
+            author.id,
+            str(author),
+            author.display_avatar.url,
+            author.colour.value,
+            message.content,
+            message.created_at,
+            tuple(attachment.url for attachment in message.attachments),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.author_name)
+            + sys.getsizeof(self.author_avatar)
+            + sys.getsizeof(self.content)
+            + sys.getsizeof(self.created_at)
+            + sys.getsizeof(self.attachments)
+            + sum(sys.getsizeof(url) for url in self.attachments)
+        )
+
+
+Snipe = Union[MessageSnapshot, Tuple[MessageSnapshot, MessageSnapshot]]
+
+
+class SnipeStore(BoundedCache[Snipe]):
+    """The last deleted message, or edited message as a ``(before, after)``
+    pair, of each channel, as snapshots"""
+
+    def deleted(self, message: discord.Message) -> None:
+        self[message.channel.id] = MessageSnapshot.from_message(message)
+
+    def edited(self, before: discord.Message, after: discord.Message) -> None:
+        self[before.channel.id] = (
+            MessageSnapshot.from_message(before),
+            MessageSnapshot.from_message(after),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        size = sys.getsizeof(self._data)
+        for snipe in self.values():
+            if isinstance(snipe, tuple):
+                size += sys.getsizeof(snipe) + sum(s.nbytes for s in snipe)
+            else:
+                size += snipe.nbytes
+        return size
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats, "bytes": self.nbytes}
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from time import time
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from utilities.log import get_logger
+
+__all__ = ("MediaPrefetcher",)
+
+log = get_logger(__name__)
+
+MAX_BACKOFF = 300.0
+
+
+class _Pool:
+    __slots__ = ("ready", "filler", "backoff", "retry_at", "hits", "misses", "errors")
+
+    def __init__(self) -> None:
+        self.ready: Deque[Tuple[float, str]] = deque()
+        self.filler: Optional[asyncio.Task] = None
+        self.backoff = 0.0
+        self.retry_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+
+class MediaPrefetcher:
+    """Keeps a few results of random-media endpoints ready to be served.
+
+    Each endpoint (URL, params and the JSON field holding the media URL) has
+    its own pool, created on first use. Taking a URL out of a pool schedules
+    a background refill, so the command replies without waiting on the
+    upstream API. When the pool is empty the command fetches directly, as it
+    did before. Upstream errors back the refills off exponentially, up to
+    five minutes. URLs older than ``max_age`` seconds are dropped unused.
+    """
+
+    def __init__(self, http, *, size: int = 5, max_age: float = 3600.0) -> None:
+        self.http = http
+        self.size = size
+        self.max_age = max_age
+        self._pools: Dict[Tuple[str, Tuple[Tuple[str, Any], ...], str], _Pool] = {}
+
+    def __repr__(self) -> str:
+        return f"<MediaPrefetcher pools={len(self._pools)}>"
+
+    async def _fetch(
+        self, url: str, params: Optional[Dict[str, Any]], field: str
+    ) -> Optional[str]:
+        async with self.http.get(url, params=params) as response:
+            if response.status != 200:
+                return None
+            data = await response.json(content_type=None)
+        return data.get(field)
+
+    async def get(
+        self, url: str, *, params: Optional[Dict[str, Any]] = None, field: str = "url"
+    ) -> Optional[str]:
+        """|coro|
+
+        A random media URL of the endpoint, None if the API failed.
+        """
+        key = (url, tuple(sorted((params or {}).items())), field)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _Pool()
+
+        media = None
+        expired = time() - self.max_age
+        while pool.ready:
+            fetched_at, candidate = pool.ready.popleft()
+            if fetched_at >= expired:
+                media = candidate
+                break
+
+        if media is not None:
+            pool.hits += 1
+        else:
+            pool.misses += 1
+            try:
+                media = await self._fetch(url, params, field)
+            except Exception as e:
+                log.debug("fetching %s failed: %s", url, e)
+                media = None
+
+        self._refill(key, pool)
+        return media
+
+    def _refill(self, key, pool: _Pool) -> None:
+        if pool.filler is not None and not pool.filler.done():
+            return
+        if len(pool.ready) >= self.size:
+            return
+        pool.filler = asyncio.get_event_loop().create_task(self._fill(key, pool))
+
+    async def _fill(self, key, pool: _Pool) -> None:
+        url, params, field = key
+        params = dict(params) or None
+        while len(pool.ready) < self.size:
+            delay = pool.retry_at - time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                media = await self._fetch(url, params, field)
+            except Exception as e:
+                log.debug("prefetching %s failed: %s", url, e)
+                media = None
+            if media is None:
+                pool.errors += 1
+                pool.backoff = min(max(pool.backoff * 2, 1.0), MAX_BACKOFF)
+                pool.retry_at = time() + pool.backoff
+                continue
+            pool.backoff = 0.0
+            pool.ready.append((time(), media))
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            if pool.filler is not None:
+                pool.filler.cancel()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        hits = sum(p.hits for p in self._pools.values())
+        misses = sum(p.misses for p in self._pools.values())
+        return {
+            "pools": len(self._pools),
+            "ready": sum(len(p.ready) for p in self._pools.values()),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "errors": sum(p.errors for p in self._pools.values()),
+            "backing_off": sum(1 for p in self._pools.values() if p.retry_at > time()),
+        }
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
-import requests
 from PIL import Image, ImageFont, ImageOps, ImageDraw
+from functools import lru_cache
 from io import BytesIO
 import discord
-from utilities.converters import ToAsync
 
 
-@ToAsync()
-def rank_card(
-    level: int, rank: int, member: discord.Member, *, current_xp: int, custom_background: str, xp_color: str, next_level_xp: int
-):
+async def rank_card(
+    level: int, rank: int, member: discord.Member, *, current_xp: int, custom_background: str, xp_color: str, next_level_xp: int, renderer, asset_cache
+) -> discord.File:
+    avatar = await asset_cache.asset(member.display_avatar) # get avatar picture
+    image = await renderer.render(
+        "rank_card", _draw_rank_card, avatar, member.name, level, rank, current_xp, custom_background, xp_color, next_level_xp
+    )
+    return discord.File(BytesIO(image), filename="image.png")
+
+
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font=r"extra/fonts/Montserrat-Regular.ttf", size=size)
+
+
+def _draw_rank_card(
+    avatar: bytes, name: str, level: int, rank: int, current_xp: int, custom_background: str, xp_color: str, next_level_xp: int
+) -> bytes:
+    # runs in the renderer processes, so only plain data in and out
     # create backdrop
 
     img = Image.new('RGB', (934, 282), color = custom_background)
 
-    response = requests.get(member.display_avatar.url) # get avatar picture
-    img_avatar = Image.open(BytesIO(response.content)).convert("RGBA")
+    img_avatar = Image.open(BytesIO(avatar)).convert("RGBA")
 
     # create circle mask
     bigsize = (img_avatar.size[0] * 3, img_avatar.size[1] * 3)
@@ -43,15 +56,14 @@ def rank_card(
     d.ellipse((x, y, x+h, y+h),fill=fg)
     d.rectangle((x+(h/2), y, x+w+(h/2), y+h),fill=fg)
 
-    font = ImageFont.truetype(font=r"extra/fonts/Montserrat-Regular.ttf", size=40)
-    font2 = ImageFont.truetype(font=r"extra/fonts/Montserrat-Regular.ttf", size=25)
+    font = _font(40)
+    font2 = _font(25)
 
-    d.text((260, 100), member.name, (255, 255, 255), font=font)
+    d.text((260, 100), name, (255, 255, 255), font=font)
     d.text((740, 130), f"{current_xp}/{next_level_xp} XP", (255, 255, 255), font=font2)
     d.text((650, 50), f"LEVEL {level}", xp_color, font=font)
     d.text((260, 50), f"RANK #{rank}", (255,255,255), font=font2)
 
     bufferIO = BytesIO()
     img.save(bufferIO, format="PNG")
-    bufferIO.seek(0)
-    return discord.File(bufferIO, filename="image.png")
+    return bufferIO.getvalue()
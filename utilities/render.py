@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utilities.exceptions import RendererBusy
+from utilities.log import get_logger
+
+__all__ = ("ImageRenderer",)
+
+log = get_logger(__name__)
+
+
+class _Effect:
+    __slots__ = ("count", "errors", "total", "max", "waited")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.waited = 0.0
+
+
+class ImageRenderer:
+    """Runs the image work of the bot in a pool of worker processes.
+
+    ``render`` takes a module level function (so that it can be pickled)
+    and its arguments, which should be plain data: raw image bytes, sizes,
+    colours. The function returns the PNG bytes. Pixel loops then run in
+    parallel and out of the GIL of the gateway.
+
+    At most ``max_pending`` renders are queued or running. Past that,
+    callers wait up to ``queue_timeout`` seconds for a slot, then
+    :class:`RendererBusy` is raised. Time spent waiting and rendering is
+    kept per effect name.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        max_pending: int = 32,
+        queue_timeout: float = 10.0,
+    ) -> None:
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self._effects: Dict[str, _Effect] = {}
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.restarts = 0
+
+    def __repr__(self) -> str:
+        return f"<ImageRenderer workers={self.workers} in_flight={self.in_flight}>"
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # started on first use, workers are forked from the running bot
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    async def render(self, name: str, func: Callable[..., bytes], *args: Any) -> bytes:
+        """|coro|
+
+        Run ``func(*args)`` in a worker process and return its result.
+        """
+        effect = self._effects.get(name)
+        if effect is None:
+            effect = self._effects[name] = _Effect()
+
+        ini = perf_counter()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise RendererBusy() from None
+        finally:
+            self.waiting -= 1
+        effect.waited += perf_counter() - ini
+
+        ini = perf_counter()
+        self.in_flight += 1
+        error = True
+        try:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(self._executor(), func, *args)
+            error = False
+            return result
+        except BrokenProcessPool:
+            # a worker died (killed, out of memory), start over with a new pool
+            log.warning("image renderer pool broke while rendering %s", name)
+            self._restart()
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            elapsed = perf_counter() - ini
+            effect.count += 1
+            effect.errors += error
+            effect.total += elapsed
+            effect.max = max(effect.max, elapsed)
+
+    def _restart(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self.restarts += 1
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rendered": sum(e.count for e in self._effects.values()),
+            "errors": sum(e.errors for e in self._effects.values()),
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+        }
+
+    def timings(self) -> List[Tuple[str, int, float, float, float]]:
+        """Per effect (name, renders, avg seconds, max seconds, avg wait seconds)"""
+        effects = sorted(
+            self._effects.items(), key=lambda kv: kv[1].count, reverse=True
+        )
+        return [
+            (
+                name,
+                e.count,
+                e.total / e.count if e.count else 0.0,
+                e.max,
+                e.waited / e.count if e.count else 0.0,
+            )
+            for name, e in effects
+        ]
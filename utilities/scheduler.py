@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from time import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from pymongo.errors import PyMongoError
+
+from utilities.log import get_logger
+
+__all__ = ("TimerScheduler",)
+
+log = get_logger(__name__)
+
+Dispatcher = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class TimerScheduler:
+    """In-memory scheduler for the timers stored in MongoDB.
+
+    Timers expiring within the next ``window`` seconds are loaded into a heap,
+    and the scheduler sleeps exactly until the earliest deadline. New timers
+    are pushed with :meth:`schedule`, which wakes the scheduler up if the new
+    timer is due before the one it is sleeping for.
+
+    MongoDB stays the durable store: a timer document is only deleted after it
+    has been dispatched, so timers that were due while the bot was offline (or
+    were running when it stopped) fire on the next start. Dispatch happens on
+    at most ``workers`` concurrent tasks, a slow timer does not delay others.
+    """
+
+    def __init__(
+        self,
+        collection,
+        dispatch: Dispatcher,
+        *,
+        window: float = 900.0,
+        workers: int = 16,
+    ) -> None:
+        self.collection = collection
+        self.dispatch = dispatch
+        self.window = window
+
+        self._heap: List[Tuple[float, Any]] = []
+        self._timers: Dict[Any, Dict[str, Any]] = {}
+        self._running: Set[Any] = set()
+        self._loaded_until: float = 0.0
+        self._wakeup = asyncio.Event()
+        self._workers = asyncio.Semaphore(workers)
+        self._task: Optional[asyncio.Task] = None
+
+        self.dispatched = 0
+        self.failed = 0
+        self.max_lateness = 0.0
+
+    def __repr__(self) -> str:
+        return f"<TimerScheduler pending={len(self._timers)} running={len(self._running)}>"
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._timers),
+            "running": len(self._running),
+            "loaded_until": int(self._loaded_until),
+            "dispatched": self.dispatched,
+            "failed": self.failed,
+            "max_lateness": round(self.max_lateness, 3),
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, timer: Dict[str, Any]) -> None:
+        """Add a timer that has just been inserted in the database"""
+        expires_at = timer["expires_at"]
+        if expires_at > self._loaded_until:
+            # will be picked up with the next window
+            return
+        self._push(timer)
+        if self._heap[0][1] == timer["_id"]:
+            self._wakeup.set()
+
+    def cancel(self, _id: Any) -> None:
+        """Forget about a timer that has been deleted from the database"""
+        # the heap entry is skipped once it pops
+        self._timers.pop(_id, None)
+
+    def _push(self, timer: Dict[str, Any]) -> None:
+        _id = timer["_id"]
+        if _id in self._running:
+            return
+        self._timers[_id] = timer
+        heapq.heappush(self._heap, (timer["expires_at"], _id))
+
+    async def _load_window(self) -> None:
+        until = time() + self.window
+        # moved first, so that `schedule` keeps the timers created while the
+        # query runs, the query may or may not see them
+        previous, self._loaded_until = self._loaded_until, until
+        try:
+            async for timer in self.collection.find({"expires_at": {"$lte": until}}):
+                if timer["_id"] not in self._timers:
+                    self._push(timer)
+        except BaseException:
+            self._loaded_until = previous
+            raise
+
+    async def _run(self) -> None:
+        while True:
+            now = time()
+            if now >= self._loaded_until:
+                try:
+                    await self._load_window()
+                except PyMongoError as e:
+                    log.warning("failed to load timers: %s", e)
+                    await asyncio.sleep(5)
+                    continue
+
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, _id = heapq.heappop(self._heap)
+                timer = self._timers.pop(_id, None)
+                if timer is None or timer["expires_at"] != expires_at:
+                    # cancelled, or rescheduled to another time
+                    if timer is not None:
+                        self._timers[_id] = timer
+                    continue
+                self.max_lateness = max(self.max_lateness, now - expires_at)
+                await self._workers.acquire()
+                self._running.add(_id)
+                asyncio.get_event_loop().create_task(self._execute(timer))
+
+            deadline = self._loaded_until
+            if self._heap:
+                deadline = min(deadline, self._heap[0][0])
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(deadline - time(), 0)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _execute(self, timer: Dict[str, Any]) -> None:
+        _id = timer["_id"]
+        try:
+            await self.dispatch(timer)
+        except Exception:
+            self.failed += 1
+            log.exception("timer %s failed", _id)
+        else:
+            self.dispatched += 1
+        finally:
+            self._workers.release()
+            try:
+                await self.collection.delete_one({"_id": _id})
+            except PyMongoError as e:
+                # fires again on next load, it is at-least-once anyway
+                log.warning("failed to delete timer %s: %s", _id, e)
+            self._running.discard(_id)
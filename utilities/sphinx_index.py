@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import re
+import sqlite3
+import zlib
+from time import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+from utilities.log import get_logger
+
+__all__ = ("SphinxIndex", "SphinxObjectFileReader", "parse_inventory")
+
+log = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    project TEXT NOT NULL,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    PRIMARY KEY (project, name)
+) WITHOUT ROWID;
+"""
+
+# This code mostly comes from the Sphinx repository.
+ENTRY_REGEX = re.compile(r"(?x)(.+?)\s+(\S*:\S*)\s+(-?\d+)\s+(\S+)\s+(.*)")
+
+
+class SphinxObjectFileReader:
+    # Inspired by Sphinx's InventoryFileReader
+    BUFSIZE = 16 * 1024
+
+    def __init__(self, buffer):
+        self.stream = io.BytesIO(buffer)
+
+    def readline(self):
+        return self.stream.readline().decode("utf-8")
+
+    def skipline(self):
+        self.stream.readline()
+
+    def read_compressed_chunks(self):
+        decompressor = zlib.decompressobj()
+        while True:
+            chunk = self.stream.read(self.BUFSIZE)
+            if len(chunk) == 0:
+                break
+            yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+
+    def read_compressed_lines(self):
+        buf = b""
+        for chunk in self.read_compressed_chunks():
+            buf += chunk
+            pos = buf.find(b"\n")
+            while pos != -1:
+                yield buf[:pos].decode("utf-8")
+                buf = buf[pos + 1 :]
+                pos = buf.find(b"\n")
+
+
+def parse_inventory(buffer: bytes) -> Dict[str, str]:
+    """Parse an ``objects.inv`` file, to a {name: location} dict
+
+    n.b.: locations are relative to the documentation root, and names don't
+    have `discord` or `discord.ext.commands` namespaces
+    """
+    stream = SphinxObjectFileReader(buffer)
+    result: Dict[str, str] = {}
+
+    # first line is version info
+    inv_version = stream.readline().rstrip()
+
+    if inv_version != "# Sphinx inventory version 2":
+        raise RuntimeError("Invalid objects.inv file version.")
+
+    # next line is "# Project: <name>"
+    # then after that is "# Version: <version>"
+    projname = stream.readline().rstrip()[11:]
+    stream.skipline()
+
+    # next line says if it's a zlib header
+    line = stream.readline()
+    if "zlib" not in line:
+        raise RuntimeError("Invalid objects.inv file, not z-lib compatible.")
+
+    for line in stream.read_compressed_lines():
+        match = ENTRY_REGEX.match(line.rstrip())
+        if not match:
+            continue
+
+        name, directive, _, location, dispname = match.groups()
+        domain, _, subdirective = directive.partition(":")
+        if directive == "py:module" and name in result:
+            # From the Sphinx Repository:
+            # due to a bug in 1.1 and below,
+            # two inventory entries are created
+            # for Python modules, and the first
+            # one is correct
+            continue
+
+        # Most documentation pages have a label
+        if directive == "std:doc":
+            subdirective = "label"
+
+        if location.endswith("$"):
+            location = location[:-1] + name
+
+        key = name if dispname == "-" else dispname
+        prefix = f"{subdirective}:" if domain == "std" else ""
+
+        if projname == "discord.py":
+            key = key.replace("discord.ext.commands.", "").replace("discord.", "")
+
+        result[f"{prefix}{key}"] = location
+
+    return result
+
+
+class _Project:
+    __slots__ = (
+        "url",
+        "etag",
+        "last_modified",
+        "fetched_at",
+        "names",
+        "keys",
+        "locations",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        fetched_at: float,
+        entries: Iterable[Tuple[str, str]],
+    ) -> None:
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        # shorter names first, so that equal scores favour them
+        entries = sorted(entries, key=lambda t: (len(t[0]), t[0]))
+        self.names: List[str] = [name for name, _ in entries]
+        self.locations: List[str] = [location for _, location in entries]
+        # processed once here instead of on every search
+        self.keys: List[str] = [default_process(name) for name in self.names]
+
+
+class SphinxIndex:
+    """Persistent index of the Sphinx inventories (``objects.inv``) of the
+    documentations in `page_types`.
+
+    The inventories are kept in a SQLite file, so a restart serves lookups
+    from disk without touching the network. Stale projects (older than
+    ``max_age`` seconds) are refreshed concurrently in the background, with
+    ``If-None-Match`` / ``If-Modified-Since`` so unchanged inventories are
+    not downloaded again. Disk IO and parsing run in the default executor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        page_types: Dict[str, str],
+        *,
+        http,
+        max_age: float = 86400.0,
+    ) -> None:
+        self.path = path
+        self.page_types = page_types
+        self.http = http
+        self.max_age = max_age
+
+        self._projects: Dict[str, _Project] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._loaded = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.lookups = 0
+        self.refreshes = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        return f"<SphinxIndex projects={len(self._projects)} entries={len(self)}>"
+
+    def __len__(self) -> int:
+        return sum(len(p.names) for p in self._projects.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._projects
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        oldest = min((p.fetched_at for p in self._projects.values()), default=None)
+        return {
+            "projects": len(self._projects),
+            "entries": len(self),
+            "lookups": self.lookups,
+            "refreshes": self.refreshes,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            "oldest": f"{int(time() - oldest)}s" if oldest else None,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _read(self) -> Dict[str, _Project]:
+        if not os.path.exists(self.path):
+            return {}
+        projects = {}
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT key, url, etag, last_modified, fetched_at FROM projects"
+            ).fetchall()
+            for key, url, etag, last_modified, fetched_at in rows:
+                entries = connection.execute(
+                    "SELECT name, location FROM entries WHERE project = ?", (key,)
+                )
+                projects[key] = _Project(url, etag, last_modified, fetched_at, entries)
+        finally:
+            connection.close()
+        return projects
+
+    def _write(self, key: str, project: _Project) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        project.url,
+                        project.etag,
+                        project.last_modified,
+                        project.fetched_at,
+                    ),
+                )
+                connection.execute("DELETE FROM entries WHERE project = ?", (key,))
+                connection.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?)",
+                    ((key, n, loc) for n, loc in zip(project.names, project.locations)),
+                )
+        finally:
+            connection.close()
+
+    def _touch(self, key: str, fetched_at: float) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "UPDATE projects SET fetched_at = ? WHERE key = ?",
+                    (fetched_at, key),
+                )
+        finally:
+            connection.close()
+
+    async def load(self) -> None:
+        """|coro|
+
+        Load the index from disk, projects that were never fetched are left
+        to the refresh.
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            projects = await loop.run_in_executor(None, self._read)
+        except sqlite3.Error as e:
+            log.warning("could not read the sphinx index %s: %s", self.path, e)
+            projects = {}
+        # the documentation root may have been changed meanwhile
+        self._projects = {
+            key: project
+            for key, project in projects.items()
+            if self.page_types.get(key) == project.url
+        }
+        self._loaded.set()
+
+    async def refresh(self, key: str, *, force: bool = False) -> None:
+        """|coro|
+
+        Fetch the inventory of the project if it is stale, or ``force``.
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            url = self.page_types[key]
+            project = self._projects.get(key)
+            if project is not None and project.url != url:
+                project = None
+            if (
+                project is not None
+                and not force
+                and project.fetched_at > time() - self.max_age
+            ):
+                return
+
+            headers = {}
+            if project is not None:
+                if project.etag:
+                    headers["If-None-Match"] = project.etag
+                if project.last_modified:
+                    headers["If-Modified-Since"] = project.last_modified
+
+            loop = asyncio.get_event_loop()
+            async with self.http.get(url + "/objects.inv", headers=headers) as resp:
+                if resp.status == 304 and project is not None:
+                    self.not_modified += 1
+                    project.fetched_at = time()
+                    await loop.run_in_executor(
+                        None, self._touch, key, project.fetched_at
+                    )
+                    return
+                if resp.status != 200:
+                    raise RuntimeError(
+                        "Cannot build rtfm lookup table, try again later."
+                    )
+                buffer = await resp.read()
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+
+            def build() -> _Project:
+                entries = parse_inventory(buffer).items()
+                return _Project(url, etag, last_modified, time(), entries)
+
+            project = await loop.run_in_executor(None, build)
+            self._projects[key] = project
+            self.refreshes += 1
+            try:
+                await loop.run_in_executor(None, self._write, key, project)
+            except sqlite3.Error as e:
+                log.warning("could not persist the sphinx index of %s: %s", key, e)
+
+    async def refresh_all(self, *, force: bool = False) -> None:
+        """|coro|
+
+        Refresh every stale project, concurrently.
+        """
+        keys = list(self.page_types)
+        results = await asyncio.gather(
+            *(self.refresh(key, force=force) for key in keys), return_exceptions=True
+        )
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                self.errors += 1
+                log.warning("refreshing the inventory of %s failed: %s", key, result)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        await self.load()
+        while True:
+            await self.refresh_all()
+            await asyncio.sleep(self.max_age)
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def search(
+        self, key: str, query: str, *, limit: int = 8, score_cutoff: float = 75.0
+    ) -> List[Tuple[str, str]]:
+        """|coro|
+
+        The best matching (name, url) pairs of the project, best first.
+        Only waits on the network if the project was never fetched. Starts
+        the index if nothing did yet, e.g. the cog was loaded after ready.
+        """
+        if not self._loaded.is_set():
+            self.start()
+        await self._loaded.wait()
+        if key not in self._projects:
+            await self.refresh(key)
+        project = self._projects[key]
+        self.lookups += 1
+
+        matches = process.extract(
+            default_process(query),
+            project.keys,
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            limit=limit,
+            score_cutoff=score_cutoff,
+        )
+        return [
+            (project.names[i], os.path.join(project.url, project.locations[i]))
+            for _, _, i in matches
+        ]
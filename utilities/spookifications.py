@@ -3,6 +3,8 @@ from random import choice, randint
 
 from PIL import Image, ImageOps
 
+from utilities.asset_cache import load_image
+
 
 def inversion(im: Image) -> Image:
     """
@@ -18,7 +20,7 @@ def pentagram(im: Image) -> Image:
     """Adds pentagram to the image."""
     im = im.convert("RGB")
     wt, ht = im.size
-    penta = Image.open("extra/halloween/bloody-pentagram.png")
+    penta = load_image("extra/halloween/bloody-pentagram.png")
     penta = penta.resize((wt, ht))
     im.paste(penta, (0, 0), penta)
     return im
@@ -32,7 +34,7 @@ def bat(im: Image) -> Image:
     """
     im = im.convert("RGB")
     wt, ht = im.size
-    bat = Image.open("extra/halloween/bat-clipart.png")
+    bat = load_image("extra/halloween/bat-clipart.png")
     bat_size = randint(wt // 10, wt // 7)
     rot = randint(0, 90)
     bat = bat.resize((bat_size, bat_size))
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import discord
+
+from utilities.log import get_logger
+
+__all__ = ("MessageWaiters",)
+
+log = get_logger(__name__)
+
+Check = Callable[[discord.Message], bool]
+Key = Tuple[int, Optional[int]]
+Target = Union[discord.abc.Snowflake, int]
+
+
+def _id(obj: Target) -> int:
+    return obj if isinstance(obj, int) else obj.id
+
+
+class _Waiter:
+    __slots__ = ("keys", "check", "future")
+
+    def __init__(self, keys: List[Key], check: Optional[Check], future) -> None:
+        self.keys = keys
+        self.check = check
+        self.future = future
+
+
+class MessageWaiters:
+    """``wait_for("message")`` with the waiters indexed by channel and author.
+
+    The library evaluates the check of every pending ``wait_for`` against
+    every message. Here a waiter is stored under ``(channel id, author id)``,
+    or ``(channel id, None)`` when any author will do, so a message only
+    looks up its two keys and runs the checks of the waiters found there.
+    The check, if any, is applied on top of the channel and author filter.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: Dict[Key, List[_Waiter]] = {}
+
+        self.waits = 0
+        self.resolved = 0
+        self.timeouts = 0
+        self.checks = 0
+
+    def __repr__(self) -> str:
+        return f"<MessageWaiters keys={len(self._waiters)} waiting={self.waiting}>"
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._waiters),
+            "waiting": self.waiting,
+            "waits": self.waits,
+            "resolved": self.resolved,
+            "timeouts": self.timeouts,
+            "checks": self.checks,
+        }
+
+    async def wait(
+        self,
+        channel: Union[Target, Iterable[Target]],
+        *,
+        author: Optional[Target] = None,
+        check: Optional[Check] = None,
+        timeout: Optional[float] = None,
+    ) -> discord.Message:
+        """|coro|
+
+        Wait for the next message sent in ``channel``, or in any of the
+        channels if an iterable is given, optionally by ``author`` and
+        passing ``check``. Raises :class:`asyncio.TimeoutError` like
+        ``wait_for``, and whatever the check raises.
+        """
+        channels = (
+            channel
+            if isinstance(channel, (list, tuple, set, frozenset))
+            else (channel,)
+        )
+        author_id = None if author is None else _id(author)
+        keys = [(_id(c), author_id) for c in channels]
+
+        future = asyncio.get_event_loop().create_future()
+        waiter = _Waiter(keys, check, future)
+        for key in keys:
+            self._waiters.setdefault(key, []).append(waiter)
+        self.waits += 1
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self._remove(waiter)
+
+    def _remove(self, waiter: _Waiter) -> None:
+        for key in waiter.keys:
+            waiters = self._waiters.get(key)
+            if waiters is None:
+                continue
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiters:
+                del self._waiters[key]
+
+    def dispatch(self, message: discord.Message) -> None:
+        """Resolve the waiters of ``message``. Called for every message."""
+        if not self._waiters:
+            return
+        channel_id = message.channel.id
+        self._resolve((channel_id, message.author.id), message)
+        self._resolve((channel_id, None), message)
+
+    def _resolve(self, key: Key, message: discord.Message) -> None:
+        waiters = self._waiters.get(key)
+        if not waiters:
+            return
+        for waiter in tuple(waiters):
+            future = waiter.future
+            if future.done():
+                continue
+            if waiter.check is not None:
+                self.checks += 1
+                try:
+                    result = waiter.check(message)
+                except Exception as e:
+                    future.set_exception(e)
+                    self._remove(waiter)
+                    continue
+                if not result:
+                    continue
+            future.set_result(message)
+            self.resolved += 1
+            self._remove(waiter)
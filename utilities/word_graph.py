@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from array import array
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utilities.log import get_logger
+
+__all__ = ("WordGraph", "get_dictionary", "grid_neighbours")
+
+log = get_logger(__name__)
+
+DICTIONARY_PATH = "extra/boggle.txt"
+CACHE_PATH = "extra/boggle.dawg"
+
+_MAGIC = b"PRTDAWG1"
+_HEADER = struct.Struct("<8sII")
+
+
+class _Node:
+    __slots__ = ("edges", "final")
+
+    def __init__(self) -> None:
+        self.edges: Dict[int, _Node] = {}
+        self.final = False
+
+    def signature(self) -> Tuple[bool, Tuple[Tuple[int, int], ...]]:
+        # children are already unique when this is called
+        return self.final, tuple(
+            (char, id(child)) for char, child in sorted(self.edges.items())
+        )
+
+
+class WordGraph:
+    """A minimal acyclic automaton (DAWG) of an ASCII word list.
+
+    Nodes are integers, the root is ``0``. The outgoing edges of node ``n``
+    are ``edges[offsets[n]:offsets[n + 1]]``, sorted by character, with
+    their characters in ``chars`` and their target nodes in ``targets``.
+    ``final[n]`` is set if the path to ``n`` spells a word.
+
+    Shared suffixes are stored once, so the ~280k words of the Boggle
+    dictionary fit in a few hundred kilobytes instead of a set of strings,
+    and prefixes can be followed one tile at a time by the solvers.
+    """
+
+    ROOT = 0
+
+    __slots__ = ("offsets", "chars", "targets", "final", "words")
+
+    def __init__(
+        self, offsets: array, chars: bytes, targets: array, final: bytes, words: int
+    ) -> None:
+        self.offsets = offsets
+        self.chars = chars
+        self.targets = targets
+        self.final = final
+        self.words = words
+
+    def __repr__(self) -> str:
+        return f"<WordGraph words={self.words} nodes={len(self.final)}>"
+
+    def __len__(self) -> int:
+        return self.words
+
+    def __contains__(self, word: str) -> bool:
+        node = self.walk(word)
+        return node != -1 and bool(self.final[node])
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "words": self.words,
+            "nodes": len(self.final),
+            "edges": len(self.chars),
+            "bytes": self.nbytes,
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.offsets) * self.offsets.itemsize
+            + len(self.chars)
+            + len(self.targets) * self.targets.itemsize
+            + len(self.final)
+        )
+
+    def walk(self, chars: str, node: int = ROOT) -> int:
+        """The node reached by following ``chars`` from ``node``, -1 if there
+        is no such path, i.e. no word starts with them"""
+        try:
+            data = chars.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        offsets, edges = self.offsets, self.chars
+        for char in data:
+            i = edges.find(char, offsets[node], offsets[node + 1])
+            if i == -1:
+                return -1
+            node = self.targets[i]
+        return node
+
+    def is_word(self, node: int) -> bool:
+        return bool(self.final[node])
+
+    @classmethod
+    def build(cls, words: Iterable[str]) -> WordGraph:
+        """Build the minimal graph of ``words``, incrementally (Daciuk et al.),
+        so the full trie never exists in memory"""
+        root = _Node()
+        register: Dict[Tuple[bool, Tuple[Tuple[int, int], ...]], _Node] = {}
+        # (parent, char, child) of the last word, not yet deduplicated
+        unchecked: List[Tuple[_Node, int, _Node]] = []
+
+        def minimize(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                signature = child.signature()
+                if signature in register:
+                    parent.edges[char] = register[signature]
+                else:
+                    register[signature] = child
+
+        previous = b""
+        count = 0
+        for word in sorted({w.encode("ascii") for w in words if w}):
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(common)
+
+            node = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = _Node()
+                node.edges[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.final = True
+            previous = word
+            count += 1
+        minimize(0)
+
+        # number the nodes breadth first, the root being 0
+        ids = {id(root): 0}
+        order = [root]
+        for node in order:
+            for _, child in sorted(node.edges.items()):
+                if id(child) not in ids:
+                    ids[id(child)] = len(order)
+                    order.append(child)
+
+        offsets = array("I", [0])
+        chars = bytearray()
+        targets = array("I")
+        final = bytearray(len(order))
+        for n, node in enumerate(order):
+            for char, child in sorted(node.edges.items()):
+                chars.append(char)
+                targets.append(ids[id(child)])
+            offsets.append(len(chars))
+            final[n] = node.final
+
+        return cls(offsets, bytes(chars), targets, bytes(final), count)
+
+    def dump(self, path: str) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.final), self.words))
+            f.write(self.offsets.tobytes())
+            f.write(self.targets.tobytes())
+            f.write(self.chars)
+            f.write(self.final)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> WordGraph:
+        with open(path, "rb") as f:
+            magic, nodes, words = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a word graph")
+            offsets = array("I")
+            offsets.fromfile(f, nodes + 1)
+            edges = offsets[-1]
+            targets = array("I")
+            targets.fromfile(f, edges)
+            chars = f.read(edges)
+            final = f.read(nodes)
+        if len(chars) != edges or len(final) != nodes:
+            raise ValueError(f"{path} is truncated")
+        return cls(offsets, chars, targets, final, words)
+
+
+_dictionary: Optional[WordGraph] = None
+_dictionary_lock = threading.Lock()
+
+
+def get_dictionary() -> WordGraph:
+    """The Boggle dictionary, loaded on first use.
+
+    Loaded from the cached graph next to the word list, which is rebuilt
+    when missing or older than the list. Blocking: call it from an executor.
+    """
+    global _dictionary
+    if _dictionary is not None:
+        return _dictionary
+
+    with _dictionary_lock:
+        if _dictionary is not None:
+            return _dictionary
+
+        ini = perf_counter()
+        graph = None
+        try:
+            if os.path.getmtime(CACHE_PATH) >= os.path.getmtime(DICTIONARY_PATH):
+                graph = WordGraph.load(CACHE_PATH)
+        except (OSError, ValueError, EOFError) as e:
+            log.debug("boggle dictionary cache unusable: %s", e)
+
+        if graph is None:
+            with open(DICTIONARY_PATH) as f:
+                graph = WordGraph.build(f.read().splitlines())
+            try:
+                graph.dump(CACHE_PATH)
+            except OSError as e:
+                log.warning("could not cache the boggle dictionary: %s", e)
+            log.info(
+                "built the boggle dictionary (%s nodes) in %.2fs",
+                len(graph.final),
+                perf_counter() - ini,
+            )
+
+        _dictionary = graph
+        return graph
+
+
+@lru_cache(maxsize=None)
+def grid_neighbours(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """The adjacent cells (diagonals included) of each cell of a size x size
+    grid, cells being numbered ``col * size + row``"""
+    return tuple(
+        tuple(
+            c * size + r
+            for c in range(max(col - 1, 0), min(col + 2, size))
+            for r in range(max(row - 1, 0), min(row + 2, size))
+            if (c, r) != (col, row)
+        )
+        for col in range(size)
+        for row in range(size)
+    )
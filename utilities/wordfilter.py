@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional
+
+__all__ = ("WordMatcher", "get_matcher", "GLOBAL_CHAT_MATCHER")
+
+
+def _build_trie(words: Iterable[str]) -> Dict[str, dict]:
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of word
+    return trie
+
+
+def _trie_to_pattern(node: Dict[str, dict]) -> Optional[str]:
+    """Turns the trie into a regex where every common prefix is matched once.
+
+    ``{"ass", "asshole", "anus"}`` becomes ``a(?:ss(?:hole)?|nus)``, so the
+    regex engine never tries more than one branch per character.
+    """
+    if "" in node and len(node) == 1:
+        return None
+
+    alternatives = []
+    single_chars = []
+    for char in sorted(k for k in node if k):
+        sub = _trie_to_pattern(node[char])
+        if sub is None:
+            single_chars.append(re.escape(char))
+        else:
+            alternatives.append(re.escape(char) + sub)
+
+    only_chars = not alternatives
+    if single_chars:
+        if len(single_chars) == 1:
+            alternatives.append(single_chars[0])
+        else:
+            alternatives.append(f"[{''.join(single_chars)}]")
+
+    if len(alternatives) == 1:
+        result = alternatives[0]
+    else:
+        result = f"(?:{'|'.join(alternatives)})"
+
+    if "" in node:
+        # the prefix itself is a word, rest is optional
+        if only_chars:
+            result += "?"
+        else:
+            result = f"(?:{result})?"
+    return result
+
+
+class WordMatcher:
+    """Word-boundary aware matcher of many words in a single regex pass.
+
+    A word only matches when it is not glued to other word characters, which
+    also works for words like ``a$$`` that ``\\b`` can not delimit.
+    Matching is case insensitive.
+    """
+
+    __slots__ = ("words", "pattern")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: FrozenSet[str] = frozenset(
+            w.lower() for w in words if w and w.strip()
+        )
+        body = _trie_to_pattern(_build_trie(self.words)) if self.words else None
+        self.pattern: Optional[re.Pattern] = (
+            re.compile(rf"(?<!\w){body}(?!\w)", flags=re.IGNORECASE)
+            if body
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return f"<WordMatcher words={len(self.words)}>"
+
+    def __bool__(self) -> bool:
+        return self.pattern is not None
+
+    def search(self, text: str) -> Optional[str]:
+        """Returns the first word found in the text, if any"""
+        if self.pattern is None:
+            return None
+        match = self.pattern.search(text)
+        return match.group(0) if match else None
+
+    def __contains__(self, text: str) -> bool:
+        return self.search(text) is not None
+
+
+@lru_cache(maxsize=1024)
+def _get_matcher(words: FrozenSet[str]) -> WordMatcher:
+    return WordMatcher(words)
+
+
+def get_matcher(words: Iterable[str]) -> WordMatcher:
+    """Get the matcher of the word list. Matchers are built once per distinct
+    word list, so guilds only pay for a rebuild when their list changes."""
+    return _get_matcher(frozenset(w.lower() for w in words))
+
+
+with open("extra/profanity.json") as f:
+    GLOBAL_CHAT_MATCHER = get_matcher([*json.load(f), "chod"])
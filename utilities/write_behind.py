@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, defaultdict
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from utilities.log import get_logger
+
+__all__ = ("WriteBehind",)
+
+log = get_logger(__name__)
+
+Key = Tuple[str, Any]
+
+
+class WriteBehind:
+    """Coalesces ``$inc`` and ``$addToSet`` updates in memory and writes them
+    in bulk.
+
+    Increments to the same document are summed up, and values added to the
+    same array are collected, until the buffer is flushed: either every
+    ``interval`` seconds, as soon as ``max_keys`` distinct documents are
+    pending, or when the bot closes. Each flush is one unordered
+    ``bulk_write`` per collection.
+    """
+
+    def __init__(self, *, max_keys: int = 1000, interval: float = 10.0) -> None:
+        self.max_keys = max_keys
+        self.interval = interval
+
+        self._pending: Dict[Key, Counter] = {}
+        self._sets: Dict[Key, Dict[str, List[Any]]] = {}
+        self._since: Dict[Key, float] = {}
+        # collection -> _id -> increments of the flush being written
+        self._in_flight: Dict[str, Dict[Any, Counter]] = {}
+        self._collections: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.flushes = 0
+        self.ops_flushed = 0
+        self.errors = 0
+        self.last_flush_size = 0
+        self.max_flush_size = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def __repr__(self) -> str:
+        return f"<WriteBehind pending={len(self)} flushes={self.flushes}>"
+
+    def __len__(self) -> int:
+        return len(self._pending.keys() | self._sets.keys())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self),
+            "flushes": self.flushes,
+            "ops_flushed": self.ops_flushed,
+            "errors": self.errors,
+            "last_flush_size": self.last_flush_size,
+            "max_flush_size": self.max_flush_size,
+            "last_lag": round(self.last_lag, 3),
+            "max_lag": round(self.max_lag, 3),
+        }
+
+    def _key(self, collection, _id: Any) -> Key:
+        key = (collection.full_name, _id)
+        self._collections[key[0]] = collection
+        self._since.setdefault(key, time())
+        return key
+
+    def _maybe_flush(self) -> None:
+        if len(self) >= self.max_keys and not self._flush_lock.locked():
+            asyncio.get_event_loop().create_task(self.flush())
+
+    def inc(self, collection, _id: Any, fields: Dict[str, int]) -> None:
+        """Buffer ``{"$inc": fields}`` on the document ``_id`` (upserted)"""
+        key = self._key(collection, _id)
+        try:
+            counter = self._pending[key]
+        except KeyError:
+            counter = self._pending[key] = Counter()
+        counter.update(fields)
+        self._maybe_flush()
+
+    def add_to_set(self, collection, _id: Any, field: str, value: Any) -> None:
+        """Buffer ``{"$addToSet": {field: value}}`` on the existing document ``_id``"""
+        key = self._key(collection, _id)
+        self._sets.setdefault(key, {}).setdefault(field, []).append(value)
+        self._maybe_flush()
+
+    def discard(self, collection, _id: Any) -> None:
+        """Drop what is buffered for a document that is being deleted"""
+        key = (collection.full_name, _id)
+        self._pending.pop(key, None)
+        self._sets.pop(key, None)
+        self._since.pop(key, None)
+
+    def pending(self, collection, _id: Any, field: str) -> int:
+        """The increment of the field not yet written to database, counting
+        the one of a flush in progress"""
+        name = collection.full_name
+        total = 0
+        if counter := self._pending.get((name, _id)):
+            total += counter[field]
+        if counter := self._in_flight.get(name, {}).get(_id):
+            total += counter[field]
+        return total
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._since:
+                return
+            pending, self._pending = self._pending, {}
+            # left over if a previous flush was cancelled
+            self._in_flight = {}
+            sets, self._sets = self._sets, {}
+            since, self._since = self._since, {}
+
+            now = time()
+            lag = now - min(since.values())
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+
+            operations: Dict[str, List[UpdateOne]] = defaultdict(list)
+            for (name, _id), counter in pending.items():
+                operations[name].append(
+                    UpdateOne({"_id": _id}, {"$inc": dict(counter)}, upsert=True)
+                )
+                self._in_flight.setdefault(name, {})[_id] = counter
+            for (name, _id), fields in sets.items():
+                update = {field: {"$each": values} for field, values in fields.items()}
+                operations[name].append(UpdateOne({"_id": _id}, {"$addToSet": update}))
+
+            for name, ops in operations.items():
+                try:
+                    await self._collections[name].bulk_write(ops, ordered=False)
+                except BulkWriteError as e:
+                    # some of the writes went through, retrying would count them twice
+                    self.errors += 1
+                    log.error("partial bulk write on %s: %s", name, e.details)
+                except PyMongoError as e:
+                    self.errors += 1
+                    log.warning("bulk write on %s failed, will retry: %s", name, e)
+                    self._requeue(name, pending, sets, since)
+                    continue
+                finally:
+                    # written, or back in `_pending`
+                    self._in_flight.pop(name, None)
+                self.flushes += 1
+                self.ops_flushed += len(ops)
+                self.last_flush_size = len(ops)
+                self.max_flush_size = max(self.max_flush_size, len(ops))
+
+    def _requeue(
+        self,
+        name: str,
+        pending: Dict[Key, Counter],
+        sets: Dict[Key, Dict[str, List[Any]]],
+        since: Dict[Key, float],
+    ) -> None:
+        for key, counter in pending.items():
+            if key[0] != name:
+                continue
+            if key in self._pending:
+                self._pending[key].update(counter)
+            else:
+                self._pending[key] = counter
+        for key, fields in sets.items():
+            if key[0] != name:
+                continue
+            current = self._sets.setdefault(key, {})
+            for field, values in fields.items():
+                current[field] = values + current.get(field, [])
+        for key, ts in since.items():
+            if key[0] == name:
+                self._since[key] = min(ts, self._since.get(key, ts))
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_event_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import aiohttp
 import urllib.parse
 import json
 
 
 class YoutubeSearch:
-    def __init__(self, search_terms: str, max_results=None):
+    def __init__(self, search_terms: str, max_results=None, *, session):
+        self.session = session
         self.search_terms = search_terms
         self.max_results = max_results
 
@@ -14,16 +14,14 @@ class YoutubeSearch:
         encoded_search = urllib.parse.quote_plus(self.search_terms)
         BASE_URL = "https://youtube.com"
         url = f"{BASE_URL}/results?search_query={encoded_search}"
-        async with aiohttp.ClientSession() as session:
-            response = await session.get(url)
-            if response.status == 200:
-                response = await response.text()
+        response = await self.session.get(url)
+        if response.status == 200:
+            response = await response.text()
 
         while "ytInitialData" not in response:
-            async with aiohttp.ClientSession() as session:
-                response = await session.get(url)
-                if response.status == 200:
-                    response = await response.text()
+            response = await self.session.get(url)
+            if response.status == 200:
+                response = await response.text()
         results = self._parse_html(response)
         if self.max_results is not None and len(results) > self.max_results:
             return results[: self.max_results]